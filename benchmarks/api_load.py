@@ -0,0 +1,459 @@
+"""End-to-end load test of the FastAPI app against stubbed orchestration.
+
+Serves ``create_app()`` over real HTTP from a background thread and drives it
+in steps of increasing webhook rate. Each step runs for ``--duration`` seconds
+and combines three kinds of traffic:
+
+* ``POST /webhooks/chatwoot`` at a fixed (open-loop) rate;
+* ``POST /api/v1/tickets/process`` from ``--process-clients`` closed-loop callers;
+* ``--sse-clients`` subscribers on ``/api/v1/dashboard/events``.
+
+Orchestration is stubbed with record/replay. A synthetic two-stage pipeline
+recording (triage, then a response that sends a reply) is replayed for every
+ticket, paced to take about ``--ticket-seconds``. Context prefetch still runs
+against ``fake_services``, so every ticket also makes its Chatwoot and
+Salesforce calls. The dashboard and job databases are temporary.
+
+Each step reports:
+
+* request throughput, status codes and latency percentiles per endpoint;
+* SSE event rate and delivery lag;
+* event-loop lag of the server loop;
+* SQLite write latency of the dashboard store;
+* process RSS.
+
+The results go to a JSON file tagged with the git commit. ``--compare`` prints
+the headline metrics next to an earlier run.
+
+Usage:
+    python -m benchmarks.api_load                                  # 25,50,100,200 webhooks/s
+    python -m benchmarks.api_load --rates 100,400 --duration 20 --workers 16
+    python -m benchmarks.api_load --downstream-latency-ms 30 --ticket-seconds 2
+    python -m benchmarks.api_load --output load.json --compare load-main.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import resource
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock, ToolUseBlock, UserMessage
+from claude_agent_sdk import ToolResultBlock as SDKToolResultBlock
+
+from fake_services import FakeDataset, FakeServices, FaultConfig
+from sentinelcx import jobs
+from sentinelcx.api.app import create_app
+from sentinelcx.config import OrchestratorSettings, ReplaySettings, SchedulerSettings, Settings
+from sentinelcx.dashboard import event_bus
+from sentinelcx.dashboard.event_bus import EventBus
+from sentinelcx.dashboard.store import DashboardStore
+from sentinelcx.jobs import JobManager, JobStore
+from sentinelcx.replay import encode_message
+
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+_TRIAGE_JSON = (
+    '{"decision": "auto_handle", "category": "billing", "priority": "low", "confidence": 0.9}'
+)
+_STORE_WRITES = ("save_event", "save_ticket", "save_spans")
+_LAG_INTERVAL = 0.01
+
+
+def _rss_kb() -> int:
+    """Resident set size of this process in KiB (Linux /proc)."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _summarize(samples: list[float]) -> dict:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))], 3)
+
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def write_synthetic_recording(directory: Path, ticket_seconds: float) -> None:
+    """Write the pipeline recording replayed for every ticket."""
+
+    def result(text: str) -> ResultMessage:
+        return ResultMessage(
+            subtype="success",
+            duration_ms=int(ticket_seconds * 500),
+            duration_api_ms=int(ticket_seconds * 400),
+            is_error=False,
+            num_turns=2,
+            session_id="load-test",
+            total_cost_usd=0.01,
+            result=text,
+        )
+
+    reply = ToolUseBlock(
+        id="toolu_reply",
+        name="mcp__chatwoot__send_reply",
+        input={"conversation_id": 1, "content": "Thanks, we have refunded the charge."},
+    )
+    runs = [
+        ("triage", 0.3, result(_TRIAGE_JSON)),
+        ("response", 0.2, AssistantMessage(content=[TextBlock("Replying"), reply], model="fake")),
+        ("response", 0.4, UserMessage(content=[SDKToolResultBlock("toolu_reply", "sent")])),
+        ("response", 0.5, result("Replied to the customer")),
+    ]
+    lines = [
+        {"run": run, "offset": round(share * ticket_seconds, 4), "message": encode_message(msg)}
+        for run, share, msg in runs
+    ]
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "template.jsonl").write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+
+class AppServer:
+    """Serves the app from its own event loop thread, like a separate server process."""
+
+    def __init__(self, settings: Settings) -> None:
+        app = create_app()
+        app.state.settings = settings
+        self._server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+        )
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="api-server", daemon=True)
+        self.url = ""
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self._server.serve())
+
+    def start(self, timeout: float = 30.0) -> None:
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("API server failed to start")
+            time.sleep(0.01)
+        port = self._server.servers[0].sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=30.0)
+
+
+class ServerProbes:
+    """Event-loop lag and SQLite write latency measured inside the server."""
+
+    def __init__(self, server: AppServer, store: DashboardStore) -> None:
+        self.loop_lag: list[float] = []
+        self.store_writes: list[float] = []
+        for name in _STORE_WRITES:
+            setattr(store, name, self._timed(getattr(store, name)))
+        self._lag_task = asyncio.run_coroutine_threadsafe(self._watch_loop(), server.loop)
+
+    def _timed(self, method):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.store_writes.append((time.perf_counter() - start) * 1000)
+
+        return timed
+
+    async def _watch_loop(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(_LAG_INTERVAL)
+            self.loop_lag.append((time.perf_counter() - start - _LAG_INTERVAL) * 1000)
+
+    def take(self) -> tuple[list[float], list[float]]:
+        """Samples since the previous call."""
+        lag, self.loop_lag = self.loop_lag, []
+        writes, self.store_writes = self.store_writes, []
+        return lag, writes
+
+    def stop(self) -> None:
+        self._lag_task.cancel()
+
+
+class Endpoint:
+    """Latency and status counts of the requests sent to one endpoint."""
+
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.statuses: dict[str, int] = {}
+        self._first: float | None = None
+        self._last = 0.0
+
+    async def call(self, request) -> None:
+        start = time.perf_counter()
+        if self._first is None:
+            self._first = start
+        try:
+            response = await request
+            status = str(response.status_code)
+        except httpx.HTTPError as exc:
+            status = type(exc).__name__
+        self.latencies.append((time.perf_counter() - start) * 1000)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self._last = time.perf_counter()
+
+    def report(self) -> dict:
+        # Completed requests per second between the first send and the last response
+        span = self._last - self._first if self._first is not None else 0.0
+        return {
+            "requests": len(self.latencies),
+            "per_s": round(len(self.latencies) / span, 1) if span > 0 else 0.0,
+            "statuses": self.statuses,
+            "latency": _summarize(self.latencies),
+        }
+
+
+async def _sse_subscriber(client: httpx.AsyncClient, received: list[float]) -> None:
+    """Record the delivery lag of every event the dashboard stream sends."""
+    async with client.stream("GET", "/api/v1/dashboard/events") as response:
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            timestamp = json.loads(line[6:]).get("timestamp")
+            if isinstance(timestamp, (int, float)):
+                received.append((time.time() - timestamp) * 1000)
+
+
+async def run_step(
+    client: httpx.AsyncClient,
+    probes: ServerProbes,
+    rate: float,
+    args: argparse.Namespace,
+) -> dict:
+    """Drive all three endpoints for one step at ``rate`` webhooks per second."""
+    rng = random.Random(int(rate))
+    webhooks, processes = Endpoint(), Endpoint()
+    sse_lags: list[float] = []
+    sse_tasks = [
+        asyncio.create_task(_sse_subscriber(client, sse_lags)) for _ in range(args.sse_clients)
+    ]
+    probes.take()
+    rss_start = _rss_kb()
+    start = time.perf_counter()
+    deadline = start + args.duration
+
+    def ticket_id() -> str:
+        return str(rng.randint(1, args.tickets))
+
+    async def send_webhooks() -> None:
+        pending = []
+        for i in range(int(rate * args.duration)):
+            await asyncio.sleep(max(0.0, start + i / rate - time.perf_counter()))
+            payload = {
+                "event": "message_created",
+                "message_type": "incoming",
+                "conversation": {"id": int(ticket_id())},
+            }
+            request = client.post("/webhooks/chatwoot", json=payload)
+            pending.append(asyncio.create_task(webhooks.call(request)))
+        await asyncio.gather(*pending)
+
+    async def process_loop() -> None:
+        while time.perf_counter() < deadline:
+            body = {"conversation_id": ticket_id()}
+            await processes.call(client.post("/api/v1/tickets/process", json=body))
+
+    await asyncio.gather(send_webhooks(), *(process_loop() for _ in range(args.process_clients)))
+    elapsed = time.perf_counter() - start
+    for task in sse_tasks:
+        task.cancel()
+    await asyncio.gather(*sse_tasks, return_exceptions=True)
+
+    loop_lag, store_writes = probes.take()
+    queue = (await client.get("/api/v1/tickets/queue")).json()
+    return {
+        "webhook_rate": rate,
+        "elapsed_s": round(elapsed, 2),
+        "webhooks": webhooks.report(),
+        "process": processes.report(),
+        "sse": {
+            "clients": args.sse_clients,
+            "events_per_s": round(len(sse_lags) / elapsed, 1),
+            "delivery_lag": _summarize(sse_lags),
+        },
+        "event_loop_lag": _summarize(loop_lag),
+        "sqlite_writes": {
+            "per_s": round(len(store_writes) / elapsed, 1),
+            "latency": _summarize(store_writes),
+        },
+        "scheduler": queue,
+        "rss_mb": {"start": round(rss_start / 1024, 1), "end": round(_rss_kb() / 1024, 1)},
+    }
+
+
+def _headline(step: dict) -> dict:
+    return {
+        "webhook p95 ms": step["webhooks"]["latency"].get("p95_ms"),
+        "webhooks/s": step["webhooks"]["per_s"],
+        "process p95 ms": step["process"]["latency"].get("p95_ms"),
+        "loop lag p99 ms": step["event_loop_lag"].get("p99_ms"),
+        "sqlite p99 ms": step["sqlite_writes"]["latency"].get("p99_ms"),
+        "rss mb": step["rss_mb"]["end"],
+    }
+
+
+def print_comparison(baseline: dict, report: dict) -> None:
+    """Headline metrics per step, baseline → current."""
+    before = {step["webhook_rate"]: step for step in baseline["steps"]}
+    print(f"\nvs {baseline.get('commit') or 'baseline'} → {report.get('commit') or 'current'}")
+    for step in report["steps"]:
+        old = before.get(step["webhook_rate"])
+        if old is None:
+            continue
+        print(f"  {step['webhook_rate']:g} webhooks/s")
+        old_values = _headline(old)
+        for name, value in _headline(step).items():
+            print(f"    {name:<16} {old_values[name]!s:>10} → {value!s:>10}")
+
+
+async def run(args: argparse.Namespace, tmp: Path) -> dict:
+    faults = FaultConfig(
+        latency_ms=args.downstream_latency_ms,
+        error_rate=args.downstream_error_rate,
+        seed=0,
+    )
+    fakes = FakeServices(
+        FakeDataset.generate(args.tickets),
+        {service: faults for service in ("chatwoot", "salesforce", "slack")},
+    )
+    fakes.start()
+
+    recordings = tmp / "recordings"
+    write_synthetic_recording(recordings, args.ticket_seconds)
+    settings = fakes.settings(
+        Settings(
+            scheduler=SchedulerSettings(workers=args.workers, max_queue_size=args.max_queue),
+            orchestrator=OrchestratorSettings(mode="pipeline", prefetch_context=True),
+            replay=ReplaySettings(
+                mode="replay",
+                directory=str(recordings),
+                speed=1.0 if args.ticket_seconds else 0.0,
+                cycle=True,
+                prefetch=True,
+            ),
+        )
+    )
+    store = DashboardStore(tmp / "dashboard.db")
+    event_bus._bus = EventBus(store=store)
+    jobs._manager = JobManager(settings, store=JobStore(tmp / "jobs.db"))
+
+    server = AppServer(settings)
+    server.start()
+    probes = ServerProbes(server, store)
+    limits = httpx.Limits(max_connections=2000, max_keepalive_connections=200)
+    try:
+        async with httpx.AsyncClient(
+            base_url=server.url, timeout=args.timeout, limits=limits
+        ) as client:
+            steps = []
+            for rate in args.rates:
+                step = await run_step(client, probes, rate, args)
+                logger.warning(
+                    "%g webhooks/s: p95 %s ms, loop lag p99 %s ms",
+                    rate,
+                    step["webhooks"]["latency"].get("p95_ms"),
+                    step["event_loop_lag"].get("p99_ms"),
+                )
+                steps.append(step)
+    finally:
+        probes.stop()
+        server.stop()
+        fakes.stop()
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": time.time(),
+        "config": {
+            "duration_s": args.duration,
+            "process_clients": args.process_clients,
+            "sse_clients": args.sse_clients,
+            "workers": args.workers,
+            "max_queue": args.max_queue,
+            "tickets": args.tickets,
+            "ticket_seconds": args.ticket_seconds,
+            "downstream_latency_ms": args.downstream_latency_ms,
+            "downstream_error_rate": args.downstream_error_rate,
+        },
+        "steps": steps,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the FastAPI app end to end")
+    parser.add_argument(
+        "--rates",
+        type=lambda v: [float(r) for r in v.split(",")],
+        default=[25.0, 50.0, 100.0, 200.0],
+        help="Comma-separated webhook rates (per second), one step each",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per step")
+    parser.add_argument("--process-clients", type=int, default=4, help="Concurrent process callers")
+    parser.add_argument("--sse-clients", type=int, default=5, help="Dashboard SSE subscribers")
+    parser.add_argument("--workers", type=int, default=4, help="Scheduler workers")
+    parser.add_argument("--max-queue", type=int, default=100, help="Scheduler queue size")
+    parser.add_argument("--tickets", type=int, default=200, help="Distinct conversations")
+    parser.add_argument(
+        "--ticket-seconds", type=float, default=0.5, help="Replayed run time per ticket"
+    )
+    parser.add_argument("--downstream-latency-ms", type=float, default=0.0)
+    parser.add_argument("--downstream-error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=60.0, help="HTTP client timeout")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Earlier --output file to compare against")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = await run(args, Path(tmp))
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text)
+    if args.compare:
+        print_comparison(json.loads(Path(args.compare).read_text()), report)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
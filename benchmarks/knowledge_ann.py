@@ -0,0 +1,171 @@
+"""Measure recall@k and latency of the knowledge index's nearest-neighbour backends.
+
+Builds every requested backend over the same vectors, then sweeps its search
+parameter (``nprobe`` for ivf, ``ef_search`` for hnsw). Each row reports recall@k
+against exact search, per-query latency and build time. Use the table to pick
+the ``ANN_BACKEND`` / ``ANN_PARAMS`` operating point for a knowledge base size.
+
+By default the vectors are synthetic: unit vectors clustered around random
+topics, at the dimension of ``all-MiniLM-L6-v2``. ``--index`` benchmarks the
+vectors of an existing index instead. Queries are perturbed copies of indexed
+vectors, so every query has close neighbours, as real queries do.
+
+Usage:
+    python -m benchmarks.knowledge_ann                          # 100k synthetic chunks
+    python -m benchmarks.knowledge_ann --chunks 500000 --backends ivf,hnsw
+    python -m benchmarks.knowledge_ann --index .embedding_cache --k 5
+    python -m benchmarks.knowledge_ann --nlist 2048 --nprobe 8,16,32 --output ann.json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from sentinelcx.knowledge.ann import ExactIndex, recall_at_k
+from sentinelcx.knowledge.index import normalize, open_index, write_index
+
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+# Search parameter swept per backend
+_SWEEP = {"exact": None, "ivf": "nprobe", "hnsw": "ef_search"}
+
+
+def _ints(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def synthetic_vectors(count: int, dim: int, topics: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(topics, dim)).astype(np.float32)
+    vectors = np.empty((count, dim), dtype=np.float32)
+    for start in range(0, count, 65536):
+        n = min(65536, count - start)
+        noise = rng.normal(scale=1.0, size=(n, dim)).astype(np.float32)
+        vectors[start : start + n] = centres[rng.integers(topics, size=n)] + noise
+    return normalize(vectors)
+
+
+def make_queries(vectors: np.ndarray, count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed + 1)
+    picked = np.asarray(vectors[rng.choice(len(vectors), count, replace=False)])
+    return normalize(picked + rng.normal(scale=0.02, size=picked.shape).astype(np.float32))
+
+
+def _time_queries(ann, queries: np.ndarray, k: int) -> tuple[list[np.ndarray], list[float]]:
+    """One search call per query, as the MCP tools make them."""
+    ids, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        found, _ = ann.search(query[None, :], k)[0]
+        latencies.append((time.perf_counter() - start) * 1000)
+        ids.append(found)
+    return ids, latencies
+
+
+def _row(backend: str, params: dict, build_s: float, recalls: dict, latencies: list[float]):
+    ordered = sorted(latencies)
+    return {
+        "backend": backend,
+        "params": params,
+        "build_s": round(build_s, 2),
+        **{f"recall@{k}": round(r, 4) for k, r in recalls.items()},
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 3),
+        "qps": round(len(ordered) / (sum(ordered) / 1000), 1),
+    }
+
+
+def bench_backend(
+    backend: str,
+    build_params: dict,
+    sweep: list[int],
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    truth: list[np.ndarray],
+    ks: list[int],
+) -> list[dict]:
+    with tempfile.TemporaryDirectory(prefix="sentinelcx-ann-") as tmp:
+        metadata = [{"text": "", "source_file": "", "heading": ""}] * len(vectors)
+        start = time.perf_counter()
+        write_index(Path(tmp), "benchmark", vectors, metadata, backend, build_params)
+        build_s = time.perf_counter() - start
+        ann = open_index(Path(tmp)).ann
+
+        rows = []
+        knob = _SWEEP[backend]
+        for value in sweep if knob else [None]:
+            if knob:
+                setattr(ann, knob, value)
+            found, latencies = _time_queries(ann, queries, max(ks))
+            recalls = {k: recall_at_k(truth, found, k) for k in ks}
+            rows.append(_row(backend, ann.params, build_s, recalls, latencies))
+        return rows
+
+
+def print_table(rows: list[dict], ks: list[int]) -> None:
+    recalls = [f"recall@{k}" for k in ks]
+    columns = ["backend", "params", *recalls, "p50_ms", "p95_ms", "qps", "build_s"]
+    table = [[json.dumps(r[c]) if c == "params" else str(r[c]) for c in columns] for r in rows]
+    widths = [max(len(c), *(len(line[i]) for line in table)) for i, c in enumerate(columns)]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    for line in table:
+        print("  ".join(v.ljust(w) for v, w in zip(line, widths)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recall and latency of the ANN backends")
+    parser.add_argument("--index", help="Benchmark the vectors of this index directory")
+    parser.add_argument("--chunks", type=int, default=100_000, help="Synthetic vector count")
+    parser.add_argument("--dim", type=int, default=384, help="Synthetic vector dimension")
+    parser.add_argument("--topics", type=int, default=2000, help="Synthetic cluster count")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per setting")
+    parser.add_argument("--k", type=_ints, default=[5, 10], help="Recall cut-offs, e.g. 5,10")
+    parser.add_argument("--backends", default="exact,ivf,hnsw")
+    parser.add_argument("--nlist", type=int, help="IVF lists (default 4 * sqrt(chunks))")
+    parser.add_argument("--nprobe", type=_ints, default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--M", type=int, default=16, help="HNSW graph degree")
+    parser.add_argument("--ef-construction", type=int, default=200)
+    parser.add_argument("--ef-search", type=_ints, default=[16, 32, 64, 128, 256])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    if args.index:
+        vectors = np.asarray(open_index(Path(args.index)).vectors)
+    else:
+        vectors = synthetic_vectors(args.chunks, args.dim, args.topics, args.seed)
+    queries = make_queries(vectors, min(args.queries, len(vectors)), args.seed)
+    truth = [ids for ids, _ in ExactIndex(vectors).search(queries, max(args.k))]
+
+    build_params = {
+        "exact": {},
+        "ivf": {"nlist": args.nlist, "seed": args.seed} if args.nlist else {"seed": args.seed},
+        "hnsw": {"M": args.M, "ef_construction": args.ef_construction, "seed": args.seed},
+    }
+    sweeps = {"exact": [], "ivf": args.nprobe, "hnsw": args.ef_search}
+
+    rows = []
+    for backend in args.backends.split(","):
+        try:
+            rows += bench_backend(
+                backend, build_params[backend], sweeps[backend], vectors, queries, truth, args.k
+            )
+        except ImportError as exc:
+            logger.warning("Skipping %s: %s", backend, exc)
+
+    print(f"{len(vectors)} vectors, dim {vectors.shape[1]}, {len(queries)} queries")
+    print_table(rows, args.k)
+    if args.output:
+        report = {"chunks": len(vectors), "dimension": int(vectors.shape[1]), "results": rows}
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Throughput of query encoding for concurrent searches: per-call vs micro-batched.
+
+``direct`` mirrors the knowledge tools before micro-batching: every search
+encodes its query with its own ``model.encode`` call on a worker thread, so
+concurrent searches run concurrent forward passes. ``batched`` sends the same
+queries through ``EmbeddingBatcher``, which coalesces concurrent calls into one
+batched forward pass. Each concurrency level runs that many callers, each
+encoding ``--requests`` distinct queries back to back.
+
+Usage:
+    python -m benchmarks.knowledge_encode                      # 1, 8 and 32 callers
+    python -m benchmarks.knowledge_encode --concurrency 1,4,16,64 --requests 50
+    python -m benchmarks.knowledge_encode --max-wait-ms 5 --output encode.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import re
+import statistics
+import time
+from pathlib import Path
+
+from sentence_transformers import SentenceTransformer
+
+from sentinelcx.config import KnowledgeBaseSettings
+from sentinelcx.knowledge.batcher import EmbeddingBatcher
+
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _ints(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def load_queries(kb_path: Path, count: int) -> list[str]:
+    """Distinct query-sized sentences taken from the knowledge base."""
+    sentences = []
+    for md_file in sorted(kb_path.rglob("*.md")):
+        for sentence in re.split(r"(?<=[.?!])\s+|\n+", md_file.read_text(encoding="utf-8")):
+            sentence = sentence.strip("#-* ").strip()
+            if 15 <= len(sentence) <= 200:
+                sentences.append(sentence)
+    if not sentences:
+        sentences = ["how do I reset my password", "refund policy for annual plans"]
+    return [f"{sentences[i % len(sentences)]} ({i})" for i in range(count)]
+
+
+async def run_level(encode, callers: int, requests: int, queries: list[str]) -> dict:
+    latencies: list[float] = []
+
+    async def caller(offset: int) -> None:
+        for i in range(requests):
+            query = queries[(offset * requests + i) % len(queries)]
+            start = time.perf_counter()
+            await encode(query)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller(c) for c in range(callers)))
+    elapsed = time.perf_counter() - start
+    ordered = sorted(latencies)
+    return {
+        "callers": callers,
+        "encodes": len(ordered),
+        "per_s": round(len(ordered) / elapsed, 1),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 2),
+    }
+
+
+async def bench(args: argparse.Namespace) -> list[dict]:
+    model = SentenceTransformer(args.model)
+    queries = load_queries(Path(args.knowledge_base), max(args.concurrency) * args.requests)
+
+    def encode_batch(texts: list[str]):
+        return model.encode(texts, convert_to_numpy=True)
+
+    # Warm up so the first measured call does not pay for lazy initialization
+    encode_batch(queries[:8])
+
+    rows = []
+    for callers in args.concurrency:
+
+        async def direct(query: str) -> None:
+            await asyncio.to_thread(encode_batch, [query])
+
+        row = await run_level(direct, callers, args.requests, queries)
+        rows.append({"mode": "direct", **row})
+
+        batcher = EmbeddingBatcher(encode_batch, args.max_batch_size, args.max_wait_ms)
+
+        async def batched(query: str) -> None:
+            await batcher.encode([query])
+
+        row = await run_level(batched, callers, args.requests, queries)
+        rows.append({"mode": "batched", **row, "mean_batch": batcher.stats()["mean_batch_size"]})
+        await batcher.close()
+    return rows
+
+
+def print_table(rows: list[dict]) -> None:
+    direct = {r["callers"]: r["per_s"] for r in rows if r["mode"] == "direct"}
+    print(f"{'callers':>7} {'mode':>8} {'per_s':>8} {'p50_ms':>8} {'p95_ms':>8} {'batch':>6} gain")
+    for r in rows:
+        gain = f"{r['per_s'] / direct[r['callers']]:.2f}x" if r["mode"] == "batched" else ""
+        batch = str(r.get("mean_batch", 1.0))
+        print(
+            f"{r['callers']:>7} {r['mode']:>8} {r['per_s']:>8} {r['p50_ms']:>8} "
+            f"{r['p95_ms']:>8} {batch:>6} {gain}"
+        )
+
+
+def main() -> None:
+    settings = KnowledgeBaseSettings()
+    parser = argparse.ArgumentParser(description="Per-call vs micro-batched query encoding")
+    parser.add_argument("--model", default=settings.embedding_model_name)
+    parser.add_argument("--knowledge-base", default=settings.knowledge_base_path)
+    parser.add_argument("--concurrency", type=_ints, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=30, help="Encodes per caller")
+    parser.add_argument("--max-batch-size", type=int, default=settings.encode_max_batch_size)
+    parser.add_argument("--max-wait-ms", type=float, default=settings.encode_max_wait_ms)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    rows = asyncio.run(bench(args))
+    print_table(rows)
+    if args.output:
+        Path(args.output).write_text(json.dumps(rows, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Benchmark MCP tool-call latency and per-ticket RSS: stdio vs in-process servers.
+
+Stdio mode mirrors what the Agent SDK does per ticket: spawn every server as a
+subprocess and talk JSON-RPC over pipes. In-process mode talks to the same
+FastMCP servers over an in-memory transport inside this process, which is what
+``MCP_TRANSPORT=in_process`` hands to the SDK.
+
+Usage:
+    python -m benchmarks.mcp_transport                     # 50 calls per mode
+    python -m benchmarks.mcp_transport --calls 200
+    python -m benchmarks.mcp_transport --query "refund policy"  # also time KB search
+    python -m benchmarks.mcp_transport --output bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+from sentinelcx.config import Settings
+from sentinelcx.mcp_servers import SERVER_MODULES, build_mcp_env
+
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _rss_kb(pid: int) -> int:
+    """Resident set size of a process in KiB (Linux /proc)."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _child_pids(parent: int) -> list[int]:
+    pids = []
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == parent:
+            pids.append(int(stat.parent.name))
+    return pids
+
+
+def _summarize(samples: list[float]) -> dict:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+    }
+
+
+async def _time_calls(client: Client, calls: int, query: str | None) -> dict:
+    """Time list_tools on every server plus knowledge tool calls where available."""
+    timings: dict[str, list[float]] = {"list_tools": []}
+    tool_names = {t.name for t in await client.list_tools()}
+    plan = [("list_tools", None, None)]
+    if "list_topics" in tool_names:
+        plan.append(("list_topics", "list_topics", {}))
+    if query and "search_knowledge_base" in tool_names:
+        plan.append(("search_knowledge_base", "search_knowledge_base", {"query": query}))
+
+    for _ in range(calls):
+        for label, tool, args in plan:
+            start = time.perf_counter()
+            if tool is None:
+                await client.list_tools()
+            else:
+                await client.call_tool(tool, args)
+            timings.setdefault(label, []).append((time.perf_counter() - start) * 1000)
+    return {label: _summarize(samples) for label, samples in timings.items()}
+
+
+async def bench_stdio(settings: Settings, calls: int, query: str | None) -> dict:
+    """Spawn each server as a stdio subprocess, as one ticket would."""
+    env = {**os.environ, **build_mcp_env(settings)}
+    results: dict = {"servers": {}}
+    clients: list[Client] = []
+    try:
+        for service, module in SERVER_MODULES.items():
+            transport = StdioTransport(sys.executable, ["-m", module], env=env)
+            client = Client(transport)
+            start = time.perf_counter()
+            try:
+                await client.__aenter__()
+            except Exception as exc:
+                results["servers"][service] = {"error": str(exc)}
+                continue
+            clients.append(client)
+            startup_ms = (time.perf_counter() - start) * 1000
+            results["servers"][service] = {
+                "startup_ms": round(startup_ms, 1),
+                "calls": await _time_calls(client, calls, query),
+            }
+        results["per_ticket_rss_mb"] = round(
+            sum(_rss_kb(pid) for pid in _child_pids(os.getpid())) / 1024, 1
+        )
+    finally:
+        for client in clients:
+            await client.__aexit__(None, None, None)
+    return results
+
+
+async def bench_in_process(settings: Settings, calls: int, query: str | None) -> dict:
+    """Serve the same FastMCP servers in-process over an in-memory transport."""
+    rss_before = _rss_kb(os.getpid())
+    from sentinelcx.mcp_servers.in_process import _SERVERS, init_in_process_servers
+
+    start = time.perf_counter()
+    await init_in_process_servers(settings)
+    init_ms = (time.perf_counter() - start) * 1000
+
+    results: dict = {"init_ms": round(init_ms, 1), "servers": {}}
+    for service, mcp in _SERVERS.items():
+        start = time.perf_counter()
+        async with Client(mcp) as client:
+            startup_ms = (time.perf_counter() - start) * 1000
+            results["servers"][service] = {
+                "startup_ms": round(startup_ms, 1),
+                "calls": await _time_calls(client, calls, query),
+            }
+    # Loaded once for the lifetime of the API process and shared by every ticket
+    results["one_time_rss_mb"] = round((_rss_kb(os.getpid()) - rss_before) / 1024, 1)
+    results["per_ticket_rss_mb"] = 0.0
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare stdio and in-process MCP servers")
+    parser.add_argument("--calls", type=int, default=50, help="Calls per tool per mode")
+    parser.add_argument("--query", help="Also benchmark search_knowledge_base with this query")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    settings = Settings()
+    report = {
+        "stdio": await bench_stdio(settings, args.calls, args.query),
+        "in_process": await bench_in_process(settings, args.calls, args.query),
+    }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
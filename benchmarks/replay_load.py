@@ -0,0 +1,107 @@
+"""Load-test ticket processing offline by replaying recorded SDK streams.
+
+Record some tickets first (``REPLAY_MODE=record``, then process tickets as
+usual), then run this against the recordings directory. Every ticket goes
+through ``process_ticket`` with the recorded stream fed back at full speed, so
+the numbers cover event emission, span tracking, the EventBus and the SQLite
+dashboard store, without the Anthropic API or any live service. Synthetic
+ticket ids are mapped onto the recordings, so any number of distinct tickets can
+be processed. The dashboard store is a temporary database.
+
+Usage:
+    python -m benchmarks.replay_load --recordings recordings           # 1000 tickets
+    python -m benchmarks.replay_load --tickets 5000 --concurrency 100
+    python -m benchmarks.replay_load --mode llm --output bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sentinelcx.config import OrchestratorSettings, ReplaySettings, Settings
+from sentinelcx.dashboard import event_bus
+from sentinelcx.dashboard.event_bus import EventBus
+from sentinelcx.dashboard.store import DashboardStore
+from sentinelcx.orchestrator import SentinelCXOrchestrator
+
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _summarize(samples: list[float]) -> dict:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+    }
+
+
+async def run_load(settings: Settings, tickets: int, concurrency: int) -> dict:
+    """Replay ``tickets`` tickets with at most ``concurrency`` in flight."""
+    orchestrator = SentinelCXOrchestrator(settings)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    failures = 0
+
+    async def one(index: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            result = await orchestrator.process_ticket(f"replay-{index}")
+            latencies.append((time.perf_counter() - start) * 1000)
+            if not result.get("success"):
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(tickets)))
+    elapsed = time.perf_counter() - start
+    return {
+        "tickets": tickets,
+        "concurrency": concurrency,
+        "failures": failures,
+        "elapsed_s": round(elapsed, 3),
+        "tickets_per_s": round(tickets / elapsed, 1),
+        "ticket_latency": _summarize(latencies),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay recorded tickets as a load test")
+    parser.add_argument("--recordings", default="recordings", help="Recordings directory")
+    parser.add_argument("--tickets", type=int, default=1000, help="Tickets to process")
+    parser.add_argument("--concurrency", type=int, default=50, help="Tickets in flight")
+    parser.add_argument(
+        "--mode", default="pipeline", help="Orchestrator mode the recordings were made in"
+    )
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    if not any(Path(args.recordings).glob("*.jsonl")):
+        parser.error(f"no recordings in {args.recordings}; record with REPLAY_MODE=record")
+
+    settings = Settings(
+        orchestrator=OrchestratorSettings(mode=args.mode, prefetch_context=False),
+        replay=ReplaySettings(mode="replay", directory=args.recordings, speed=0.0, cycle=True),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        event_bus._bus = EventBus(store=DashboardStore(Path(tmp) / "dashboard.db"))
+        report = await run_load(settings, args.tickets, args.concurrency)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+"""Benchmark per-query startup: one-shot ``query()`` vs pooled persistent sessions.
+
+One-shot mode is what the orchestrator does without ``ORCHESTRATOR_SESSION_POOL``:
+every run starts a Claude Code CLI process (and, with stdio MCP transport, its
+MCP servers). Session mode leases a ``ClaudeSDKClient`` from the session pool,
+so only the first run pays for startup and later runs pay for a ``/clear``.
+
+Both modes run the triage agent's stage options, so the CLI loads the same
+system prompt, tools and MCP servers a pipeline ticket would. This calls the
+real model; keep ``--iterations`` small.
+
+Usage:
+    python -m benchmarks.session_startup                     # 5 runs per mode
+    python -m benchmarks.session_startup --iterations 10
+    python -m benchmarks.session_startup --no-mcp            # CLI startup only
+    python -m benchmarks.session_startup --output bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+from pathlib import Path
+
+from claude_agent_sdk import ClaudeAgentOptions, ResultMessage, query
+
+from sentinelcx.agents.definitions import ALL_AGENTS
+from sentinelcx.config import OrchestratorSettings, Settings
+from sentinelcx.orchestrator import SentinelCXOrchestrator
+from sentinelcx.sessions import ClaudeSessionPool
+
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _summarize(samples: list[float]) -> dict:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 1),
+        "p50_ms": round(ordered[len(ordered) // 2], 1),
+        "max_ms": round(ordered[-1], 1),
+    }
+
+
+async def _drain(stream, start: float) -> tuple[float, float, float]:
+    """Consume one response; return (first message ms, total ms, cost)."""
+    first_ms = None
+    cost = 0.0
+    async for message in stream:
+        if first_ms is None:
+            first_ms = (time.perf_counter() - start) * 1000
+        if isinstance(message, ResultMessage):
+            cost = message.total_cost_usd or 0.0
+    total_ms = (time.perf_counter() - start) * 1000
+    return first_ms if first_ms is not None else total_ms, total_ms, cost
+
+
+async def bench_one_shot(options: ClaudeAgentOptions, prompt: str, iterations: int) -> dict:
+    """Start a fresh CLI process for every run."""
+    first, total, cost = [], [], 0.0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        first_ms, total_ms, run_cost = await _drain(query(prompt=prompt, options=options), start)
+        first.append(first_ms)
+        total.append(total_ms)
+        cost += run_cost
+    return {
+        "first_message": _summarize(first),
+        "total": _summarize(total),
+        "cost_usd": round(cost, 4),
+    }
+
+
+async def bench_session(
+    settings: Settings, options: ClaudeAgentOptions, prompt: str, iterations: int
+) -> dict:
+    """Reuse one pooled session across runs, clearing it in between."""
+    pool = ClaudeSessionPool(settings)
+    first, total, lease, cost = [], [], [], 0.0
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            async with pool.session(options) as client:
+                lease.append((time.perf_counter() - start) * 1000)
+                await client.query(prompt)
+                first_ms, total_ms, run_cost = await _drain(client.receive_response(), start)
+                # Includes the /clear reset on the way out
+            first.append(first_ms)
+            total.append((time.perf_counter() - start) * 1000)
+            cost += run_cost
+    finally:
+        await pool.stop()
+    return {
+        "lease": _summarize(lease),
+        "first_message": _summarize(first),
+        "total_with_reset": _summarize(total),
+        "cost_usd": round(cost, 4),
+        "pool": pool.stats(),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare one-shot query() and pooled sessions")
+    parser.add_argument("--iterations", type=int, default=5, help="Runs per mode")
+    parser.add_argument(
+        "--prompt", default="Reply with the single word OK.", help="Prompt sent on every run"
+    )
+    parser.add_argument("--no-mcp", action="store_true", help="Attach no MCP servers")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    settings = Settings(orchestrator=OrchestratorSettings(session_pool=True))
+    orchestrator = SentinelCXOrchestrator(settings)
+    mcp_configs = {} if args.no_mcp else orchestrator._mcp_configs
+    options = orchestrator._build_stage_options(ALL_AGENTS["triage"], mcp_configs)
+
+    report = {
+        "iterations": args.iterations,
+        "mcp": not args.no_mcp,
+        "one_shot": await bench_one_shot(options, args.prompt, args.iterations),
+        "session": await bench_session(settings, options, args.prompt, args.iterations),
+    }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,12 @@
+"""Local stand-ins for Chatwoot, Salesforce and Slack.
+
+Each fake implements the endpoints the sentinelCX clients call, serves data
+generated by ``seed_data.generator``, and can add latency and fail a share of
+requests. Start them with ``python -m fake_services`` or ``FakeServices``.
+"""
+
+from fake_services.dataset import FakeDataset
+from fake_services.faults import FaultConfig
+from fake_services.server import FakeServices
+
+__all__ = ["FakeDataset", "FakeServices", "FaultConfig"]
@@ -0,0 +1,74 @@
+"""Run the fake services until interrupted.
+
+Usage:
+    python -m fake_services                                   # ports 8801-8803
+    python -m fake_services --tickets 200 --latency-ms 30 --jitter-ms 10
+    python -m fake_services --latency-ms chatwoot=20,salesforce=150 --error-rate slack=0.05
+
+``--latency-ms``, ``--jitter-ms`` and ``--error-rate`` take one value for every
+service or ``service=value`` pairs. The environment variables that point
+sentinelCX at the fakes are printed on startup.
+"""
+
+import argparse
+import logging
+import signal
+import threading
+
+from fake_services.dataset import FakeDataset
+from fake_services.faults import FaultConfig
+from fake_services.server import SERVICES, FakeServices
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _per_service(value: str) -> dict[str, float]:
+    """Parse ``"20"`` or ``"chatwoot=20,salesforce=150"`` into a value per service."""
+    if "=" not in value:
+        return {service: float(value) for service in SERVICES}
+    parsed = {service: 0.0 for service in SERVICES}
+    for pair in value.split(","):
+        service, _, number = pair.partition("=")
+        if service.strip() not in SERVICES:
+            raise argparse.ArgumentTypeError(f"unknown service {service!r}")
+        parsed[service.strip()] = float(number)
+    return parsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run fake Chatwoot, Salesforce and Slack")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=8801, help="chatwoot, +1 sf, +2 slack")
+    parser.add_argument("--tickets", type=int, default=50, help="Conversations to generate")
+    parser.add_argument("--seed", type=int, default=0, help="Dataset and fault random seed")
+    parser.add_argument("--latency-ms", type=_per_service, default=_per_service("0"))
+    parser.add_argument("--jitter-ms", type=_per_service, default=_per_service("0"))
+    parser.add_argument("--error-rate", type=_per_service, default=_per_service("0"))
+    args = parser.parse_args()
+
+    faults = {
+        service: FaultConfig(
+            latency_ms=args.latency_ms[service],
+            jitter_ms=args.jitter_ms[service],
+            error_rate=args.error_rate[service],
+            seed=args.seed,
+        )
+        for service in SERVICES
+    }
+    ports = {service: args.base_port + i for i, service in enumerate(SERVICES)}
+    services = FakeServices(FakeDataset.generate(args.tickets, args.seed), faults, args.host, ports)
+    services.start()
+    logger.info("Fake services running; point sentinelCX at them with:")
+    for key, value in services.env().items():
+        print(f"{key}={value}", flush=True)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    stop.wait()
+    services.stop()
+
+
+if __name__ == "__main__":
+    main()
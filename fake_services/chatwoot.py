@@ -0,0 +1,83 @@
+"""Fake Chatwoot application API: the endpoints ``ChatwootClient`` uses."""
+
+import itertools
+import time
+
+from fastapi import APIRouter, Body, FastAPI, HTTPException
+
+from fake_services.dataset import FakeDataset
+from fake_services.faults import FaultConfig, add_fault_injection
+
+_STATUSES = {"open", "resolved", "pending", "snoozed"}
+_MESSAGE_TYPES = {"incoming": 0, "outgoing": 1, "activity": 2}
+
+
+def create_chatwoot_app(dataset: FakeDataset, faults: FaultConfig | None = None) -> FastAPI:
+    app = FastAPI(title="Fake Chatwoot")
+    router = APIRouter(prefix="/api/v1/accounts/{account_id}")
+    message_ids = itertools.count(10_000_000)
+
+    def _conversation(conversation_id: int) -> dict:
+        conversation = dataset.conversations.get(conversation_id)
+        if conversation is None:
+            raise HTTPException(404, "Resource could not be found")
+        return conversation
+
+    @router.get("/conversations/{conversation_id}")
+    async def get_conversation(account_id: int, conversation_id: int) -> dict:
+        conversation = _conversation(conversation_id)
+        return {**conversation, "messages": dataset.messages[conversation_id]}
+
+    @router.patch("/conversations/{conversation_id}")
+    async def update_conversation(
+        account_id: int, conversation_id: int, changes: dict = Body(default_factory=dict)
+    ) -> dict:
+        conversation = _conversation(conversation_id)
+        conversation.update(changes)
+        return conversation
+
+    @router.get("/conversations/{conversation_id}/messages")
+    async def get_messages(account_id: int, conversation_id: int) -> dict:
+        conversation = _conversation(conversation_id)
+        return {
+            "meta": {"contact": conversation["meta"]["sender"]},
+            "payload": dataset.messages[conversation_id],
+        }
+
+    @router.post("/conversations/{conversation_id}/messages")
+    async def send_message(account_id: int, conversation_id: int, body: dict = Body(...)) -> dict:
+        conversation = _conversation(conversation_id)
+        now = int(time.time())
+        message = {
+            "id": next(message_ids),
+            "conversation_id": conversation_id,
+            "message_type": _MESSAGE_TYPES.get(body.get("message_type", "outgoing"), 1),
+            "content": body.get("content", ""),
+            "created_at": now,
+            "sender": {"id": 1, "name": "sentinelCX", "type": "user"},
+        }
+        dataset.messages[conversation_id].append(message)
+        if message["message_type"] == 1 and conversation["first_reply_created_at"] is None:
+            conversation["first_reply_created_at"] = now
+        return message
+
+    @router.post("/conversations/{conversation_id}/toggle_status")
+    async def toggle_status(account_id: int, conversation_id: int, body: dict = Body(...)) -> dict:
+        conversation = _conversation(conversation_id)
+        status = body.get("status")
+        if status not in _STATUSES:
+            raise HTTPException(422, f"Invalid status {status!r}")
+        conversation["status"] = status
+        return {
+            "meta": {},
+            "payload": {
+                "success": True,
+                "current_status": status,
+                "conversation_id": conversation_id,
+            },
+        }
+
+    app.include_router(router)
+    if faults is not None:
+        add_fault_injection(app, faults)
+    return app
@@ -0,0 +1,195 @@
+"""In-memory data served by the fake Chatwoot, Salesforce and Slack servers.
+
+Built from ``seed_data.generator`` the same way ``seed_data.seed`` fills the real
+services: Chatwoot conversations come from generated tickets and Salesforce
+accounts and contacts from generated customers, matched by customer name. Cases,
+opportunities and the Slack support team are added so that every client method
+has data to return. The same ``seed`` always yields the same dataset.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from seed_data.generator import generate_customers, generate_tickets
+
+_SUPPORT_TEAM = [
+    "Priya Patel",
+    "Tom Becker",
+    "Lena Novak",
+    "Omar Haddad",
+    "Grace Liu",
+    "Sam Okafor",
+]
+_CASE_STATUSES = ["Closed", "Closed", "Closed", "Working", "New"]
+_OPPORTUNITY_STAGES = ["Closed Won", "Closed Won", "Closed Lost", "Prospecting"]
+
+
+def _sf_id(prefix: str, n: int) -> str:
+    """18-character Salesforce-style record id."""
+    return f"{prefix}FAKE{n:011d}"
+
+
+def _epoch(iso: str) -> int:
+    return int(datetime.fromisoformat(iso.rstrip("Z")).timestamp())
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+@dataclass
+class FakeDataset:
+    # Chatwoot
+    conversations: dict[int, dict] = field(default_factory=dict)
+    messages: dict[int, list[dict]] = field(default_factory=dict)
+    # Salesforce records by sObject type
+    sobjects: dict[str, list[dict]] = field(default_factory=dict)
+    # Slack
+    users: dict[str, dict] = field(default_factory=dict)
+    presence: dict[str, str] = field(default_factory=dict)
+    channels: dict[str, list[str]] = field(default_factory=dict)
+    posted: list[dict] = field(default_factory=list)
+
+    @classmethod
+    def generate(
+        cls,
+        tickets: int = 50,
+        seed: int = 0,
+        escalation_channel: str = "#support-escalations",
+    ) -> "FakeDataset":
+        """Build a dataset of ``tickets`` conversations and the matching CRM records."""
+        # The generator draws from the global random module; keep the caller's state
+        state = random.getstate()
+        random.seed(seed)
+        try:
+            customers = generate_customers()
+            generated = generate_tickets(tickets)
+        finally:
+            random.setstate(state)
+
+        rng = random.Random(seed)
+        dataset = cls()
+        dataset._add_salesforce(customers, generated, rng)
+        dataset._add_chatwoot(customers, generated)
+        dataset._add_slack(escalation_channel, rng)
+        return dataset
+
+    def _add_chatwoot(self, customers: list[dict], tickets: list[dict]) -> None:
+        contacts = {c["name"]: (i + 1, c["email"]) for i, c in enumerate(customers)}
+        for ticket in tickets:
+            cid = ticket["conversation_id"]
+            contact_id, email = contacts[ticket["customer_name"]]
+            created_at = _epoch(ticket["created_at"])
+            sender = {"id": contact_id, "name": ticket["customer_name"], "email": email}
+            self.conversations[cid] = {
+                "id": cid,
+                "account_id": 1,
+                "inbox_id": 1,
+                "status": "open",
+                "priority": None,
+                "labels": [],
+                "created_at": created_at,
+                "additional_attributes": {},
+                "custom_attributes": {"ticket_id": ticket["id"]},
+                "meta": {"sender": {**sender, "phone_number": None}, "assignee": None},
+                "sla_policy": {"name": "Standard", "first_response_time_threshold": 3600},
+                "first_reply_created_at": None,
+            }
+            self.messages[cid] = [
+                {
+                    "id": cid * 1000,
+                    "conversation_id": cid,
+                    "message_type": 0,
+                    "content": f"Subject: {ticket['subject']}\n\n{ticket['body']}",
+                    "created_at": created_at,
+                    "sender": {**sender, "type": "contact"},
+                }
+            ]
+
+    def _add_salesforce(self, customers: list[dict], tickets: list[dict], rng) -> None:
+        accounts, contacts, cases, opportunities = [], [], [], []
+        now = datetime.utcnow()
+        subjects: dict[str, list[str]] = {}
+        for ticket in tickets:
+            subjects.setdefault(ticket["customer_name"], []).append(ticket["subject"])
+
+        for i, customer in enumerate(customers, start=1):
+            account_id = _sf_id("001", i)
+            first, _, last = customer["name"].partition(" ")
+            accounts.append(
+                {
+                    "Id": account_id,
+                    "Name": customer["name"],
+                    "Industry": "Technology",
+                    "Type": "Customer",
+                    "Phone": f"+1-555-{1000 + i:04d}",
+                    "Website": f"https://{last.lower()}.example.com",
+                    "Description": f"Tier: {customer['tier']} | Company: {customer['company']}",
+                }
+            )
+            contacts.append(
+                {
+                    "Id": _sf_id("003", i),
+                    "AccountId": account_id,
+                    "FirstName": first,
+                    "LastName": last,
+                    "Name": customer["name"],
+                    "Email": customer["email"],
+                    "Phone": f"+1-555-{2000 + i:04d}",
+                    "Title": "Customer Contact",
+                }
+            )
+            history = subjects.get(customer["name"], []) or ["General question"]
+            for _ in range(rng.randint(0, 6)):
+                created = now - timedelta(days=rng.randint(1, 365))
+                status = rng.choice(_CASE_STATUSES)
+                closed = status == "Closed"
+                cases.append(
+                    {
+                        "Id": _sf_id("500", len(cases) + 1),
+                        "AccountId": account_id,
+                        "CaseNumber": f"{len(cases) + 1:08d}",
+                        "Subject": rng.choice(history),
+                        "Status": status,
+                        "Priority": rng.choice(["Low", "Medium", "High"]),
+                        "CreatedDate": _iso(created),
+                        "ClosedDate": _iso(created + timedelta(days=2)) if closed else None,
+                        "Description": "Customer reported an issue through support.",
+                        "Resolution__c": "Resolved by support agent." if closed else None,
+                    }
+                )
+            for _ in range(rng.randint(1, 4)):
+                opportunities.append(
+                    {
+                        "Id": _sf_id("006", len(opportunities) + 1),
+                        "AccountId": account_id,
+                        "Name": f"{customer['company']} subscription",
+                        "Amount": round(rng.uniform(500, 20000), 2),
+                        "StageName": rng.choice(_OPPORTUNITY_STAGES),
+                        "CloseDate": (now - timedelta(days=rng.randint(1, 720))).date().isoformat(),
+                        "Description": "Annual plan",
+                    }
+                )
+        self.sobjects = {
+            "Account": accounts,
+            "Contact": contacts,
+            "Case": cases,
+            "Opportunity": opportunities,
+        }
+
+    def _add_slack(self, escalation_channel: str, rng) -> None:
+        members = []
+        for i, name in enumerate(_SUPPORT_TEAM, start=1):
+            user_id = f"U{i:08d}"
+            handle = name.lower().replace(" ", ".")
+            self.users[user_id] = {
+                "id": user_id,
+                "name": handle,
+                "real_name": name,
+                "is_bot": False,
+                "profile": {"real_name": name, "display_name": handle, "title": "Support"},
+            }
+            self.presence[user_id] = "active" if rng.random() < 0.6 else "away"
+            members.append(user_id)
+        self.channels[escalation_channel.lstrip("#")] = members
@@ -0,0 +1,48 @@
+"""Latency and error injection for the fake services."""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass
+class FaultConfig:
+    """Delay added to every request and the share of requests that fail."""
+
+    latency_ms: float = 0.0
+    # Uniform +/- jitter around latency_ms
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: int | None = None
+    _rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+
+    def delay(self) -> float:
+        """Seconds to wait before handling the next request."""
+        jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def should_fail(self) -> bool:
+        return self.error_rate > 0 and self._rng.random() < self.error_rate
+
+
+def add_fault_injection(app: FastAPI, faults: FaultConfig) -> None:
+    """Delay every request and fail a share of them, as configured."""
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        delay = faults.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        if faults.should_fail():
+            return JSONResponse(
+                {"ok": False, "error": "injected_fault", "message": "Injected fault"},
+                status_code=faults.error_status,
+            )
+        return await call_next(request)
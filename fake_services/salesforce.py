@@ -0,0 +1,101 @@
+"""Fake Salesforce REST API: the SOQL queries ``SalesforceClient`` runs.
+
+Supports ``SELECT <fields> FROM <object>`` with an optional ``WHERE`` of
+``Field = 'value'`` conditions joined by ``AND``, ``ORDER BY <field> [ASC|DESC]``
+and ``LIMIT``, over the Account, Contact, Case and Opportunity records of the
+dataset. Anything else is rejected as ``MALFORMED_QUERY``, like Salesforce does.
+"""
+
+import re
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from fake_services.dataset import FakeDataset
+from fake_services.faults import FaultConfig, add_fault_injection
+
+_SOQL = re.compile(
+    r"^\s*SELECT\s+(?P<fields>.+?)\s+FROM\s+(?P<object>\w+)"
+    r"(?:\s+WHERE\s+(?P<where>.+?))?"
+    r"(?:\s+ORDER\s+BY\s+(?P<order>\w+)(?:\s+(?P<direction>ASC|DESC))?)?"
+    r"(?:\s+LIMIT\s+(?P<limit>\d+))?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_CONDITION = re.compile(r"(\w+)\s*=\s*'((?:[^'\\]|\\.)*)'")
+_AND = re.compile(r"\s+AND\s+", re.IGNORECASE)
+
+
+class SOQLError(ValueError):
+    """A query outside the supported SOQL subset."""
+
+
+def _parse_where(where: str | None) -> list[tuple[str, str]]:
+    if not where:
+        return []
+    conditions = []
+    rest = where.strip()
+    while rest:
+        match = _CONDITION.match(rest)
+        if match is None:
+            raise SOQLError(f"unsupported WHERE clause near: {rest[:40]!r}")
+        conditions.append((match.group(1), re.sub(r"\\(.)", r"\1", match.group(2))))
+        rest = rest[match.end() :]
+        if rest:
+            joiner = _AND.match(rest)
+            if joiner is None:
+                raise SOQLError(f"unsupported WHERE clause near: {rest[:40]!r}")
+            rest = rest[joiner.end() :]
+    return conditions
+
+
+def _sort_key(value) -> tuple:
+    return (value is not None, value if value is not None else "")
+
+
+def run_soql(dataset: FakeDataset, query: str, version: str = "v59.0") -> dict:
+    """Evaluate a SOQL query against the dataset; the REST ``query`` response body."""
+    match = _SOQL.match(query)
+    if match is None:
+        raise SOQLError("unexpected token in query")
+    sobject = match.group("object")
+    if sobject not in dataset.sobjects:
+        raise SOQLError(f"sObject type '{sobject}' is not supported")
+    fields = [f.strip() for f in match.group("fields").split(",")]
+    conditions = _parse_where(match.group("where"))
+
+    rows = [r for r in dataset.sobjects[sobject] if all(r.get(f) == v for f, v in conditions)]
+    if order := match.group("order"):
+        descending = (match.group("direction") or "").upper() == "DESC"
+        # Salesforce sorts nulls first ascending, last descending
+        rows.sort(key=lambda r: _sort_key(r.get(order)), reverse=descending)
+    if limit := match.group("limit"):
+        rows = rows[: int(limit)]
+
+    records = [
+        {
+            "attributes": {
+                "type": sobject,
+                "url": f"/services/data/{version}/sobjects/{sobject}/{row['Id']}",
+            },
+            **{f: row.get(f) for f in fields},
+        }
+        for row in rows
+    ]
+    return {"totalSize": len(records), "done": True, "records": records}
+
+
+def create_salesforce_app(dataset: FakeDataset, faults: FaultConfig | None = None) -> FastAPI:
+    app = FastAPI(title="Fake Salesforce")
+
+    @app.get("/services/data/{version}/query/")
+    async def query(version: str, q: str):
+        try:
+            return run_soql(dataset, q, version)
+        except SOQLError as exc:
+            return JSONResponse(
+                [{"message": str(exc), "errorCode": "MALFORMED_QUERY"}], status_code=400
+            )
+
+    if faults is not None:
+        add_fault_injection(app, faults)
+    return app
@@ -0,0 +1,115 @@
+"""Run the fake services on local ports and point sentinelCX settings at them."""
+
+import asyncio
+import threading
+import time
+
+import uvicorn
+
+from fake_services.chatwoot import create_chatwoot_app
+from fake_services.dataset import FakeDataset
+from fake_services.faults import FaultConfig
+from fake_services.salesforce import create_salesforce_app
+from fake_services.slack import create_slack_app
+from sentinelcx.config import ChatwootSettings, SalesforceSettings, Settings, SlackSettings
+
+SERVICES = {
+    "chatwoot": create_chatwoot_app,
+    "salesforce": create_salesforce_app,
+    "slack": create_slack_app,
+}
+
+
+class FakeServices:
+    """Serves fake Chatwoot, Salesforce and Slack from a background thread.
+
+    The servers get their own event loop so that synchronous clients (the
+    Salesforce client uses ``requests``) can call them from the caller's loop.
+    Port 0 picks a free port; ``urls`` holds the bound addresses once started.
+    """
+
+    def __init__(
+        self,
+        dataset: FakeDataset | None = None,
+        faults: dict[str, FaultConfig] | None = None,
+        host: str = "127.0.0.1",
+        ports: dict[str, int] | None = None,
+    ) -> None:
+        self.dataset = dataset or FakeDataset.generate()
+        self._faults = faults or {}
+        self._host = host
+        self._ports = {service: 0 for service in SERVICES} | (ports or {})
+        self._servers: dict[str, uvicorn.Server] = {}
+        self._thread: threading.Thread | None = None
+        self.urls: dict[str, str] = {}
+
+    def start(self, timeout: float = 10.0) -> None:
+        for service, create_app in SERVICES.items():
+            app = create_app(self.dataset, self._faults.get(service))
+            config = uvicorn.Config(
+                app, host=self._host, port=self._ports[service], log_level="warning"
+            )
+            self._servers[service] = uvicorn.Server(config)
+
+        self._thread = threading.Thread(target=self._run, name="fake-services", daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not all(server.started for server in self._servers.values()):
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError("Fake services failed to start")
+            time.sleep(0.01)
+        for service, server in self._servers.items():
+            port = server.servers[0].sockets[0].getsockname()[1]
+            self.urls[service] = f"http://{self._host}:{port}"
+
+    def stop(self) -> None:
+        for server in self._servers.values():
+            server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=10.0)
+            self._thread = None
+
+    def __enter__(self) -> "FakeServices":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        async def serve() -> None:
+            await asyncio.gather(*(server.serve() for server in self._servers.values()))
+
+        asyncio.run(serve())
+
+    def settings(self, base: Settings | None = None) -> Settings:
+        """``base`` (or default settings) with every client pointed at the fakes."""
+        base = base or Settings()
+        return base.model_copy(
+            update={
+                "chatwoot": ChatwootSettings(
+                    base_url=self.urls["chatwoot"], api_token="fake-token", account_id=1
+                ),
+                "salesforce": SalesforceSettings(
+                    instance_url=self.urls["salesforce"], session_id="fake-session"
+                ),
+                "slack": SlackSettings(
+                    bot_token="xoxb-fake",
+                    escalation_channel=base.slack.escalation_channel,
+                    base_url=f"{self.urls['slack']}/api/",
+                ),
+            }
+        )
+
+    def env(self) -> dict[str, str]:
+        """Environment variables that point sentinelCX (and its MCP servers) at the fakes."""
+        return {
+            "CHATWOOT_BASE_URL": self.urls["chatwoot"],
+            "CHATWOOT_API_TOKEN": "fake-token",
+            "CHATWOOT_ACCOUNT_ID": "1",
+            "SALESFORCE_INSTANCE_URL": self.urls["salesforce"],
+            "SALESFORCE_SESSION_ID": "fake-session",
+            "SLACK_BOT_TOKEN": "xoxb-fake",
+            "SLACK_BASE_URL": f"{self.urls['slack']}/api/",
+        }
@@ -0,0 +1,80 @@
+"""Fake Slack Web API: the methods ``SlackClient`` calls.
+
+Serves ``chat.postMessage``, ``conversations.members``, ``users.info`` and
+``users.getPresence`` under ``/api/``. Like Slack, failures are reported as
+HTTP 200 with ``"ok": false``. Posted messages are kept in ``dataset.posted``.
+"""
+
+import itertools
+import time
+
+from fastapi import FastAPI, Request
+
+from fake_services.dataset import FakeDataset
+from fake_services.faults import FaultConfig, add_fault_injection
+
+
+async def _arguments(request: Request) -> dict:
+    """Method arguments from the query string, a form body or a JSON body."""
+    args = dict(request.query_params)
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        args.update(await request.json())
+    elif content_type.startswith("application/x-www-form-urlencoded"):
+        args.update(await request.form())
+    return args
+
+
+def create_slack_app(dataset: FakeDataset, faults: FaultConfig | None = None) -> FastAPI:
+    app = FastAPI(title="Fake Slack")
+    sequence = itertools.count(1)
+
+    def _channel_members(channel: str) -> list[str] | None:
+        return dataset.channels.get(channel.lstrip("#"))
+
+    def post_message(args: dict) -> dict:
+        channel = args.get("channel", "")
+        if _channel_members(channel) is None:
+            return {"ok": False, "error": "channel_not_found"}
+        ts = f"{time.time():.0f}.{next(sequence):06d}"
+        message = {"type": "message", "text": args.get("text", ""), "ts": ts, "bot_id": "B0FAKE"}
+        if args.get("blocks"):
+            message["blocks"] = args["blocks"]
+        dataset.posted.append({"channel": channel, **message})
+        return {"ok": True, "channel": channel, "ts": ts, "message": message}
+
+    def conversation_members(args: dict) -> dict:
+        members = _channel_members(args.get("channel", ""))
+        if members is None:
+            return {"ok": False, "error": "channel_not_found"}
+        return {"ok": True, "members": members, "response_metadata": {"next_cursor": ""}}
+
+    def user_info(args: dict) -> dict:
+        user = dataset.users.get(args.get("user", ""))
+        if user is None:
+            return {"ok": False, "error": "user_not_found"}
+        return {"ok": True, "user": user}
+
+    def user_presence(args: dict) -> dict:
+        user_id = args.get("user", "")
+        if user_id not in dataset.users:
+            return {"ok": False, "error": "user_not_found"}
+        return {"ok": True, "presence": dataset.presence.get(user_id, "away")}
+
+    methods = {
+        "chat.postMessage": post_message,
+        "conversations.members": conversation_members,
+        "users.info": user_info,
+        "users.getPresence": user_presence,
+    }
+
+    @app.api_route("/api/{method}", methods=["GET", "POST"])
+    async def call(method: str, request: Request) -> dict:
+        handler = methods.get(method)
+        if handler is None:
+            return {"ok": False, "error": "unknown_method"}
+        return handler(await _arguments(request))
+
+    if faults is not None:
+        add_fault_injection(app, faults)
+    return app
@@ -0,0 +1,191 @@
+"""Concurrent prefetch of the ticket context bundle handed to sub-agents.
+
+Triage, response and escalation all start by reading the same things: the
+Chatwoot ticket, its message history, the Salesforce customer record, its
+recent cases and purchases, and the account health derived from them. Fetched
+through tool calls, each one costs an LLM turn and they run one after another.
+The orchestrator instead fetches the bundle concurrently before the first query
+and embeds it in the sub-agent prompts.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+
+from sentinelcx.clients.chatwoot_client import ChatwootClient
+from sentinelcx.clients.salesforce_client import (
+    SalesforceClient,
+    score_account_health,
+    summarize_history,
+)
+from sentinelcx.config import Settings
+
+logger = logging.getLogger(__name__)
+
+_TICKET_FIELDS = (
+    "id",
+    "status",
+    "priority",
+    "labels",
+    "created_at",
+    "additional_attributes",
+    "custom_attributes",
+)
+_SENDER_FIELDS = ("id", "name", "email", "phone_number")
+_MESSAGE_FIELDS = ("id", "message_type", "content", "created_at")
+_TIER_PATTERN = re.compile(r"Tier:\s*(\w+)", re.IGNORECASE)
+
+
+@dataclass
+class TicketContext:
+    conversation_id: str
+    ticket: dict = field(default_factory=dict)
+    messages: list[dict] = field(default_factory=list)
+    customer: dict = field(default_factory=dict)
+    cases: list[dict] = field(default_factory=list)
+    purchases: list[dict] = field(default_factory=list)
+    account_health: dict = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    duration_ms: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """True when the Chatwoot side was fetched; Salesforce data is optional."""
+        return bool(self.ticket) and "messages" not in self.errors
+
+    @property
+    def customer_name(self) -> str:
+        sender = (self.ticket.get("meta") or {}).get("sender") or {}
+        return (sender.get("name") or "").strip()
+
+    @property
+    def customer_tier(self) -> str:
+        """Account tier, which the seed data stores as ``Tier: <tier>`` in the Description."""
+        match = _TIER_PATTERN.search(self.customer.get("Description") or "")
+        return match.group(1).lower() if match else ""
+
+    def incoming_text(self) -> str:
+        """Customer-authored message text, as used by fast triage."""
+        return "\n\n".join(
+            m.get("content") or ""
+            for m in self.messages
+            if m.get("message_type") in (0, "incoming")
+        ).strip()
+
+    def to_prompt_data(self, max_messages: int) -> dict:
+        """Compact JSON-serializable view of the bundle for agent prompts."""
+        ticket = {k: self.ticket[k] for k in _TICKET_FIELDS if k in self.ticket}
+        sender = (self.ticket.get("meta") or {}).get("sender") or {}
+        ticket["contact"] = {k: sender[k] for k in _SENDER_FIELDS if k in sender}
+
+        messages = []
+        for m in self.messages[-max_messages:]:
+            entry = {k: m[k] for k in _MESSAGE_FIELDS if k in m}
+            entry["sender"] = (m.get("sender") or {}).get("name", "")
+            messages.append(entry)
+
+        return {
+            "conversation_id": self.conversation_id,
+            "ticket": ticket,
+            "conversation_history": messages,
+            "customer_record": _strip_attributes(self.customer),
+            "account_health": _strip_attributes(self.account_health),
+            **summarize_history(self.cases, self.purchases),
+        }
+
+
+def _strip_attributes(value):
+    """Drop Salesforce ``attributes`` metadata (type/url) from query records."""
+    if isinstance(value, dict):
+        return {k: _strip_attributes(v) for k, v in value.items() if k != "attributes"}
+    if isinstance(value, list):
+        return [_strip_attributes(v) for v in value]
+    return value
+
+
+_salesforce_client: SalesforceClient | None = None
+_salesforce_lock = threading.Lock()
+
+
+def _get_salesforce_client(settings: Settings) -> SalesforceClient:
+    """Get the shared Salesforce client, logging in on first use."""
+    global _salesforce_client
+    with _salesforce_lock:
+        if _salesforce_client is None:
+            _salesforce_client = SalesforceClient(settings.salesforce)
+        return _salesforce_client
+
+
+async def prefetch_ticket_context(settings: Settings, conversation_id: str) -> TicketContext:
+    """Fetch ticket, history, customer record, cases and purchases concurrently.
+
+    The Chatwoot ticket and messages are fetched alongside the Salesforce
+    login; the customer lookup starts as soon as the ticket (and with it the
+    contact name) arrives, and the case and purchase histories follow the
+    lookup together. Account health is scored from those two, as
+    ``get_account_health`` does. Failures are recorded in
+    ``TicketContext.errors`` rather than raised.
+    """
+    context = TicketContext(conversation_id=conversation_id)
+    start = time.perf_counter()
+
+    async def _fetch(name: str, awaitable):
+        try:
+            return await awaitable
+        except Exception as exc:
+            logger.warning("Prefetch of %s failed for ticket %s: %s", name, conversation_id, exc)
+            context.errors[name] = str(exc)
+            return None
+
+    client = ChatwootClient(settings.chatwoot)
+    try:
+        cid = int(conversation_id)
+        ticket_task = asyncio.create_task(_fetch("ticket", client.get_conversation(cid)))
+        salesforce_task = asyncio.create_task(
+            _fetch("salesforce", asyncio.to_thread(_get_salesforce_client, settings))
+        )
+
+        async def _customer() -> None:
+            context.ticket = await ticket_task or {}
+            name = context.customer_name
+            salesforce = await salesforce_task
+            if not name or salesforce is None:
+                return
+            context.customer = (
+                await _fetch("customer", asyncio.to_thread(salesforce.get_customer_by_name, name))
+                or {}
+            )
+            account_id = context.customer.get("Id")
+            if account_id:
+                cases, purchases = await asyncio.gather(
+                    _fetch("cases", asyncio.to_thread(salesforce.get_case_history, account_id)),
+                    _fetch(
+                        "purchases", asyncio.to_thread(salesforce.get_purchase_history, account_id)
+                    ),
+                )
+                context.cases = cases or []
+                context.purchases = purchases or []
+                if cases is not None and purchases is not None:
+                    context.account_health = score_account_health(cases, purchases)
+
+        messages, _ = await asyncio.gather(
+            _fetch("messages", client.get_messages(cid)),
+            _customer(),
+        )
+        context.messages = messages or []
+    finally:
+        await client.close()
+
+    context.duration_ms = (time.perf_counter() - start) * 1000
+    logger.info(
+        "Prefetched context for ticket %s in %.0fms (messages=%d, customer=%s, errors=%s)",
+        conversation_id,
+        context.duration_ms,
+        len(context.messages),
+        bool(context.customer),
+        list(context.errors) or "none",
+    )
+    return context
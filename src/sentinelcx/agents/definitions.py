@@ -1,11 +1,14 @@
 """Sub-agent definitions for the Claude Agent SDK."""
 
+from dataclasses import replace
+
 from claude_agent_sdk import AgentDefinition
 
 from sentinelcx.agents.prompts import (
     build_escalation_prompt,
     build_research_prompt,
     build_response_prompt,
+    build_ticket_context_section,
     build_triage_prompt,
 )
 
@@ -20,6 +23,7 @@ TRIAGE_AGENT = AgentDefinition(
         "mcp__chatwoot__get_conversation_history",
         "mcp__chatwoot__get_sla_status",
         # Salesforce — check customer tier/VIP for routing decisions
+        "mcp__salesforce__get_customer_context",
         "mcp__salesforce__get_customer_record",
         "mcp__salesforce__get_account_health",
     ],
@@ -34,8 +38,10 @@ RESEARCH_AGENT = AgentDefinition(
     prompt=build_research_prompt(),
     tools=[
         "mcp__knowledge__search_knowledge_base",
+        "mcp__knowledge__search_knowledge_base_batch",
         "mcp__knowledge__get_document",
         "mcp__knowledge__list_topics",
+        "mcp__salesforce__get_customer_context",
         "mcp__salesforce__get_customer_record",
         "mcp__salesforce__get_case_history",
         "mcp__salesforce__get_purchase_history",
@@ -58,6 +64,7 @@ RESPONSE_AGENT = AgentDefinition(
         "mcp__knowledge__search_knowledge_base",
         "mcp__knowledge__get_document",
         # Read tools — Salesforce (customer context)
+        "mcp__salesforce__get_customer_context",
         "mcp__salesforce__get_customer_record",
         "mcp__salesforce__get_purchase_history",
         "mcp__salesforce__get_case_history",
@@ -80,6 +87,7 @@ ESCALATION_AGENT = AgentDefinition(
         "mcp__chatwoot__get_ticket",
         "mcp__chatwoot__get_conversation_history",
         # Read tools — Salesforce
+        "mcp__salesforce__get_customer_context",
         "mcp__salesforce__get_customer_record",
         "mcp__salesforce__get_account_health",
         "mcp__salesforce__get_case_history",
@@ -99,3 +107,11 @@ ALL_AGENTS = {
     "response": RESPONSE_AGENT,
     "escalation": ESCALATION_AGENT,
 }
+
+
+def with_ticket_context(context: dict) -> dict[str, AgentDefinition]:
+    """Per-ticket copies of ALL_AGENTS with the prefetched context appended to each prompt."""
+    section = build_ticket_context_section(context)
+    return {
+        name: replace(agent, prompt=agent.prompt + section) for name, agent in ALL_AGENTS.items()
+    }
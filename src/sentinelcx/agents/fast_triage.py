@@ -0,0 +1,230 @@
+"""Local k-NN triage classifier over the labeled ticket embeddings.
+
+Most tickets closely resemble the labeled examples in
+``evaluation_data/labeled_tickets.jsonl``. This classifier embeds those
+examples with the knowledge base's SentenceTransformer model and predicts
+category, priority and routing decision for a new ticket from its nearest
+neighbours. When the calibrated confidence clears the configured threshold, the
+orchestrator can skip the LLM triage sub-agent entirely.
+"""
+
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from sentinelcx.config import Settings
+
+logger = logging.getLogger(__name__)
+
+_FIELDS = ("category", "priority", "decision")
+
+
+@dataclass
+class FastTriagePrediction:
+    category: str
+    priority: str
+    decision: str
+    confidence: float
+    raw_confidence: float
+    field_confidence: dict[str, float] = field(default_factory=dict)
+
+    def to_triage_dict(self) -> dict:
+        """Shape the prediction like the triage agent's JSON output."""
+        return {
+            "decision": self.decision,
+            "category": self.category,
+            "priority": self.priority,
+            "confidence": round(self.confidence, 3),
+            "source": "fast_path",
+        }
+
+
+def load_labeled_examples(tickets_file: str, ground_truth_file: str) -> list[dict]:
+    """Join labeled tickets with routing ground truth into training examples."""
+    decisions = {}
+    gt_path = Path(ground_truth_file)
+    if gt_path.exists():
+        with open(gt_path) as f:
+            for line in f:
+                entry = json.loads(line)
+                decisions[entry["ticket_id"]] = entry["expected_decision"]
+
+    examples = []
+    with open(tickets_file) as f:
+        for line in f:
+            ticket = json.loads(line)
+            if ticket["id"] not in decisions:
+                continue
+            examples.append(
+                {
+                    "id": ticket["id"],
+                    "text": f"{ticket['subject']}\n\n{ticket['body']}",
+                    "category": ticket["expected_category"],
+                    "priority": ticket["expected_priority"],
+                    "decision": decisions[ticket["id"]],
+                }
+            )
+    return examples
+
+
+class FastTriageClassifier:
+    """Similarity-weighted k-NN vote with histogram-binned confidence calibration."""
+
+    def __init__(self, settings: Settings, model: SentenceTransformer | None = None) -> None:
+        self._settings = settings
+        self._model = model
+        self._embeddings: np.ndarray | None = None
+        self._examples: list[dict] = []
+        # Calibration: upper edge of each raw-confidence bin -> empirical accuracy
+        self._calibration_edges: np.ndarray | None = None
+        self._calibration_values: np.ndarray | None = None
+
+    @property
+    def fitted(self) -> bool:
+        return self._embeddings is not None
+
+    def _get_model(self) -> SentenceTransformer:
+        if self._model is None:
+            self._model = SentenceTransformer(self._settings.knowledge_base.embedding_model_name)
+        return self._model
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        vectors = np.asarray(self._get_model().encode(texts, convert_to_numpy=True), np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def fit(self, examples: list[dict]) -> None:
+        """Embed the labeled examples and calibrate confidence by leave-one-out."""
+        self._fit_encoded(examples, self._encode([e["text"] for e in examples]))
+        logger.info("Fast triage classifier fitted on %d examples", len(examples))
+
+    def _fit_encoded(self, examples: list[dict], embeddings: np.ndarray) -> None:
+        self._examples = examples
+        self._embeddings = embeddings
+        self._calibrate()
+
+    def fit_from_files(self) -> None:
+        cfg = self._settings.fast_triage
+        self.fit(load_labeled_examples(cfg.labeled_tickets_file, cfg.ground_truth_file))
+
+    def predict(self, text: str) -> FastTriagePrediction:
+        """Predict triage labels for a single ticket text."""
+        return self.predict_many([text])[0]
+
+    def predict_many(self, texts: list[str]) -> list[FastTriagePrediction]:
+        if not self.fitted:
+            raise RuntimeError("Fast triage classifier is not fitted. Call fit() first.")
+        similarities = self._encode(texts) @ self._embeddings.T
+        return [self._vote(row) for row in similarities]
+
+    def leave_one_out(self) -> list[FastTriagePrediction]:
+        """Predict every training example from all the others."""
+        similarities = self._embeddings @ self._embeddings.T
+        np.fill_diagonal(similarities, -np.inf)
+        return [self._vote(row) for row in similarities]
+
+    def cross_validate(self, folds: int = 5) -> list[FastTriagePrediction]:
+        """Predict every training example from a classifier fitted without its fold.
+
+        ``leave_one_out`` confidences are calibrated on the very predictions
+        they score, so they overstate accuracy. Here each fold is predicted by a
+        classifier whose neighbours and calibration both come from the other
+        folds, which is what an unseen ticket gets.
+        """
+        if not self.fitted:
+            raise RuntimeError("Fast triage classifier is not fitted. Call fit() first.")
+        # Interleaved folds keep each fold's label mix close to the whole set's
+        fold_ids = np.arange(len(self._examples)) % folds
+        predictions: list[FastTriagePrediction | None] = [None] * len(self._examples)
+        for fold in range(folds):
+            held_out = np.flatnonzero(fold_ids == fold)
+            train = np.flatnonzero(fold_ids != fold)
+            if not len(held_out) or not len(train):
+                continue
+            model = FastTriageClassifier(self._settings, self._model)
+            model._fit_encoded([self._examples[i] for i in train], self._embeddings[train])
+            for i, row in zip(held_out, self._embeddings[held_out] @ model._embeddings.T):
+                predictions[i] = model._vote(row)
+        return predictions
+
+    def _vote(self, similarities: np.ndarray) -> FastTriagePrediction:
+        cfg = self._settings.fast_triage
+        k = min(cfg.k, int(np.isfinite(similarities).sum()))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        weights = np.exp(similarities[top] / cfg.temperature)
+        weights = weights / weights.sum()
+
+        labels: dict[str, str] = {}
+        shares: dict[str, float] = {}
+        for name in _FIELDS:
+            votes: dict[str, float] = {}
+            for idx, weight in zip(top, weights):
+                label = self._examples[idx][name]
+                votes[label] = votes.get(label, 0.0) + float(weight)
+            labels[name], shares[name] = max(votes.items(), key=lambda kv: kv[1])
+
+        # Routing hinges on every field being right, so the weakest field bounds it
+        raw = min(shares.values())
+        return FastTriagePrediction(
+            category=labels["category"],
+            priority=labels["priority"],
+            decision=labels["decision"],
+            confidence=self._calibrated(raw),
+            raw_confidence=raw,
+            field_confidence=shares,
+        )
+
+    def _calibrate(self, bins: int = 10) -> None:
+        """Map raw vote share to observed leave-one-out accuracy per bin."""
+        self._calibration_edges = None
+        self._calibration_values = None
+        if len(self._examples) < bins * 2:
+            return
+        predictions = self.leave_one_out()
+        raw = np.array([p.raw_confidence for p in predictions])
+        correct = np.array(
+            [
+                all(getattr(p, name) == ex[name] for name in _FIELDS)
+                for p, ex in zip(predictions, self._examples)
+            ],
+            dtype=np.float64,
+        )
+        edges = np.linspace(0.0, 1.0, bins + 1)[1:]
+        bin_ids = np.searchsorted(edges, raw, side="left")
+        values = np.zeros(bins)
+        for b in range(bins):
+            mask = bin_ids == b
+            # Empty bins inherit the bin below; keep the mapping monotonic
+            values[b] = correct[mask].mean() if mask.any() else (values[b - 1] if b else 0.0)
+        self._calibration_edges = edges
+        self._calibration_values = np.maximum.accumulate(values)
+
+    def _calibrated(self, raw: float) -> float:
+        if self._calibration_edges is None:
+            return raw
+        idx = min(
+            int(np.searchsorted(self._calibration_edges, raw, side="left")),
+            len(self._calibration_values) - 1,
+        )
+        return float(self._calibration_values[idx])
+
+
+_classifier: FastTriageClassifier | None = None
+# Tickets may request the classifier from several worker threads at once
+_classifier_lock = threading.Lock()
+
+
+def get_fast_triage_classifier(settings: Settings | None = None) -> FastTriageClassifier:
+    """Get the global classifier, fitting it from the labeled files on first use."""
+    global _classifier
+    with _classifier_lock:
+        if _classifier is None:
+            classifier = FastTriageClassifier(settings or Settings())
+            classifier.fit_from_files()
+            _classifier = classifier
+        return _classifier
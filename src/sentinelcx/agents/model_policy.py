@@ -0,0 +1,67 @@
+"""Per-agent model selection.
+
+Each agent runs on the model configured for it in ``ModelPolicySettings``, so
+the short triage classification can use a small, fast model while drafting and
+escalation keep a larger one. Every agent defaults to the same model. When
+configured, the agents that act on the triage decision are moved to a stronger
+model for risky tickets: low triage confidence, or a customer whose Salesforce
+tier is configured as VIP.
+"""
+
+from dataclasses import replace
+
+from claude_agent_sdk import AgentDefinition
+
+from sentinelcx.agents.context import TicketContext
+from sentinelcx.config import ModelPolicySettings
+
+
+def _split(value: str) -> set[str]:
+    return {item.strip().lower() for item in value.split(",") if item.strip()}
+
+
+class ModelPolicy:
+    """Chooses the model for the orchestrator and each sub-agent."""
+
+    def __init__(self, settings: ModelPolicySettings) -> None:
+        self._settings = settings
+        self._vip_tiers = _split(settings.vip_tiers)
+        self._escalate_agents = _split(settings.escalate_agents)
+
+    @property
+    def orchestrator_model(self) -> str:
+        return self._settings.orchestrator
+
+    def base_model(self, agent: str) -> str | None:
+        return getattr(self._settings, agent, None)
+
+    def escalation_reason(
+        self, triage_data: dict | None = None, context: TicketContext | None = None
+    ) -> str | None:
+        """Why this ticket should get the stronger model, or None."""
+        if context is not None and context.customer_tier in self._vip_tiers:
+            return f"vip:{context.customer_tier}"
+        confidence = (triage_data or {}).get("confidence")
+        if confidence is not None and confidence < self._settings.escalate_below_confidence:
+            return "low_confidence"
+        return None
+
+    def apply(
+        self,
+        agents: dict[str, AgentDefinition],
+        triage_data: dict | None = None,
+        context: TicketContext | None = None,
+    ) -> tuple[dict[str, AgentDefinition], str | None]:
+        """Return copies of ``agents`` with their models set, and the escalation reason."""
+        reason = self.escalation_reason(triage_data, context)
+        selected = {}
+        for name, agent in agents.items():
+            model = self.base_model(name) or agent.model
+            if reason and name in self._escalate_agents:
+                model = self._settings.escalated
+            selected[name] = replace(agent, model=model)
+        return selected, reason
+
+
+def models_by_agent(agents: dict[str, AgentDefinition]) -> dict[str, str | None]:
+    return {name: agent.model for name, agent in agents.items()}
@@ -1,5 +1,7 @@
 """System prompts for each sub-agent, built by loading skill markdown files."""
 
+import json
+
 from sentinelcx.skills import load_skill
 
 
@@ -14,8 +16,7 @@ Read incoming support tickets via the Chatwoot tools, extract intent and urgency
 ## Process
 1. Retrieve the ticket details and conversation history using the Chatwoot tools
 2. Extract the customer's full name from the Chatwoot ticket contact info
-3. Call `mcp__salesforce__get_customer_record(customer_name="First Last")` to look up the customer
-4. If found, note the `Id` field (this is the Salesforce account_id) and call `mcp__salesforce__get_account_health(account_id=Id)` for account health
+3. Call `mcp__salesforce__get_customer_context(customer_name="First Last")` to look up the customer — one call returns the account (tier in `Description`) and its `account_health`
 4. Analyze customer sentiment using the skill below
 5. Classify the ticket into a category: billing, technical, account, product, or general
 6. Determine priority based on sentiment score + category + customer tier + account health
@@ -64,8 +65,8 @@ def build_research_prompt() -> str:
 Query the Knowledge Base and Salesforce for relevant documentation, previous case resolutions, and customer context to support ticket resolution.
 
 ## Process
-1. Search the knowledge base for relevant product documentation, FAQs, and policies
-2. Query Salesforce for the customer record, purchase history, and case history
+1. Search the knowledge base for relevant product documentation, FAQs, and policies — when you have several related queries, send them together with `mcp__knowledge__search_knowledge_base_batch`
+2. Call `mcp__salesforce__get_customer_context(customer_name="First Last")` for the customer record, account health, case history, and purchase history in one call
 3. Identify similar past cases and how they were resolved
 4. Compile a comprehensive research brief with verified facts and relevant context
 
@@ -107,27 +108,27 @@ MCP tools for EVERY step.
 1. Call `mcp__chatwoot__get_ticket` to read the ticket details
 2. Call `mcp__chatwoot__get_conversation_history` to read messages
 3. Extract the customer's full name from the ticket contact info
-4. Call `mcp__salesforce__get_customer_record(customer_name="First Last")` to look up the customer
-5. If found, note the `Id` field (Salesforce account_id) and call `mcp__salesforce__get_purchase_history(account_id=Id)`
-6. Call `mcp__knowledge__search_knowledge_base` with keywords from the customer's issue
-7. If the KB returns relevant docs, call `mcp__knowledge__get_document` to read them
-8. Draft a response using customer context + KB information to address the issue
-9. Run compliance checks on your draft
-10. Call `mcp__chatwoot__send_reply` to SEND the reply to the customer
-11. Call `mcp__chatwoot__update_ticket_status` with status="resolved"
-
-## How to use Salesforce account_id
-The `get_customer_record` tool accepts a `customer_name` string and returns the Account.
-The `Id` field in the response is the Salesforce account_id.
-Pass this `Id` to `get_purchase_history`, `get_case_history`, and `get_account_health`.
+4. Call `mcp__salesforce__get_customer_context(customer_name="First Last")` to look up the customer
+5. Call `mcp__knowledge__search_knowledge_base` with keywords from the customer's issue
+6. If the KB returns relevant docs, call `mcp__knowledge__get_document` to read them
+7. Draft a response using customer context + KB information to address the issue
+8. Run compliance checks on your draft
+9. Call `mcp__chatwoot__send_reply` to SEND the reply to the customer
+10. Call `mcp__chatwoot__update_ticket_status` with status="resolved"
+
+## How to use Salesforce customer context
+The `get_customer_context` tool accepts a `customer_name` string. In one call it returns \
+the Account (`account_id`, tier in `Description`), `account_health`, `recent_cases`, and a \
+`purchases` summary. Only call `get_purchase_history` or `get_case_history` with the \
+`account_id` if you need more records than the context includes.
 
 ## CRITICAL — You MUST call these tools:
 - `mcp__chatwoot__get_ticket` (step 1)
 - `mcp__chatwoot__get_conversation_history` (step 2)
-- `mcp__salesforce__get_customer_record` (step 4)
-- `mcp__knowledge__search_knowledge_base` (step 6)
-- `mcp__chatwoot__send_reply` (step 10)
-- `mcp__chatwoot__update_ticket_status` (step 11)
+- `mcp__salesforce__get_customer_context` (step 4)
+- `mcp__knowledge__search_knowledge_base` (step 5)
+- `mcp__chatwoot__send_reply` (step 9)
+- `mcp__chatwoot__update_ticket_status` (step 10)
 
 Do NOT skip any tool calls. Do NOT just return text.
 If you do not call send_reply, the customer will never see your response.
@@ -163,28 +164,26 @@ EVERY step.
 1. Call `mcp__chatwoot__get_ticket` to read ticket details
 2. Call `mcp__chatwoot__get_conversation_history` to read messages
 3. Extract the customer's full name from the ticket contact info
-4. Call `mcp__salesforce__get_customer_record(customer_name="First Last")` for customer context
-5. If found, note the `Id` field (Salesforce account_id) and call `mcp__salesforce__get_account_health(account_id=Id)`
-6. Call `mcp__salesforce__get_case_history(account_id=Id)` to check for related past cases
-7. Call `mcp__knowledge__search_knowledge_base` with keywords from the issue
-8. If KB returns relevant docs, call `mcp__knowledge__get_document` to read them
-9. Compose a structured escalation summary (see format below) — include KB findings and past case context in recommended next steps
-10. Call `mcp__slack__post_escalation` with the composed summary
-11. Call `mcp__chatwoot__update_ticket_status` with status="pending"
-
-## How to use Salesforce account_id
-The `get_customer_record` tool accepts a `customer_name` string and returns the Account.
-The `Id` field in the response is the Salesforce account_id.
-Pass this `Id` to `get_account_health`, `get_case_history`, and `get_purchase_history`.
+4. Call `mcp__salesforce__get_customer_context(customer_name="First Last")` for the customer's account, health score, and related past cases in one call
+5. Call `mcp__knowledge__search_knowledge_base` with keywords from the issue
+6. If KB returns relevant docs, call `mcp__knowledge__get_document` to read them
+7. Compose a structured escalation summary (see format below) — include KB findings and past case context in recommended next steps
+8. Call `mcp__slack__post_escalation` with the composed summary
+9. Call `mcp__chatwoot__update_ticket_status` with status="pending"
+
+## How to use Salesforce customer context
+The `get_customer_context` tool accepts a `customer_name` string. In one call it returns
+the Account (`account_id`, tier in `Description`), `account_health`, `recent_cases`, and a
+`purchases` summary. Only call `get_case_history` or `get_purchase_history` with the
+`account_id` if you need more records than the context includes.
 
 ## CRITICAL — You MUST call these tools:
 - `mcp__chatwoot__get_ticket` (step 1)
 - `mcp__chatwoot__get_conversation_history` (step 2)
-- `mcp__salesforce__get_customer_record` (step 4)
-- `mcp__salesforce__get_account_health` (step 5)
-- `mcp__knowledge__search_knowledge_base` (step 7)
-- `mcp__slack__post_escalation` (step 10)
-- `mcp__chatwoot__update_ticket_status` (step 11)
+- `mcp__salesforce__get_customer_context` (step 4)
+- `mcp__knowledge__search_knowledge_base` (step 5)
+- `mcp__slack__post_escalation` (step 8)
+- `mcp__chatwoot__update_ticket_status` (step 9)
 
 Do NOT skip any tool calls. Do NOT just return text.
 If you do not call post_escalation, the Slack team will never be notified.
@@ -223,3 +222,48 @@ After calling all tools, return:
   "issue_summary": "Brief summary of the escalation"
 }
 ```"""
+
+
+def build_delegation_context_section(context: dict) -> str:
+    """Build the orchestrator prompt section that forwards prefetched context to sub-agents.
+
+    Persistent sessions keep the sub-agent prompts identical across tickets, so
+    the context reaches the sub-agents through their delegation messages instead.
+    """
+    return (
+        "\n\nThis ticket's data was prefetched and is shown below. As an exception to the "
+        "delegation rules, end every delegation message with the whole "
+        '"Prefetched Ticket Context" section below, copied verbatim after the one-line '
+        "instruction, so the sub-agent does not fetch that data again."
+        + build_ticket_context_section(context)
+    )
+
+
+def build_ticket_context_section(context: dict) -> str:
+    """Build the prompt section carrying the orchestrator's prefetched ticket context."""
+    context_json = json.dumps(context, indent=2, default=str)
+    return f"""
+
+## Prefetched Ticket Context
+The orchestrator already fetched this ticket's data before delegating to you. \
+It is exactly what these tools return for conversation_id={context["conversation_id"]}:
+- `ticket` → `mcp__chatwoot__get_ticket`
+- `conversation_history` → `mcp__chatwoot__get_conversation_history`
+- `customer_record` → `mcp__salesforce__get_customer_record` (its `Id` is the account_id)
+- `account_health` → `mcp__salesforce__get_account_health`
+- `recent_cases` and `purchases` → the same fields as in \
+`mcp__salesforce__get_customer_context`: the most recent past cases and a purchase summary
+
+Do NOT call those tools, or `mcp__salesforce__get_customer_context`, which returns nothing \
+beyond this context; this overrides any instruction above that requires them. Skip the \
+steps that only fetch this data and start from the first step that needs something else. \
+Use `recent_cases` and `purchases` wherever a step asks for past case context or purchase \
+history. Call `mcp__salesforce__get_case_history` or `mcp__salesforce__get_purchase_history` \
+with the `customer_record` Id only if you need more records than they include. All other \
+tool calls (knowledge base, replies, escalations, status updates) still apply. If \
+`customer_record` is empty the Salesforce lookup found no match or failed — proceed with \
+Chatwoot data only.
+
+```json
+{context_json}
+```"""
@@ -1,26 +1,65 @@
 """FastAPI application factory."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from sentinelcx.api.routes import dashboard, dashboard_sse, evaluation, health, tickets
+from sentinelcx.api.routes import dashboard, dashboard_sse, evaluation, health, jobs, tickets
 from sentinelcx.api.webhooks import chatwoot
 from sentinelcx.config import Settings
-from sentinelcx.dashboard.log_monitor import get_log_monitor
+from sentinelcx.dashboard.telemetry import get_telemetry_listener
+from sentinelcx.jobs import get_job_manager
+from sentinelcx.mcp_servers.pool import get_mcp_pool
+from sentinelcx.scheduler import get_ticket_scheduler
+from sentinelcx.sessions import get_session_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    # Startup: start MCP log monitor
-    monitor = get_log_monitor()
-    await monitor.start()
+    settings = app.state.settings
+
+    # Startup: listen for tool-call telemetry pushed by the MCP servers
+    telemetry = get_telemetry_listener(settings) if settings.mcp.telemetry_socket else None
+    if telemetry:
+        await telemetry.start()
+
+    # Startup: spawn long-lived MCP servers when pooled transport is enabled
+    pool = get_mcp_pool(settings) if settings.mcp.transport == "pooled" else None
+    if pool:
+        await pool.start()
+    retry_task = None
+    if settings.mcp.transport == "in_process":
+        from sentinelcx.mcp_servers.in_process import (
+            init_in_process_servers,
+            retry_failed_in_process_servers,
+        )
+
+        await init_in_process_servers(settings)
+        retry_task = asyncio.create_task(retry_failed_in_process_servers(settings))
+
+    # Startup: ticket scheduler workers
+    scheduler = get_ticket_scheduler(settings)
+    await scheduler.start()
+
+    # Startup: recover persisted jobs onto the scheduler
+    job_manager = get_job_manager(settings)
+    await job_manager.start()
 
     yield
 
-    # Shutdown: stop monitor
-    await monitor.stop()
+    # Shutdown: stop jobs, scheduler, sessions, pool and telemetry
+    job_manager.stop()
+    await scheduler.stop()
+    if retry_task:
+        retry_task.cancel()
+    if settings.orchestrator.session_pool:
+        await get_session_pool(settings).stop()
+    if pool:
+        await pool.stop()
+    if telemetry:
+        await telemetry.stop()
 
 
 def create_app() -> FastAPI:
@@ -37,6 +76,7 @@ def create_app() -> FastAPI:
 
     app.include_router(health.router, tags=["health"])
     app.include_router(tickets.router, prefix="/api/v1", tags=["tickets"])
+    app.include_router(jobs.router, prefix="/api/v1", tags=["jobs"])
     app.include_router(evaluation.router, prefix="/api/v1", tags=["evaluation"])
     app.include_router(chatwoot.router, prefix="/webhooks", tags=["webhooks"])
     app.include_router(dashboard.router, tags=["dashboard"])
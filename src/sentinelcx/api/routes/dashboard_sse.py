@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import time
 
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
@@ -66,4 +67,16 @@ async def ticket_detail(conversation_id: str) -> dict:
     """Get all events for a specific ticket."""
     store = get_event_bus().store
     events = store.get_ticket_events(conversation_id)
-    return {"conversation_id": conversation_id, "events": events}
+    spans = store.get_ticket_spans(conversation_id)
+    return {"conversation_id": conversation_id, "events": events, "spans": spans}
+
+
+@router.get("/api/v1/dashboard/latency")
+async def dashboard_latency(hours: float | None = None) -> dict:
+    """Latency percentiles (p50/p95/p99) per agent and per MCP tool.
+
+    Computed from persisted spans, optionally limited to the last ``hours``.
+    """
+    since = time.time() - hours * 3600 if hours else None
+    stats = get_event_bus().store.get_latency_stats(since=since)
+    return {"hours": hours, **stats}
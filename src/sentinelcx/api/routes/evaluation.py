@@ -1,5 +1,7 @@
 """Evaluation framework endpoints."""
 
+import asyncio
+
 from fastapi import APIRouter, Request
 
 router = APIRouter()
@@ -33,3 +35,13 @@ async def evaluate_hallucination(request: Request) -> dict:
     settings = request.app.state.settings
     results = await detect_hallucinations(settings)
     return results
+
+
+@router.post("/evaluate/fast_triage")
+async def evaluate_fast_triage(request: Request) -> dict:
+    """5-fold cross-validated accuracy and coverage of the local k-NN triage classifier."""
+    from sentinelcx.evaluation.routing import evaluate_fast_triage_accuracy
+
+    settings = request.app.state.settings
+    results = await asyncio.to_thread(evaluate_fast_triage_accuracy, settings)
+    return results
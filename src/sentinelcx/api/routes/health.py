@@ -1,6 +1,9 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+
+from sentinelcx.mcp_servers.pool import get_mcp_pool
+from sentinelcx.sessions import get_session_pool
 
 router = APIRouter()
 
@@ -8,3 +11,22 @@ router = APIRouter()
 @router.get("/health")
 async def health_check() -> dict:
     return {"status": "ok", "service": "sentinelCX"}
+
+
+@router.get("/health/mcp")
+async def mcp_health(request: Request) -> dict:
+    """Report MCP transport mode and, when pooled, per-instance pool health."""
+    settings = request.app.state.settings
+    if settings.mcp.transport != "pooled":
+        return {"transport": settings.mcp.transport}
+    pool = get_mcp_pool(settings)
+    return {"transport": "pooled", "running": pool.running, "servers": pool.stats()}
+
+
+@router.get("/health/sessions")
+async def session_health(request: Request) -> dict:
+    """Report whether Claude CLI sessions are pooled and, if so, pool usage."""
+    settings = request.app.state.settings
+    if not settings.orchestrator.session_pool:
+        return {"session_pool": False}
+    return {"session_pool": True, **get_session_pool(settings).stats()}
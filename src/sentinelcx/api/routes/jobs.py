@@ -0,0 +1,109 @@
+"""Asynchronous job endpoints: submit, poll, and stream ticket progress."""
+
+import asyncio
+import json
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from sentinelcx.api.routes.tickets import ProcessTicketRequest
+from sentinelcx.dashboard.event_bus import EventType, get_event_bus
+from sentinelcx.jobs import TERMINAL_STATUSES, get_job_manager
+from sentinelcx.scheduler import QueueFullError
+
+router = APIRouter()
+
+
+def _get_job_or_404(request: Request, job_id: str) -> dict:
+    job = get_job_manager(request.app.state.settings).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.post("/jobs", status_code=202)
+async def submit_job(body: ProcessTicketRequest, request: Request) -> dict:
+    """Queue a ticket for processing and return its job immediately."""
+    manager = get_job_manager(request.app.state.settings)
+    try:
+        return manager.submit(body.conversation_id, body.priority)
+    except QueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str, request: Request) -> dict:
+    """Get a job's status, and its result once finished."""
+    return _get_job_or_404(request, job_id)
+
+
+@router.get("/jobs/{job_id}/events")
+async def job_events(job_id: str, request: Request) -> StreamingResponse:
+    """Server-Sent Events stream of the job's ticket events.
+
+    Events the job's run already produced are replayed first, so a client
+    that connects late still sees the whole run. Events are matched by
+    conversation and by time: anything published before a worker started the
+    job belongs to an earlier run of the same conversation. The stream ends
+    with a ``job`` event carrying the final job record.
+    """
+    job = _get_job_or_404(request, job_id)
+    manager = get_job_manager(request.app.state.settings)
+    bus = get_event_bus()
+    conversation_id = job["conversation_id"]
+
+    def _in_run(timestamp: float) -> bool:
+        started_at = manager.get(job_id)["started_at"]
+        return started_at is not None and timestamp >= started_at
+
+    def _format(event: dict) -> str:
+        return f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+    async def event_stream():
+        # Subscribe before replaying so nothing published in between is missed
+        queue = bus.subscribe()
+        try:
+            seen: set[tuple[str, float]] = set()
+            finished = False
+            for event in bus.store.get_ticket_events(conversation_id):
+                if not _in_run(event["timestamp"]):
+                    continue
+                seen.add((event["type"], event["timestamp"]))
+                finished = finished or event["type"] == EventType.TICKET_COMPLETE.value
+                yield _format(event)
+            # A run that failed outside the orchestrator never publishes TICKET_COMPLETE
+            finished = finished or manager.get(job_id)["status"] in TERMINAL_STATUSES
+
+            while not finished:
+                if await request.is_disconnected():
+                    return
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=30.0)
+                except asyncio.TimeoutError:
+                    if manager.get(job_id)["status"] in TERMINAL_STATUSES:
+                        break
+                    # Keepalive to prevent proxy/browser timeouts
+                    yield "event: ping\ndata: {}\n\n"
+                    continue
+                if event.conversation_id != conversation_id:
+                    continue
+                if (event.type.value, event.timestamp) in seen or not _in_run(event.timestamp):
+                    continue
+                finished = event.type == EventType.TICKET_COMPLETE
+                yield _format(event.to_dict())
+
+            # The job row is finalised by the scheduler future's callback
+            final = await manager.wait(job_id, timeout=5.0)
+            yield f"event: job\ndata: {json.dumps(final, default=str)}\n\n"
+        finally:
+            bus.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
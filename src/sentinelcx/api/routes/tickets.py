@@ -1,15 +1,44 @@
 """Ticket processing endpoints."""
 
-from fastapi import APIRouter, Request
-from pydantic import BaseModel
+import asyncio
+import json
 
-from sentinelcx.orchestrator import SentinelCXOrchestrator
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from sentinelcx.batch import process_batch
+from sentinelcx.scheduler import QueueFullError, TicketScheduler, get_ticket_scheduler
 
 router = APIRouter()
 
+# Seconds to wait before retrying a batch ticket the scheduler rejected as full
+_QUEUE_FULL_BACKOFF = 1.0
+
 
 class ProcessTicketRequest(BaseModel):
     conversation_id: str
+    priority: str | None = None
+
+
+class ProcessBatchRequest(BaseModel):
+    conversation_ids: list[str] = Field(min_length=1)
+    concurrency: int = Field(default=4, ge=1, le=64)
+    # Backfills default to the lowest lane so live tickets go first
+    priority: str | None = "low"
+
+
+async def _submit_and_wait(
+    scheduler: TicketScheduler, conversation_id: str, priority: str | None
+) -> dict:
+    """Queue a ticket on the shared scheduler, waiting out a full queue."""
+    while True:
+        try:
+            future = scheduler.submit(conversation_id, priority)
+            break
+        except QueueFullError:
+            await asyncio.sleep(_QUEUE_FULL_BACKOFF)
+    return await asyncio.shield(future)
 
 
 @router.post("/tickets/process")
@@ -17,9 +46,39 @@ async def process_ticket(body: ProcessTicketRequest, request: Request) -> dict:
     """Process a support ticket through the full agent pipeline.
 
     Triggers triage, research, response generation, or escalation
-    depending on the ticket's characteristics.
+    depending on the ticket's characteristics. The ticket is queued on the
+    shared scheduler; returns 429 when the queue is full.
     """
-    settings = request.app.state.settings
-    orchestrator = SentinelCXOrchestrator(settings)
-    result = await orchestrator.process_ticket(body.conversation_id)
-    return result
+    scheduler = get_ticket_scheduler(request.app.state.settings)
+    try:
+        future = scheduler.submit(body.conversation_id, body.priority)
+    except QueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    # Shield so a client disconnect does not cancel the queued ticket
+    return await asyncio.shield(future)
+
+
+@router.post("/tickets/process_batch")
+async def process_ticket_batch(body: ProcessBatchRequest, request: Request) -> StreamingResponse:
+    """Process many tickets and stream one NDJSON result line per ticket as each finishes.
+
+    Tickets go through the shared scheduler, so they count against its worker
+    pool and coalesce with webhook runs; ``concurrency`` caps how many of this
+    batch's tickets are queued or running at once.
+    """
+    scheduler = get_ticket_scheduler(request.app.state.settings)
+
+    async def _process(conversation_id: str) -> dict:
+        return await _submit_and_wait(scheduler, conversation_id, body.priority)
+
+    async def _stream():
+        async for record in process_batch(body.conversation_ids, _process, body.concurrency):
+            yield json.dumps(record, default=str) + "\n"
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
+@router.get("/tickets/queue")
+async def queue_stats(request: Request) -> dict:
+    """Scheduler queue depth, per-lane counts and wait-time metrics."""
+    return get_ticket_scheduler(request.app.state.settings).stats()
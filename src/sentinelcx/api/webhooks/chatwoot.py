@@ -1,36 +1,39 @@
 """Chatwoot webhook receiver."""
 
+import asyncio
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Request
+from fastapi import APIRouter, HTTPException, Request
 
-from sentinelcx.orchestrator import SentinelCXOrchestrator
+from sentinelcx.scheduler import QueueFullError, get_ticket_scheduler
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-async def _process_in_background(conversation_id: str, settings) -> None:
-    """Process a ticket in the background after webhook receipt."""
-    try:
-        orchestrator = SentinelCXOrchestrator(settings)
-        result = await orchestrator.process_ticket(str(conversation_id))
+def _log_outcome(conversation_id: str, future: asyncio.Future) -> None:
+    """Log the result of a webhook-triggered run once the scheduler finishes it."""
+    if future.cancelled():
+        logger.info("Processing cancelled for conversation %s", conversation_id)
+    elif future.exception() is not None:
+        logger.error("Error processing conversation %s: %s", conversation_id, future.exception())
+    else:
         logger.info(
             "Background processing complete for conversation %s: %s",
             conversation_id,
-            result.get("success"),
+            future.result().get("success"),
         )
-    except Exception:
-        logger.exception("Error processing conversation %s", conversation_id)
 
 
 @router.post("/chatwoot")
-async def chatwoot_webhook(request: Request, background_tasks: BackgroundTasks) -> dict:
+async def chatwoot_webhook(request: Request) -> dict:
     """Receive Chatwoot webhook events and trigger ticket processing.
 
     Chatwoot sends webhooks for events like new conversations, new messages, etc.
-    We filter for actionable events and process them asynchronously.
+    We filter for actionable events and queue them on the ticket scheduler,
+    returning 429 when the queue is full. Events for a conversation that is
+    already queued or in flight are coalesced into a single pending re-run.
     """
     payload = await request.json()
     event_type = payload.get("event")
@@ -41,11 +44,14 @@ async def chatwoot_webhook(request: Request, background_tasks: BackgroundTasks)
         return {"status": "ignored", "event": event_type}
 
     conversation_id = None
+    priority = None
     if event_type == "conversation_created":
         conversation_id = payload.get("id")
+        priority = payload.get("priority")
     elif event_type == "message_created":
         conversation = payload.get("conversation", {})
         conversation_id = conversation.get("id")
+        priority = conversation.get("priority")
         # Only process incoming messages (from customers)
         message_type = payload.get("message_type")
         if message_type != "incoming":
@@ -54,7 +60,15 @@ async def chatwoot_webhook(request: Request, background_tasks: BackgroundTasks)
     if conversation_id is None:
         return {"status": "error", "reason": "no conversation_id found"}
 
-    settings = request.app.state.settings
-    background_tasks.add_task(_process_in_background, str(conversation_id), settings)
+    scheduler = get_ticket_scheduler(request.app.state.settings)
+    # Events for a conversation that already has a waiting run merge into it
+    coalesced = scheduler.is_waiting(str(conversation_id))
+    try:
+        future = scheduler.submit(str(conversation_id), priority)
+    except QueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    if coalesced:
+        return {"status": "coalesced", "conversation_id": conversation_id}
 
+    future.add_done_callback(lambda f: _log_outcome(str(conversation_id), f))
     return {"status": "accepted", "conversation_id": conversation_id}
@@ -0,0 +1,156 @@
+"""Batch ticket processing for backfills.
+
+``process_batch`` runs many conversations with a concurrency limit and yields
+one result record per ticket as each finishes. The API streams those records
+as NDJSON from ``POST /api/v1/tickets/process_batch``; the CLI below writes
+them to a file and can resume an interrupted run.
+
+Usage:
+    python -m sentinelcx.batch ids.txt                       # results to ids.results.ndjson
+    python -m sentinelcx.batch ids.txt --concurrency 8 --output backfill.ndjson
+    python -m sentinelcx.batch ids.txt --resume              # skip IDs already in the output
+    python -m sentinelcx.batch ids.txt --resume --retry-failed
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+ProcessFn = Callable[[str], Awaitable[dict]]
+
+
+def _unique(conversation_ids: Iterable[str]) -> list[str]:
+    """Drop duplicate IDs, keeping first-seen order."""
+    return list(dict.fromkeys(str(cid) for cid in conversation_ids))
+
+
+def _record(conversation_id: str, result: dict, elapsed_ms: float) -> dict:
+    return {
+        "conversation_id": conversation_id,
+        "success": bool(result.get("success")),
+        "result": result.get("result"),
+        "cost_usd": result.get("cost_usd"),
+        "duration_ms": result.get("duration_ms"),
+        "turns": result.get("turns"),
+        "elapsed_ms": round(elapsed_ms, 1),
+    }
+
+
+async def process_batch(
+    conversation_ids: Iterable[str], process: ProcessFn, concurrency: int = 4
+) -> AsyncIterator[dict]:
+    """Process conversations in parallel, yielding a record per ticket as it finishes.
+
+    At most ``concurrency`` tickets run at once. A ticket that raises yields a
+    record with ``success=False`` and the error instead of aborting the batch.
+    Closing the iterator cancels tickets that have not finished.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(conversation_id: str) -> dict:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await process(conversation_id)
+            except Exception as exc:
+                logger.exception("Batch processing failed for conversation %s", conversation_id)
+                return {
+                    "conversation_id": conversation_id,
+                    "success": False,
+                    "error": str(exc),
+                    "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+                }
+            return _record(conversation_id, result, (time.perf_counter() - start) * 1000)
+
+    tasks = [asyncio.create_task(_run(cid)) for cid in _unique(conversation_ids)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def read_conversation_ids(path: Path) -> list[str]:
+    """Read one conversation ID per line, skipping blanks and ``#`` comments."""
+    ids = []
+    for line in path.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            ids.append(line)
+    return _unique(ids)
+
+
+def completed_ids(output: Path, retry_failed: bool = False) -> set[str]:
+    """Conversation IDs already recorded in an NDJSON results file."""
+    done: set[str] = set()
+    if not output.exists():
+        return done
+    for line in output.read_text().splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A line cut off by the interruption; that ticket is simply re-run
+            continue
+        if record.get("success") or not retry_failed:
+            done.add(str(record["conversation_id"]))
+    return done
+
+
+async def run_cli(args: argparse.Namespace) -> dict:
+    from sentinelcx.config import Settings
+    from sentinelcx.orchestrator import SentinelCXOrchestrator
+
+    output = Path(args.output or Path(args.ids_file).with_suffix(".results.ndjson"))
+    ids = read_conversation_ids(Path(args.ids_file))
+    if args.resume:
+        done = completed_ids(output, retry_failed=args.retry_failed)
+        ids = [cid for cid in ids if cid not in done]
+        logger.info("Resuming: %d already done, %d remaining", len(done), len(ids))
+    elif output.exists():
+        raise SystemExit(f"{output} exists; pass --resume to continue it or choose --output")
+
+    orchestrator = SentinelCXOrchestrator(Settings())
+    summary = {"processed": 0, "succeeded": 0, "failed": 0}
+    with open(output, "a") as f:
+        async for record in process_batch(ids, orchestrator.process_ticket, args.concurrency):
+            f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
+            summary["processed"] += 1
+            summary["succeeded" if record["success"] else "failed"] += 1
+            logger.info(
+                "[%d/%d] conversation %s: success=%s (%.1fs)",
+                summary["processed"],
+                len(ids),
+                record["conversation_id"],
+                record["success"],
+                record["elapsed_ms"] / 1000,
+            )
+    logger.info("Batch complete: %s (results in %s)", summary, output)
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Process a batch of sentinelCX tickets")
+    parser.add_argument("ids_file", help="File with one conversation ID per line")
+    parser.add_argument("--concurrency", type=int, default=4, help="Tickets processed at once")
+    parser.add_argument("--output", help="NDJSON results file (default: <ids_file>.results.ndjson)")
+    parser.add_argument("--resume", action="store_true", help="Skip IDs already in the output")
+    parser.add_argument(
+        "--retry-failed", action="store_true", help="With --resume, also re-run failed IDs"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    asyncio.run(run_cli(args))
+
+
+if __name__ == "__main__":
+    main()
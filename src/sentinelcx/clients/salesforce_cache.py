@@ -0,0 +1,187 @@
+"""Shared on-disk cache of Salesforce lookups.
+
+Customer records, case history and account health change slowly, yet every
+MCP server process (one per ticket with the ``stdio`` transport, several with
+the pool) queries Salesforce on every call. The cache keeps query results in a
+SQLite database in WAL mode, so any number of processes read it concurrently
+while one writes, and a lookup made by one ticket's server is a warm hit for
+the next.
+
+Entries younger than ``ttl`` are served as-is. Entries past ``ttl`` but within
+``stale_ttl`` are served immediately while one process refreshes them in the
+background (stale-while-revalidate), so a slow Salesforce call only blocks a
+ticket when no recent value exists at all. Lookups that found nothing (an empty
+record or list) are kept for ``miss_ttl`` only, and never served stale, so a
+customer created in Salesforce shows up within seconds.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+from sentinelcx.config import SalesforceSettings
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent.parent / "salesforce_cache.db"
+# Seconds another process's refresh claim is honoured before it is retried
+_REFRESH_LEASE = 30.0
+
+
+class SalesforceCache:
+    """TTL cache of JSON-serializable lookup results in a shared SQLite file."""
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        ttl: float = 300.0,
+        stale_ttl: float = 3600.0,
+        miss_ttl: float = 30.0,
+    ) -> None:
+        self._db_path = str(db_path or _DEFAULT_DB_PATH)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.miss_ttl = miss_ttl
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                refresh_claimed_at REAL
+            )
+        """)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sf-cache")
+        self._refreshing: set[str] = set()
+        self._counts = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "errors": 0}
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """The cached value of ``key``, calling ``fetch`` when there is no usable one."""
+        row = self._read(key)
+        if row is not None:
+            value, age = row
+            miss = _is_miss(value)
+            if age < (self.miss_ttl if miss else self.ttl):
+                self._count("hits")
+                return value
+            if not miss and age < self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                self._refresh_in_background(key, fetch)
+                return value
+
+        self._count("misses")
+        value = fetch()
+        self._write(key, value)
+        return value
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop entries whose key starts with ``prefix`` (all entries by default)."""
+        with self._lock:
+            # A plain prefix comparison; LIKE would treat "_" and "%" in keys as wildcards
+            self._conn.execute(
+                "DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            counts = dict(self._counts)
+        lookups = counts["hits"] + counts["stale_hits"] + counts["misses"]
+        served = counts["hits"] + counts["stale_hits"]
+        return {
+            "path": self._db_path,
+            "entries": entries,
+            **counts,
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        self._refresher.shutdown(wait=True)
+        with self._lock:
+            self._conn.close()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def _read(self, key: str) -> tuple[Any, float] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, fetched_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), time.time() - row[1]
+
+    def _write(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO entries (key, value, fetched_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value=excluded.value, "
+                "fetched_at=excluded.fetched_at, refresh_claimed_at=NULL",
+                (key, json.dumps(value, default=str), time.time()),
+            )
+            self._conn.commit()
+
+    def _claim_refresh(self, key: str) -> bool:
+        """Claim the refresh of a stale entry so only one process re-fetches it."""
+        now = time.time()
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            claimed = self._conn.execute(
+                "UPDATE entries SET refresh_claimed_at = ? WHERE key = ? "
+                "AND (refresh_claimed_at IS NULL OR refresh_claimed_at < ?)",
+                (now, key, now - _REFRESH_LEASE),
+            ).rowcount
+            self._conn.commit()
+            if claimed:
+                self._refreshing.add(key)
+        return bool(claimed)
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Any]) -> None:
+        if not self._claim_refresh(key):
+            return
+
+        def refresh() -> None:
+            try:
+                self._write(key, fetch())
+                self._count("refreshes")
+            except Exception as exc:
+                # Keep serving the stale value; the claim expires and a later lookup retries
+                self._count("errors")
+                logger.warning("Salesforce cache refresh failed for %s: %r", key, exc)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(refresh)
+
+
+def _is_miss(value: Any) -> bool:
+    return value is None or value == {} or value == []
+
+
+_caches: dict[str, SalesforceCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_salesforce_cache(settings: SalesforceSettings) -> SalesforceCache:
+    """Get this process's handle on the shared cache file, one per path."""
+    path = str(settings.cache_path or _DEFAULT_DB_PATH)
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = SalesforceCache(
+                path, settings.cache_ttl, settings.cache_stale_ttl, settings.cache_miss_ttl
+            )
+        return _caches[path]
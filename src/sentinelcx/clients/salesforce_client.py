@@ -1,21 +1,53 @@
 """Salesforce API client wrapper using simple-salesforce."""
 
+from typing import Any, Callable
+
 from simple_salesforce import Salesforce
 
+from sentinelcx.clients.salesforce_cache import SalesforceCache, get_salesforce_cache
 from sentinelcx.config import SalesforceSettings
 
+# Records included in history summaries; the full lists stay one tool call away
+_SUMMARY_CASES = 10
+_SUMMARY_PURCHASES = 5
+_CASE_FIELDS = ("CaseNumber", "Subject", "Status", "Priority", "CreatedDate", "Resolution__c")
+_PURCHASE_FIELDS = ("Name", "Amount", "CloseDate")
+
 
 class SalesforceClient:
-    def __init__(self, settings: SalesforceSettings) -> None:
-        self._sf = Salesforce(
-            username=settings.username,
-            password=settings.password,
-            security_token=settings.security_token,
-            domain=settings.domain,
-        )
+    def __init__(self, settings: SalesforceSettings, cache: SalesforceCache | None = None) -> None:
+        if cache is None and settings.cache_enabled:
+            cache = get_salesforce_cache(settings)
+        self._cache = cache
+        if settings.instance_url:
+            self._sf = Salesforce(
+                instance_url=settings.instance_url, session_id=settings.session_id
+            )
+            if settings.instance_url.startswith("http://"):
+                # simple-salesforce always builds https URLs; allow plain http for local servers
+                self._sf.base_url = self._sf.base_url.replace("https://", "http://", 1)
+        else:
+            self._sf = Salesforce(
+                username=settings.username,
+                password=settings.password,
+                security_token=settings.security_token,
+                domain=settings.domain,
+            )
+
+    def cache_stats(self) -> dict | None:
+        """Hit counts of the shared lookup cache, or None when it is disabled."""
+        return self._cache.stats() if self._cache is not None else None
+
+    def _cached(self, key: str, fetch: Callable[[], Any]) -> Any:
+        if self._cache is None:
+            return fetch()
+        return self._cache.get_or_fetch(key, fetch)
 
     def get_customer(self, account_id: str) -> dict:
         """Fetch customer Account and related Contact info by account ID."""
+        return self._cached(f"customer:{account_id}", lambda: self._query_customer(account_id))
+
+    def _query_customer(self, account_id: str) -> dict:
         result = self._sf.query(
             f"SELECT Id, Name, Industry, Type, Phone, Website, Description "
             f"FROM Account WHERE Id = '{account_id}'"
@@ -35,6 +67,10 @@ class SalesforceClient:
         Searches the Contact object by FirstName and LastName, then fetches the
         parent Account. Returns empty dict if no match found.
         """
+        key = f"customer_by_name:{customer_name.strip().lower()}"
+        return self._cached(key, lambda: self._query_customer_by_name(customer_name))
+
+    def _query_customer_by_name(self, customer_name: str) -> dict:
         parts = customer_name.strip().split()
         if len(parts) < 2:
             return {}
@@ -61,6 +97,9 @@ class SalesforceClient:
 
     def get_case_history(self, account_id: str) -> list[dict]:
         """Fetch case/ticket history for a customer account."""
+        return self._cached(f"cases:{account_id}", lambda: self._query_case_history(account_id))
+
+    def _query_case_history(self, account_id: str) -> list[dict]:
         result = self._sf.query(
             f"SELECT Id, CaseNumber, Subject, Status, Priority, CreatedDate, ClosedDate, "
             f"Description, Resolution__c "
@@ -70,6 +109,11 @@ class SalesforceClient:
 
     def get_purchase_history(self, account_id: str) -> list[dict]:
         """Fetch purchase/opportunity history for a customer account."""
+        return self._cached(
+            f"purchases:{account_id}", lambda: self._query_purchase_history(account_id)
+        )
+
+    def _query_purchase_history(self, account_id: str) -> list[dict]:
         result = self._sf.query(
             f"SELECT Id, Name, Amount, StageName, CloseDate, Description "
             f"FROM Opportunity WHERE AccountId = '{account_id}' "
@@ -79,22 +123,46 @@ class SalesforceClient:
 
     def get_account_health(self, account_id: str) -> dict:
         """Compute account health score from case and opportunity data."""
-        cases = self.get_case_history(account_id)
-        purchases = self.get_purchase_history(account_id)
-
-        total_cases = len(cases)
-        closed_cases = sum(1 for c in cases if c.get("Status") == "Closed")
-        resolution_rate = closed_cases / total_cases if total_cases > 0 else 1.0
-        total_spent = sum(p.get("Amount", 0) or 0 for p in purchases)
-
-        # Simple health score: weighted combination
-        score = min(100.0, (resolution_rate * 50) + min(total_spent / 1000, 50))
-        churn_risk = "high" if score < 30 else "medium" if score < 60 else "low"
-
-        return {
-            "score": round(score, 1),
-            "churn_risk": churn_risk,
-            "lifetime_value": total_spent,
-            "total_cases": total_cases,
-            "resolution_rate": round(resolution_rate, 2),
-        }
+        return self._cached(
+            f"health:{account_id}", lambda: self._compute_account_health(account_id)
+        )
+
+    def _compute_account_health(self, account_id: str) -> dict:
+        return score_account_health(
+            self.get_case_history(account_id), self.get_purchase_history(account_id)
+        )
+
+
+def score_account_health(cases: list[dict], purchases: list[dict]) -> dict:
+    """Account health score and churn risk from case and purchase history."""
+    total_cases = len(cases)
+    closed_cases = sum(1 for c in cases if c.get("Status") == "Closed")
+    resolution_rate = closed_cases / total_cases if total_cases > 0 else 1.0
+    total_spent = sum(p.get("Amount", 0) or 0 for p in purchases)
+
+    # Simple health score: weighted combination
+    score = min(100.0, (resolution_rate * 50) + min(total_spent / 1000, 50))
+    churn_risk = "high" if score < 30 else "medium" if score < 60 else "low"
+
+    return {
+        "score": round(score, 1),
+        "churn_risk": churn_risk,
+        "lifetime_value": total_spent,
+        "total_cases": total_cases,
+        "resolution_rate": round(resolution_rate, 2),
+    }
+
+
+def summarize_history(cases: list[dict] | None, purchases: list[dict] | None) -> dict:
+    """The most recent cases and a purchase summary, as handed to agents."""
+    cases, purchases = cases or [], purchases or []
+    return {
+        "recent_cases": [{f: c.get(f) for f in _CASE_FIELDS} for c in cases[:_SUMMARY_CASES]],
+        "purchases": {
+            "count": len(purchases),
+            "total_amount": sum(p.get("Amount") or 0 for p in purchases),
+            "recent": [
+                {f: p.get(f) for f in _PURCHASE_FIELDS} for p in purchases[:_SUMMARY_PURCHASES]
+            ],
+        },
+    }
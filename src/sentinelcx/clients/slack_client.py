@@ -7,7 +7,7 @@ from sentinelcx.config import SlackSettings
 
 class SlackClient:
     def __init__(self, settings: SlackSettings) -> None:
-        self._client = AsyncWebClient(token=settings.bot_token)
+        self._client = AsyncWebClient(token=settings.bot_token, base_url=settings.base_url)
         self._escalation_channel = settings.escalation_channel
 
     async def post_message(self, channel: str, text: str, blocks: list | None = None) -> dict:
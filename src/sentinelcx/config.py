@@ -11,6 +11,17 @@ class SalesforceSettings(BaseSettings):
     password: str = ""
     security_token: str = ""
     domain: str = "login"
+    # Connect with an existing session instead of logging in (e.g. the local fake services)
+    instance_url: str = ""
+    session_id: str = ""
+    # Lookup cache shared by every process through a SQLite file (WAL mode)
+    cache_enabled: bool = False
+    cache_path: str = ""
+    # Seconds a result is fresh, then how much longer it is served while it is refreshed
+    cache_ttl: float = 300.0
+    cache_stale_ttl: float = 3600.0
+    # Seconds a lookup that found nothing is cached
+    cache_miss_ttl: float = 30.0
 
 
 class ChatwootSettings(BaseSettings):
@@ -27,12 +38,127 @@ class SlackSettings(BaseSettings):
     bot_token: str = ""
     signing_secret: str = ""
     escalation_channel: str = "#support-escalations"
+    base_url: str = "https://slack.com/api/"
 
 
 class KnowledgeBaseSettings(BaseSettings):
     knowledge_base_path: str = "./knowledge_base"
     embedding_model_name: str = "all-MiniLM-L6-v2"
     embedding_cache_dir: str = "./.embedding_cache"
+    # Nearest-neighbour backend built by the indexer: exact, ivf or hnsw (needs hnswlib)
+    ann_backend: str = "exact"
+    # Build and default search parameters, e.g. {"nlist": 1024, "nprobe": 16}
+    ann_params: dict[str, int] = Field(default_factory=dict)
+    # LRU entries of query text -> embedding and query + top_k + index build -> results
+    query_embedding_cache_size: int = 1024
+    search_result_cache_size: int = 1024
+    # Concurrent query encodes are batched: up to this many texts, waiting at most this long
+    encode_max_batch_size: int = 32
+    encode_max_wait_ms: float = 2.0
+
+
+class MCPSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="MCP_", env_file=".env", extra="ignore")
+
+    # "stdio" spawns fresh servers per ticket, "pooled" reuses long-lived HTTP servers,
+    # "in_process" serves the FastMCP servers from inside the API process
+    transport: str = "stdio"
+    pool_host: str = "127.0.0.1"
+    pool_base_port: int = 8710
+    pool_sizes: dict[str, int] = Field(
+        default_factory=lambda: {"chatwoot": 1, "salesforce": 1, "knowledge": 1, "slack": 1}
+    )
+    health_check_interval: float = 10.0
+    startup_timeout: float = 60.0
+    # Seconds a read tool's result is reused for identical arguments (0 disables)
+    tool_cache_ttl: float = 30.0
+    tool_cache_max_entries: int = 1024
+    # Unix datagram socket the servers push tool-call records to ("" disables).
+    # One process listens per path: with several API workers the first to bind
+    # it receives every worker's records, and the others run without a listener.
+    telemetry_socket: str = "/tmp/sentinelcx_mcp.sock"
+
+
+class SchedulerSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="SCHEDULER_", env_file=".env", extra="ignore")
+
+    workers: int = 4
+    max_queue_size: int = 100
+    # Seconds a new non-urgent ticket waits for more events on the same conversation before
+    # it may start; 0 starts tickets immediately (in-flight events still merge into a re-run)
+    coalesce_window: float = 0.0
+
+
+class FastTriageSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="FAST_TRIAGE_", env_file=".env", extra="ignore")
+
+    enabled: bool = False
+    # Calibrated confidence required to skip the LLM triage agent
+    threshold: float = 0.9
+    k: int = 7
+    temperature: float = 0.05
+    labeled_tickets_file: str = "evaluation_data/labeled_tickets.jsonl"
+    ground_truth_file: str = "evaluation_data/routing_ground_truth.jsonl"
+
+
+class OrchestratorSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="ORCHESTRATOR_", env_file=".env", extra="ignore")
+
+    # "llm": a top-level model delegates to sub-agents; "pipeline": routing runs in code
+    mode: str = "llm"
+    pipeline_stage_max_turns: int = 15
+    # Fetch ticket, conversation and customer context up front and hand it to sub-agents
+    prefetch_context: bool = True
+    prefetch_max_messages: int = 20
+    prefetch_timeout: float = 15.0
+    # Per-ticket limits; a run that hits one is cancelled and reported with the reason.
+    # 0 disables the deadline or cost budget.
+    ticket_deadline: float = 300.0
+    max_cost_usd: float = 2.0
+    max_turns: int = 25
+    # Turns allowed once the triage decision is known (post-triage stages in pipeline
+    # mode, the whole run in llm mode when fast-path triage decided up front)
+    turn_budget_auto_handle: int = 12
+    turn_budget_needs_research: int = 30
+    turn_budget_escalate: int = 15
+    # Reuse connected Claude CLI sessions across tickets instead of one process per query
+    session_pool: bool = False
+    session_pool_size: int = 8
+    session_max_tickets: int = 50
+    session_reset_timeout: float = 10.0
+
+
+class ModelPolicySettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="MODEL_", env_file=".env", extra="ignore")
+
+    # Model per agent (SDK aliases or full model IDs)
+    orchestrator: str = "sonnet"
+    triage: str = "sonnet"
+    research: str = "sonnet"
+    response: str = "sonnet"
+    escalation: str = "sonnet"
+    # Stronger model for the post-triage agents on risky tickets. Escalation is opt-in:
+    # 0 disables the confidence trigger and an empty list disables tier escalation.
+    escalated: str = "opus"
+    escalate_below_confidence: float = 0.0
+    # Comma-separated Salesforce tiers treated as VIP
+    vip_tiers: str = ""
+    escalate_agents: str = "research,response,escalation"
+
+
+class ReplaySettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="REPLAY_", env_file=".env", extra="ignore")
+
+    # "off", "record" (tee every SDK run to <directory>/<conversation_id>.jsonl) or
+    # "replay" (feed recordings back instead of starting the Claude CLI)
+    mode: str = "off"
+    directory: str = "recordings"
+    # Replay pacing relative to the recorded timing; 0 replays at full speed
+    speed: float = 0.0
+    # Replay tickets without a recording of their own from the recorded set
+    cycle: bool = False
+    # Still prefetch ticket context while replaying (needs reachable services, e.g. fakes)
+    prefetch: bool = False
 
 
 class Settings(BaseSettings):
@@ -43,3 +169,9 @@ class Settings(BaseSettings):
     chatwoot: ChatwootSettings = Field(default_factory=ChatwootSettings)
     slack: SlackSettings = Field(default_factory=SlackSettings)
     knowledge_base: KnowledgeBaseSettings = Field(default_factory=KnowledgeBaseSettings)
+    mcp: MCPSettings = Field(default_factory=MCPSettings)
+    scheduler: SchedulerSettings = Field(default_factory=SchedulerSettings)
+    fast_triage: FastTriageSettings = Field(default_factory=FastTriageSettings)
+    models: ModelPolicySettings = Field(default_factory=ModelPolicySettings)
+    orchestrator: OrchestratorSettings = Field(default_factory=OrchestratorSettings)
+    replay: ReplaySettings = Field(default_factory=ReplaySettings)
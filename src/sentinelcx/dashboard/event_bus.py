@@ -42,17 +42,22 @@ class DashboardMetrics:
     category_counts: dict[str, int] = field(default_factory=dict)
     confidence_sum: float = 0.0
     confidence_count: int = 0
+    # Turn/duration totals split by whether the context bundle was prefetched
+    prefetch_stats: dict[str, dict] = field(default_factory=dict)
+    # Runs stopped by a per-ticket limit, by reason; deadlines are also counted as timeouts
+    timeout_count: int = 0
+    limit_counts: dict[str, int] = field(default_factory=dict)
 
 
 class EventBus:
     """Singleton event bus with async pub/sub, bounded in-memory history, and SQLite persistence."""
 
-    def __init__(self, max_history: int = 100) -> None:
+    def __init__(self, max_history: int = 100, store: DashboardStore | None = None) -> None:
         self._subscribers: list[asyncio.Queue] = []
         self._history: deque[DashboardEvent] = deque(maxlen=max_history)
         self._active_tickets: dict[str, dict] = {}
         self.metrics = DashboardMetrics()
-        self._store = DashboardStore()
+        self._store = store or DashboardStore()
 
         # Rehydrate metrics from SQLite on startup
         stored = self._store.get_metrics()
@@ -140,11 +145,15 @@ class EventBus:
 
         elif event.type == EventType.TOOL_CALL:
             if cid in self._active_tickets:
+                # Records from MCP server telemetry arrive once the call has finished
+                status = "calling"
+                if "duration_ms" in event.data:
+                    status = "error" if event.data.get("error") else "done"
                 self._active_tickets[cid]["steps"].append(
                     {
                         "service": event.data.get("service"),
                         "tool": event.data.get("tool"),
-                        "status": "calling",
+                        "status": status,
                         "timestamp": event.timestamp,
                     }
                 )
@@ -182,6 +191,23 @@ class EventBus:
                 m.confidence_sum += confidence
                 m.confidence_count += 1
 
+            group = "prefetched" if event.data.get("prefetched") else "baseline"
+            stats = m.prefetch_stats.setdefault(
+                group, {"tickets": 0, "turns": 0, "duration_ms": 0.0, "prefetch_ms": 0.0}
+            )
+            # End-to-end time: the agent run plus the context prefetch before it
+            prefetch_ms = event.data.get("prefetch_ms") or 0
+            stats["tickets"] += 1
+            stats["turns"] += event.data.get("turns") or 0
+            stats["duration_ms"] += (event.data.get("duration_ms") or 0) + prefetch_ms
+            stats["prefetch_ms"] += prefetch_ms
+
+            limit_reason = event.data.get("limit_reason")
+            if limit_reason:
+                m.limit_counts[limit_reason] = m.limit_counts.get(limit_reason, 0) + 1
+                if limit_reason == "deadline":
+                    m.timeout_count += 1
+
         elif event.type == EventType.TICKET_ERROR:
             self._active_tickets.pop(cid, None)
 
@@ -0,0 +1,152 @@
+"""Per-ticket latency spans derived from the Agent SDK message stream.
+
+The orchestrator reports what it sees on the stream: a sub-agent starting
+(a ``Task`` tool use, or a pipeline stage), an MCP tool use, and the matching
+tool result, paired by ``tool_use_id``. Tool uses are attributed to the agent
+whose ``Task`` call is their ``parent_tool_use_id``. Wall times are taken when
+each message is received, so a tool span covers the CLI's round-trip to the
+MCP server as observed by the API process.
+"""
+
+import math
+import time
+from dataclasses import asdict, dataclass
+
+ORCHESTRATOR_AGENT = "orchestrator"
+
+
+@dataclass
+class Span:
+    conversation_id: str
+    kind: str  # "agent" or "tool"
+    name: str
+    agent: str
+    service: str = ""
+    tool_use_id: str = ""
+    started_at: float = 0.0
+    ended_at: float | None = None
+    status: str = "open"  # "ok", "error" or "incomplete"
+    cost_usd: float | None = None
+    model: str = ""
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.ended_at is None:
+            return None
+        return (self.ended_at - self.started_at) * 1000
+
+    def to_record(self) -> dict:
+        record = asdict(self)
+        record["duration_ms"] = self.duration_ms
+        return record
+
+
+class SpanTracker:
+    """Collects agent and tool spans for one ticket."""
+
+    def __init__(self, conversation_id: str) -> None:
+        self.conversation_id = conversation_id
+        self.spans: list[Span] = []
+        self._open: dict[str, Span] = {}
+        self._agent_by_task: dict[str, str] = {}
+        self._stage: str | None = None
+
+    def start_agent(self, name: str, tool_use_id: str = "", model: str = "") -> None:
+        """Open an agent span; ``tool_use_id`` is the delegating Task call, if any."""
+        span = Span(
+            conversation_id=self.conversation_id,
+            kind="agent",
+            name=name,
+            agent=name,
+            tool_use_id=tool_use_id,
+            started_at=time.time(),
+            model=model,
+        )
+        self.spans.append(span)
+        if tool_use_id:
+            self._agent_by_task[tool_use_id] = name
+            self._open[tool_use_id] = span
+        else:
+            # Pipeline stages run one at a time without a Task call
+            self._stage = name
+            self._open[f"stage:{name}"] = span
+
+    def end_agent(self, name: str, is_error: bool = False, cost_usd: float | None = None) -> None:
+        """Close a pipeline stage span opened with ``start_agent(name)``."""
+        span = self._open.pop(f"stage:{name}", None)
+        if span is not None:
+            self._close(span, is_error)
+            span.cost_usd = cost_usd
+        if self._stage == name:
+            self._stage = None
+
+    def record_model(self, parent_tool_use_id: str | None, model: str) -> None:
+        """Note the model that produced an assistant message on the agent's span.
+
+        Messages from a delegated sub-agent carry its Task call as
+        ``parent_tool_use_id``; pipeline stage messages have none and belong to
+        the current stage. The orchestrator's own messages are not recorded.
+        """
+        if parent_tool_use_id:
+            span = self._open.get(parent_tool_use_id)
+        else:
+            span = self._open.get(f"stage:{self._stage}") if self._stage else None
+        if span is not None and span.kind == "agent" and model:
+            span.model = model
+
+    def start_tool(
+        self, tool_use_id: str, service: str, tool: str, parent_tool_use_id: str | None = None
+    ) -> None:
+        """Open a tool span for an MCP (or built-in) tool use."""
+        agent = self._agent_by_task.get(parent_tool_use_id or "") or self._stage
+        span = Span(
+            conversation_id=self.conversation_id,
+            kind="tool",
+            name=tool,
+            agent=agent or ORCHESTRATOR_AGENT,
+            service=service,
+            tool_use_id=tool_use_id,
+            started_at=time.time(),
+        )
+        self.spans.append(span)
+        self._open[tool_use_id] = span
+
+    def end_tool(self, tool_use_id: str, is_error: bool | None = False) -> None:
+        """Close the span (tool or delegated agent) opened for ``tool_use_id``."""
+        span = self._open.pop(tool_use_id, None)
+        if span is not None:
+            self._close(span, bool(is_error))
+
+    def finish(self) -> list[Span]:
+        """Close anything still open as incomplete and return all spans."""
+        now = time.time()
+        for span in self._open.values():
+            span.ended_at = now
+            span.status = "incomplete"
+        self._open.clear()
+        self._stage = None
+        return self.spans
+
+    @staticmethod
+    def _close(span: Span, is_error: bool) -> None:
+        span.ended_at = time.time()
+        span.status = "error" if is_error else "ok"
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize_durations(durations: list[float]) -> dict:
+    ordered = sorted(durations)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(percentile(ordered, 0.50), 1),
+        "p95_ms": round(percentile(ordered, 0.95), 1),
+        "p99_ms": round(percentile(ordered, 0.99), 1),
+        "max_ms": round(ordered[-1], 1) if ordered else 0.0,
+    }
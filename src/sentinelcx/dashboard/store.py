@@ -5,6 +5,8 @@ import sqlite3
 import time
 from pathlib import Path
 
+from sentinelcx.dashboard.spans import Span, summarize_durations
+
 _DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent.parent / "dashboard.db"
 
 
@@ -37,18 +39,61 @@ class DashboardStore:
                 duration_ms REAL DEFAULT 0,
                 turns INTEGER DEFAULT 0,
                 success INTEGER DEFAULT 0,
+                prefetched INTEGER DEFAULT 0,
+                prefetch_ms REAL,
+                orchestrator_mode TEXT,
+                models TEXT,
+                model_escalation TEXT,
+                limit_reason TEXT,
                 created_at REAL NOT NULL,
                 completed_at REAL
             );
 
+            CREATE TABLE IF NOT EXISTS spans (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                conversation_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                name TEXT NOT NULL,
+                agent TEXT,
+                service TEXT,
+                tool_use_id TEXT,
+                started_at REAL NOT NULL,
+                ended_at REAL,
+                duration_ms REAL,
+                status TEXT,
+                cost_usd REAL,
+                model TEXT
+            );
+
             CREATE INDEX IF NOT EXISTS idx_events_cid ON events(conversation_id);
             CREATE INDEX IF NOT EXISTS idx_events_type ON events(type);
             CREATE INDEX IF NOT EXISTS idx_events_ts ON events(timestamp);
             CREATE INDEX IF NOT EXISTS idx_tickets_decision ON tickets(decision);
             CREATE INDEX IF NOT EXISTS idx_tickets_created ON tickets(created_at);
+            CREATE INDEX IF NOT EXISTS idx_spans_cid ON spans(conversation_id);
+            CREATE INDEX IF NOT EXISTS idx_spans_kind_started ON spans(kind, started_at);
         """)
+        self._ensure_columns(
+            "tickets",
+            {
+                "prefetched": "INTEGER DEFAULT 0",
+                "prefetch_ms": "REAL",
+                "orchestrator_mode": "TEXT",
+                "models": "TEXT",
+                "model_escalation": "TEXT",
+                "limit_reason": "TEXT",
+            },
+        )
+        self._ensure_columns("spans", {"model": "TEXT"})
         self._conn.commit()
 
+    def _ensure_columns(self, table: str, columns: dict[str, str]) -> None:
+        """Add columns introduced after a database was first created."""
+        existing = {r["name"] for r in self._conn.execute(f"PRAGMA table_info({table})")}
+        for name, ddl in columns.items():
+            if name not in existing:
+                self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+
     def save_event(
         self, event_type: str, conversation_id: str, timestamp: float, data: dict
     ) -> None:
@@ -64,8 +109,10 @@ class DashboardStore:
             """
             INSERT INTO tickets
                 (conversation_id, decision, category, priority, confidence,
-                 cost_usd, duration_ms, turns, success, created_at, completed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 cost_usd, duration_ms, turns, success, prefetched, prefetch_ms,
+                 orchestrator_mode, models, model_escalation, limit_reason,
+                 created_at, completed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(conversation_id) DO UPDATE SET
                 decision=excluded.decision,
                 category=excluded.category,
@@ -75,6 +122,12 @@ class DashboardStore:
                 duration_ms=excluded.duration_ms,
                 turns=excluded.turns,
                 success=excluded.success,
+                prefetched=excluded.prefetched,
+                prefetch_ms=excluded.prefetch_ms,
+                orchestrator_mode=excluded.orchestrator_mode,
+                models=excluded.models,
+                model_escalation=excluded.model_escalation,
+                limit_reason=excluded.limit_reason,
                 completed_at=excluded.completed_at
         """,
             (
@@ -87,12 +140,88 @@ class DashboardStore:
                 data.get("duration_ms", 0),
                 data.get("turns", 0),
                 1 if data.get("success") else 0,
+                1 if data.get("prefetched") else 0,
+                data.get("prefetch_ms"),
+                data.get("orchestrator_mode"),
+                json.dumps(data["models"]) if data.get("models") else None,
+                data.get("model_escalation"),
+                data.get("limit_reason"),
                 data.get("created_at", time.time()),
                 time.time(),
             ),
         )
         self._conn.commit()
 
+    def save_spans(self, spans: list[Span]) -> None:
+        """Persist a ticket's spans in one transaction."""
+        self._conn.executemany(
+            """
+            INSERT INTO spans
+                (conversation_id, kind, name, agent, service, tool_use_id,
+                 started_at, ended_at, duration_ms, status, cost_usd, model)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    span.conversation_id,
+                    span.kind,
+                    span.name,
+                    span.agent,
+                    span.service,
+                    span.tool_use_id,
+                    span.started_at,
+                    span.ended_at,
+                    span.duration_ms,
+                    span.status,
+                    span.cost_usd,
+                    span.model or None,
+                )
+                for span in spans
+            ],
+        )
+        self._conn.commit()
+
+    def get_ticket_spans(self, conversation_id: str) -> list[dict]:
+        """Get all spans for a specific ticket in start order."""
+        rows = self._conn.execute(
+            "SELECT * FROM spans WHERE conversation_id = ? ORDER BY started_at, id",
+            (conversation_id,),
+        ).fetchall()
+        return [dict(r) for r in rows]
+
+    def get_latency_stats(self, since: float | None = None) -> dict:
+        """Latency percentiles per agent, per agent and model, and per tool over completed spans."""
+        rows = self._conn.execute(
+            """
+            SELECT kind, name, agent, service, duration_ms, status, cost_usd, model FROM spans
+            WHERE status != 'incomplete' AND duration_ms IS NOT NULL AND started_at >= ?
+            """,
+            (since or 0,),
+        ).fetchall()
+
+        groups: dict[tuple[str, str], dict] = {}
+        for r in rows:
+            if r["kind"] == "agent":
+                keys = [("agents", r["name"])]
+                if r["model"]:
+                    keys.append(("models", f"{r['name']}:{r['model']}"))
+            else:
+                keys = [("tools", f"{r['service']}.{r['name']}")]
+            for key in keys:
+                group = groups.setdefault(key, {"durations": [], "errors": 0, "cost_usd": 0.0})
+                group["durations"].append(r["duration_ms"])
+                group["errors"] += r["status"] == "error"
+                group["cost_usd"] += r["cost_usd"] or 0.0
+
+        result: dict[str, dict] = {"agents": {}, "models": {}, "tools": {}}
+        for (section, key), group in sorted(groups.items()):
+            stats = summarize_durations(group["durations"])
+            stats["errors"] = group["errors"]
+            if section != "tools":
+                stats["cost_usd"] = round(group["cost_usd"], 4)
+            result[section][key] = stats
+        return result
+
     def get_metrics(self) -> dict:
         """Compute aggregate metrics from all stored tickets."""
         row = self._conn.execute(
@@ -122,6 +251,22 @@ class DashboardStore:
             "SELECT category, COUNT(*) as cnt FROM tickets WHERE category != '' GROUP BY category"
         ).fetchall()
 
+        prefetch_rows = self._conn.execute(
+            """
+            SELECT prefetched, COUNT(*) as tickets,
+                   COALESCE(SUM(turns), 0) as turns,
+                   COALESCE(SUM(duration_ms + COALESCE(prefetch_ms, 0)), 0) as duration_ms,
+                   COALESCE(SUM(prefetch_ms), 0) as prefetch_ms
+            FROM tickets GROUP BY prefetched
+            """
+        ).fetchall()
+
+        limit_rows = self._conn.execute(
+            "SELECT limit_reason, COUNT(*) as cnt FROM tickets "
+            "WHERE limit_reason IS NOT NULL GROUP BY limit_reason"
+        ).fetchall()
+        limit_counts = {r["limit_reason"]: r["cnt"] for r in limit_rows}
+
         return {
             "total_processed": row["total_processed"],
             "auto_handle_count": row["auto_handle_count"],
@@ -132,6 +277,17 @@ class DashboardStore:
             "confidence_sum": row["confidence_sum"],
             "confidence_count": row["confidence_count"],
             "category_counts": {r["category"]: r["cnt"] for r in category_rows},
+            "prefetch_stats": {
+                ("prefetched" if r["prefetched"] else "baseline"): {
+                    "tickets": r["tickets"],
+                    "turns": r["turns"],
+                    "duration_ms": r["duration_ms"],
+                    "prefetch_ms": r["prefetch_ms"],
+                }
+                for r in prefetch_rows
+            },
+            "timeout_count": limit_counts.get("deadline", 0),
+            "limit_counts": limit_counts,
         }
 
     def get_recent_events(self, limit: int = 100) -> list[dict]:
@@ -156,7 +312,10 @@ class DashboardStore:
             "SELECT * FROM tickets ORDER BY completed_at DESC LIMIT ? OFFSET ?",
             (limit, offset),
         ).fetchall()
-        return [dict(r) for r in rows]
+        tickets = [dict(r) for r in rows]
+        for ticket in tickets:
+            ticket["models"] = json.loads(ticket["models"]) if ticket.get("models") else None
+        return tickets
 
     def get_ticket_events(self, conversation_id: str) -> list[dict]:
         """Get all events for a specific ticket."""
@@ -0,0 +1,132 @@
+"""Listener for structured tool-call records pushed by the MCP servers."""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+from pathlib import Path
+
+from sentinelcx.config import Settings
+from sentinelcx.dashboard.event_bus import DashboardEvent, EventType, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+
+class _TelemetryProtocol(asyncio.DatagramProtocol):
+    def __init__(self, listener: "TelemetryListener") -> None:
+        self._listener = listener
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self._listener.handle(data)
+
+
+def _is_listening(path: Path) -> bool:
+    """True if a process is bound to the datagram socket at ``path``."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+class TelemetryListener:
+    """Receives tool-call records on a Unix datagram socket and publishes them.
+
+    Each record becomes a ``tool_call`` event on the ticket it names, carrying
+    the call's duration and error, so no log polling or parsing is needed.
+    """
+
+    def __init__(self, socket_path: str) -> None:
+        self.socket_path = Path(socket_path)
+        self._transport: asyncio.DatagramTransport | None = None
+        self._pending: set[asyncio.Task] = set()
+        self.received = 0
+        self.invalid = 0
+
+    @property
+    def running(self) -> bool:
+        return self._transport is not None
+
+    async def start(self) -> None:
+        """Bind the socket, replacing one left behind by an earlier process.
+
+        If another process is already listening on the path (e.g. a second API
+        worker), the socket is left to it and this listener stays stopped.
+        """
+        if self.running:
+            return
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                logger.warning(
+                    "MCP telemetry socket %s is in use by another process; "
+                    "not listening in this one",
+                    self.socket_path,
+                )
+                return
+            self.socket_path.unlink(missing_ok=True)
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _TelemetryProtocol(self),
+            local_addr=str(self.socket_path),
+            family=socket.AF_UNIX,
+        )
+        os.chmod(self.socket_path, 0o600)
+        logger.info("MCP telemetry listener started: %s", self.socket_path)
+
+    async def stop(self) -> None:
+        if self._transport is None:
+            return
+        self._transport.close()
+        self._transport = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        self.socket_path.unlink(missing_ok=True)
+        logger.info("MCP telemetry listener stopped")
+
+    def handle(self, data: bytes) -> None:
+        try:
+            record = json.loads(data)
+            event = DashboardEvent(
+                type=EventType.TOOL_CALL,
+                conversation_id=str(record.get("conversation_id") or "unknown"),
+                timestamp=float(record["timestamp"]),
+                data={
+                    "tool_use_id": f"mcp_{record['service']}_{record['tool']}",
+                    "service": record["service"],
+                    "tool": record["tool"],
+                    "duration_ms": record.get("duration_ms"),
+                    "error": record.get("error"),
+                    "source": "mcp",
+                },
+            )
+        except (ValueError, KeyError, TypeError) as exc:
+            self.invalid += 1
+            logger.warning("Ignoring malformed telemetry record: %r", exc)
+            return
+        self.received += 1
+        task = asyncio.create_task(get_event_bus().publish(event))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def stats(self) -> dict:
+        return {
+            "socket": str(self.socket_path),
+            "running": self.running,
+            "received": self.received,
+            "invalid": self.invalid,
+        }
+
+
+_listener: TelemetryListener | None = None
+
+
+def get_telemetry_listener(settings: Settings | None = None) -> TelemetryListener:
+    """Get the global telemetry listener instance."""
+    global _listener
+    if _listener is None:
+        _listener = TelemetryListener((settings or Settings()).mcp.telemetry_socket)
+    return _listener
@@ -5,6 +5,7 @@ import logging
 from collections import defaultdict
 from pathlib import Path
 
+from sentinelcx.agents.fast_triage import FastTriageClassifier, load_labeled_examples
 from sentinelcx.config import Settings
 from sentinelcx.orchestrator import SentinelCXOrchestrator
 
@@ -129,3 +130,78 @@ async def evaluate_routing_accuracy(
     metrics["total_ground_truth"] = len(ground_truth)
 
     return metrics
+
+
+def _field_accuracy(pairs: list[tuple], field: str) -> float:
+    """Share of (prediction, example) pairs whose predicted field matches the label."""
+    if not pairs:
+        return 0.0
+    return round(sum(getattr(p, field) == ex[field] for p, ex in pairs) / len(pairs), 3)
+
+
+def evaluate_fast_triage_accuracy(
+    settings: Settings,
+    thresholds: tuple[float, ...] = (0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.95),
+    folds: int = 5,
+) -> dict:
+    """Evaluate the local k-NN triage classifier against routing ground truth.
+
+    Every labeled ticket is predicted by ``folds``-fold cross-validation, with
+    confidence calibration fitted inside each fold so the held-out tickets never
+    score their own calibration. For each confidence threshold, reports coverage
+    (share of tickets that would skip the LLM triage agent) and accuracy on those
+    tickets, so the threshold in ``FAST_TRIAGE_THRESHOLD`` can be tuned.
+    """
+    cfg = settings.fast_triage
+    for path in (cfg.labeled_tickets_file, cfg.ground_truth_file):
+        if not Path(path).exists():
+            return {"error": f"Evaluation file not found: {path}"}
+
+    examples = load_labeled_examples(cfg.labeled_tickets_file, cfg.ground_truth_file)
+    classifier = FastTriageClassifier(settings)
+    classifier.fit(examples)
+    predictions = classifier.cross_validate(folds)
+
+    ground_truth = [
+        {
+            "ticket_id": ex["id"],
+            "expected_category": ex["category"],
+            "expected_decision": ex["decision"],
+        }
+        for ex in examples
+    ]
+
+    sweep = []
+    for threshold in thresholds:
+        covered = [(p, ex) for p, ex in zip(predictions, examples) if p.confidence >= threshold]
+        n = len(covered)
+        row = {
+            "threshold": threshold,
+            "coverage": round(n / len(examples), 3) if examples else 0.0,
+            "covered": n,
+            "category_accuracy": _field_accuracy(covered, "category"),
+            "priority_accuracy": _field_accuracy(covered, "priority"),
+            "decision_accuracy": _field_accuracy(covered, "decision"),
+        }
+        sweep.append(row)
+        logger.info(
+            "Fast triage threshold=%.2f: coverage=%.1f%% decision_acc=%.3f category_acc=%.3f",
+            threshold,
+            row["coverage"] * 100,
+            row["decision_accuracy"],
+            row["category_accuracy"],
+        )
+
+    all_predictions = [
+        {
+            "ticket_id": ex["id"],
+            "predicted_category": p.category,
+            "predicted_decision": p.decision,
+        }
+        for p, ex in zip(predictions, examples)
+    ]
+    metrics = _compute_metrics(all_predictions, ground_truth)
+    metrics["threshold_sweep"] = sweep
+    metrics["configured_threshold"] = cfg.threshold
+    metrics["total_evaluated"] = len(examples)
+    return metrics
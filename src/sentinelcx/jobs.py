@@ -0,0 +1,213 @@
+"""Asynchronous ticket-processing jobs persisted in SQLite.
+
+Submitting a job queues the conversation on the shared scheduler and returns
+immediately with a job ID; clients poll ``GET /api/v1/jobs/{id}`` or follow
+``GET /api/v1/jobs/{id}/events`` instead of holding a connection open for the
+whole run. Job rows survive restarts: jobs still queued when the process
+stopped are re-submitted on startup, while jobs that were already running are
+marked failed, since re-running them could send the customer a second reply.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+
+from sentinelcx.config import Settings
+from sentinelcx.scheduler import TicketScheduler, get_ticket_scheduler
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent / "jobs.db"
+
+TERMINAL_STATUSES = ("succeeded", "failed", "cancelled")
+
+
+class JobStore:
+    """SQLite persistence for job status and results."""
+
+    def __init__(self, db_path: str | Path | None = None) -> None:
+        self._conn = sqlite3.connect(str(db_path or _DEFAULT_DB_PATH), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                conversation_id TEXT NOT NULL,
+                priority TEXT,
+                status TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+            CREATE INDEX IF NOT EXISTS idx_jobs_cid ON jobs(conversation_id);
+        """)
+        self._conn.commit()
+
+    def create(self, job_id: str, conversation_id: str, priority: str | None) -> None:
+        self._conn.execute(
+            "INSERT INTO jobs (id, conversation_id, priority, status, created_at) "
+            "VALUES (?, ?, ?, 'queued', ?)",
+            (job_id, conversation_id, priority, time.time()),
+        )
+        self._conn.commit()
+
+    def mark_running(self, job_ids: list[str]) -> None:
+        self._conn.executemany(
+            "UPDATE jobs SET status = 'running', started_at = ? WHERE id = ? AND status = 'queued'",
+            [(time.time(), job_id) for job_id in job_ids],
+        )
+        self._conn.commit()
+
+    def finish(
+        self, job_id: str, status: str, result: dict | None = None, error: str | None = None
+    ) -> None:
+        self._conn.execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+            (
+                status,
+                json.dumps(result, default=str) if result is not None else None,
+                error,
+                time.time(),
+                job_id,
+            ),
+        )
+        self._conn.commit()
+
+    def get(self, job_id: str) -> dict | None:
+        row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def list_by_status(self, *statuses: str) -> list[dict]:
+        rows = self._conn.execute(
+            f"SELECT * FROM jobs WHERE status IN ({', '.join('?' * len(statuses))}) "
+            "ORDER BY created_at",
+            statuses,
+        ).fetchall()
+        return [dict(r) for r in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class JobManager:
+    """Maps jobs onto scheduler futures and records their lifecycle."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        store: JobStore | None = None,
+        scheduler: TicketScheduler | None = None,
+    ) -> None:
+        self._store = store or JobStore()
+        self._scheduler = scheduler or get_ticket_scheduler(settings)
+        # Coalesced submissions share a scheduler future, so one run can finish several jobs
+        self._jobs_by_future: dict[asyncio.Future, list[str]] = {}
+        self._future_by_job: dict[str, asyncio.Future] = {}
+        self._stopping = False
+        self._scheduler.add_start_listener(self._on_start)
+
+    @property
+    def store(self) -> JobStore:
+        return self._store
+
+    async def start(self) -> None:
+        """Recover jobs left over from a previous process."""
+        for job in self._store.list_by_status("running"):
+            self._store.finish(job["id"], "failed", error="Interrupted by server restart")
+        requeued = 0
+        for job in self._store.list_by_status("queued"):
+            try:
+                self._track(
+                    job["id"], self._scheduler.submit(job["conversation_id"], job["priority"])
+                )
+                requeued += 1
+            except Exception as exc:
+                self._store.finish(job["id"], "failed", error=f"Could not re-queue: {exc}")
+        if requeued:
+            logger.info("Re-queued %d jobs from a previous run", requeued)
+
+    def stop(self) -> None:
+        """Detach from the scheduler before it shuts down.
+
+        The scheduler cancels pending futures on stop; leaving those rows as
+        ``queued``/``running`` lets the next ``start()`` recover them.
+        """
+        self._stopping = True
+
+    def submit(self, conversation_id: str, priority: str | None = None) -> dict:
+        """Queue a conversation and return the new job.
+
+        Raises ``QueueFullError`` (without creating a job) when the scheduler
+        is at capacity.
+        """
+        future = self._scheduler.submit(conversation_id, priority)
+        job_id = uuid.uuid4().hex
+        self._store.create(job_id, conversation_id, priority)
+        self._track(job_id, future)
+        logger.info("Created job %s for conversation %s", job_id, conversation_id)
+        return self._store.get(job_id)
+
+    def get(self, job_id: str) -> dict | None:
+        return self._store.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> dict | None:
+        """Wait up to ``timeout`` seconds for a tracked job to finish; return its row.
+
+        A timeout or a failed job just returns the current row; cancelling the
+        caller propagates without cancelling the job.
+        """
+        future = self._future_by_job.get(job_id)
+        if future is not None:
+            # Unlike wait_for, asyncio.wait neither raises the job's own error nor cancels it
+            await asyncio.wait({future}, timeout=timeout)
+            # Let the done callback record the outcome
+            await asyncio.sleep(0)
+        return self._store.get(job_id)
+
+    def _track(self, job_id: str, future: asyncio.Future) -> None:
+        self._future_by_job[job_id] = future
+        if future not in self._jobs_by_future:
+            self._jobs_by_future[future] = []
+            future.add_done_callback(self._on_done)
+        self._jobs_by_future[future].append(job_id)
+
+    def _on_start(self, conversation_id: str, future: asyncio.Future) -> None:
+        job_ids = self._jobs_by_future.get(future)
+        if job_ids:
+            self._store.mark_running(job_ids)
+
+    def _on_done(self, future: asyncio.Future) -> None:
+        if self._stopping:
+            return
+        for job_id in self._jobs_by_future.pop(future, []):
+            self._future_by_job.pop(job_id, None)
+            if future.cancelled():
+                self._store.finish(job_id, "cancelled")
+            elif future.exception() is not None:
+                self._store.finish(job_id, "failed", error=str(future.exception()))
+            else:
+                result = future.result()
+                status = "succeeded" if result.get("success") else "failed"
+                self._store.finish(job_id, status, result=result)
+
+
+_manager: JobManager | None = None
+
+
+def get_job_manager(settings: Settings | None = None) -> JobManager:
+    """Get the global job manager instance."""
+    global _manager
+    if _manager is None:
+        _manager = JobManager(settings or Settings())
+    return _manager
@@ -0,0 +1,252 @@
+"""Nearest-neighbour backends for the knowledge index.
+
+All backends search unit-length vectors by inner product (cosine similarity):
+
+* ``exact`` scores every vector with one matrix multiply. Best for small
+  knowledge bases and the reference for measuring recall.
+* ``ivf`` is a pure-NumPy inverted file. Spherical k-means splits the vectors
+  into ``nlist`` lists, and a query scores only the vectors of its ``nprobe``
+  closest lists.
+* ``hnsw`` is a graph index built with the optional ``hnswlib`` package
+  (``pip install 'sentinelcx[ann]'``). ``ef_search`` trades speed for recall.
+
+Build parameters are chosen when the index is written and recorded in its
+header. The search parameters stored there (``nprobe``, ``ef_search``) are the
+defaults and can be changed on a loaded index, e.g. to sweep the recall and
+latency operating points.
+"""
+
+import math
+import threading
+from pathlib import Path
+
+import numpy as np
+
+ANN_BACKENDS = ("exact", "ivf", "hnsw")
+
+# k-means is trained on at most this many vectors per list
+_TRAIN_PER_LIST = 64
+# Rows scored against the centroids at once when assigning vectors to lists
+_ASSIGN_BATCH = 16384
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Row indices of the ``k`` highest scores in each column, best first.
+
+    ``argpartition`` finds the top ``k`` in linear time; only those are sorted.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty((0, scores.shape[1]), dtype=np.intp)
+    top = np.argpartition(-scores, k - 1, axis=0)[:k]
+    order = np.argsort(-np.take_along_axis(scores, top, axis=0), axis=0, kind="stable")
+    return np.take_along_axis(top, order, axis=0)
+
+
+def recall_at_k(exact: list[np.ndarray], approximate: list[np.ndarray], k: int) -> float:
+    """Fraction of the exact top ``k`` ids that the approximate search also returned."""
+    found = total = 0
+    for truth, got in zip(exact, approximate):
+        truth = set(truth[:k].tolist())
+        found += len(truth & set(got[:k].tolist()))
+        total += len(truth)
+    return found / total if total else 1.0
+
+
+class ExactIndex:
+    """Brute-force search: every vector is scored."""
+
+    backend = "exact"
+    files: tuple[str, ...] = ()
+
+    def __init__(self, vectors: np.ndarray) -> None:
+        self.vectors = vectors
+
+    @classmethod
+    def build(cls, directory: Path, vectors: np.ndarray, params: dict) -> dict:
+        return {}
+
+    @classmethod
+    def load(cls, directory: Path, vectors: np.ndarray, params: dict) -> "ExactIndex":
+        return cls(vectors)
+
+    @property
+    def params(self) -> dict:
+        return {}
+
+    def search(self, queries: np.ndarray, k: int) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Ids and scores of the ``k`` best vectors for each query, best first."""
+        scores = self.vectors @ queries.T
+        ids = top_k(scores, k)
+        best = np.take_along_axis(scores, ids, axis=0)
+        return [(ids[:, q], best[:, q]) for q in range(len(queries))]
+
+
+class IVFIndex(ExactIndex):
+    """Inverted file over spherical k-means lists; only ``nprobe`` lists are scanned."""
+
+    backend = "ivf"
+    files = ("ivf.centroids.npy", "ivf.ids.npy", "ivf.offsets.npy")
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        centroids: np.ndarray,
+        ids: np.ndarray,
+        offsets: np.ndarray,
+        nprobe: int,
+    ) -> None:
+        super().__init__(vectors)
+        self.centroids = centroids
+        # Vector ids grouped by list; list i is ids[offsets[i]:offsets[i + 1]]
+        self._ids = ids
+        self._offsets = offsets
+        self.nprobe = nprobe
+
+    @classmethod
+    def build(cls, directory: Path, vectors: np.ndarray, params: dict) -> dict:
+        count = len(vectors)
+        nlist = int(params.get("nlist") or round(4 * math.sqrt(count)))
+        nlist = max(1, min(nlist, count))
+        nprobe = max(1, min(int(params.get("nprobe", 8)), nlist))
+        iterations = int(params.get("iterations", 10))
+        seed = int(params.get("seed", 0))
+
+        centroids = _train_kmeans(vectors, nlist, iterations, seed)
+        assignments = _assign(vectors, centroids)
+        ids = np.argsort(assignments, kind="stable").astype(np.int64)
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(assignments, minlength=nlist))
+
+        for name, array in zip(cls.files, (centroids, ids, offsets)):
+            with open(directory / f"{name}.tmp", "wb") as f:
+                np.save(f, array)
+        return {"nlist": nlist, "nprobe": nprobe, "iterations": iterations, "seed": seed}
+
+    @classmethod
+    def load(cls, directory: Path, vectors: np.ndarray, params: dict) -> "IVFIndex":
+        centroids, ids, offsets = (np.load(directory / name, mmap_mode="r") for name in cls.files)
+        return cls(vectors, np.asarray(centroids), ids, offsets, int(params["nprobe"]))
+
+    @property
+    def params(self) -> dict:
+        return {"nlist": len(self.centroids), "nprobe": self.nprobe}
+
+    def search(self, queries: np.ndarray, k: int) -> list[tuple[np.ndarray, np.ndarray]]:
+        probes = top_k(self.centroids @ queries.T, max(1, self.nprobe))
+        results = []
+        for q, query in enumerate(queries):
+            lists = [self._ids[self._offsets[i] : self._offsets[i + 1]] for i in probes[:, q]]
+            # Sorted ids read the memory-mapped vectors front to back
+            candidates = np.sort(np.concatenate(lists))
+            scores = self.vectors[candidates] @ query
+            best = top_k(scores[:, None], k)[:, 0]
+            results.append((candidates[best], scores[best]))
+        return results
+
+
+class HNSWIndex(ExactIndex):
+    """Hierarchical navigable small world graph from ``hnswlib``.
+
+    Unlike the other backends, the graph and a copy of the vectors are loaded
+    into each process's memory.
+    """
+
+    backend = "hnsw"
+    files = ("hnsw.bin",)
+
+    def __init__(self, vectors: np.ndarray, graph, ef_search: int) -> None:
+        super().__init__(vectors)
+        self._graph = graph
+        self.ef_search = ef_search
+        # hnswlib's ef is index-wide state; set it and query under one lock
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, directory: Path, vectors: np.ndarray, params: dict) -> dict:
+        hnswlib = _import_hnswlib()
+        m = int(params.get("M", 16))
+        ef_construction = int(params.get("ef_construction", 200))
+        ef_search = int(params.get("ef_search", 64))
+        seed = int(params.get("seed", 0))
+
+        graph = hnswlib.Index(space="ip", dim=vectors.shape[1])
+        graph.init_index(
+            max_elements=len(vectors), M=m, ef_construction=ef_construction, random_seed=seed
+        )
+        graph.add_items(vectors, np.arange(len(vectors)))
+        graph.save_index(str(directory / f"{cls.files[0]}.tmp"))
+        return {"M": m, "ef_construction": ef_construction, "ef_search": ef_search, "seed": seed}
+
+    @classmethod
+    def load(cls, directory: Path, vectors: np.ndarray, params: dict) -> "HNSWIndex":
+        hnswlib = _import_hnswlib()
+        graph = hnswlib.Index(space="ip", dim=vectors.shape[1])
+        graph.load_index(str(directory / cls.files[0]), max_elements=len(vectors))
+        return cls(vectors, graph, int(params["ef_search"]))
+
+    @property
+    def params(self) -> dict:
+        return {"ef_search": self.ef_search}
+
+    def search(self, queries: np.ndarray, k: int) -> list[tuple[np.ndarray, np.ndarray]]:
+        k = min(k, len(self.vectors))
+        if k <= 0:
+            return [(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))] * len(queries)
+        with self._lock:
+            self._graph.set_ef(max(self.ef_search, k))
+            labels, distances = self._graph.knn_query(queries, k=k)
+        # The "ip" space reports 1 - inner product
+        return [(labels[q].astype(np.int64), 1 - distances[q]) for q in range(len(queries))]
+
+
+_BACKENDS: dict[str, type[ExactIndex]] = {
+    cls.backend: cls for cls in (ExactIndex, IVFIndex, HNSWIndex)
+}
+
+
+def get_backend(name: str) -> type[ExactIndex]:
+    """The backend class registered as ``name``."""
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown ANN backend {name!r}, expected one of {', '.join(ANN_BACKENDS)}")
+    return _BACKENDS[name]
+
+
+def _import_hnswlib():
+    try:
+        import hnswlib
+    except ImportError as exc:
+        raise ImportError("The hnsw backend needs hnswlib: pip install 'sentinelcx[ann]'") from exc
+    return hnswlib
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the closest centroid for every vector, in bounded-size batches."""
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _ASSIGN_BATCH):
+        batch = np.asarray(vectors[start : start + _ASSIGN_BATCH])
+        assignments[start : start + len(batch)] = np.argmax(batch @ centroids.T, axis=1)
+    return assignments
+
+
+def _train_kmeans(vectors: np.ndarray, nlist: int, iterations: int, seed: int) -> np.ndarray:
+    """Unit-length centroids of ``nlist`` spherical k-means clusters."""
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(vectors), nlist * _TRAIN_PER_LIST)
+    sample = np.asarray(vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))])
+    centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+    for _ in range(iterations):
+        labels = _assign(sample, centroids)
+        order = np.argsort(labels, kind="stable")
+        counts = np.bincount(labels, minlength=nlist)
+        filled = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+        sums = np.add.reduceat(sample[order], starts, axis=0)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids[filled] = sums / np.where(norms == 0, 1, norms)
+        # Restart empty lists from random sample vectors
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            centroids[empty] = sample[rng.choice(sample_size, len(empty), replace=False)]
+    return centroids.astype(np.float32)
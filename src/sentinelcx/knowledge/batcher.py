@@ -0,0 +1,139 @@
+"""Micro-batching of concurrent embedding requests.
+
+Searches from different tickets arrive at the knowledge server concurrently.
+Encoding each query on its own runs one SentenceTransformer forward pass per
+query, and the passes compete for the same CPU threads. ``EmbeddingBatcher``
+collects the texts of concurrent requests for up to ``max_wait_ms`` (or until
+``max_batch_size`` texts are waiting), encodes them in one batched pass on a
+dedicated worker thread, and hands each caller its own rows.
+
+While a batch is encoding, new requests queue up and form the next batch, so
+under load the batches grow by themselves without extra waiting.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent ``encode`` calls into batched calls of ``encode_batch``."""
+
+    def __init__(
+        self,
+        encode_batch: Callable[[list[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        self._encode_batch = encode_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        # Requests waiting for a batch: (texts, future), oldest first
+        self._pending: deque[tuple[list[str], asyncio.Future]] = deque()
+        self._pending_texts = 0
+        self._arrived = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # One encode at a time; the model parallelizes a batch internally
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kb-encode")
+        self.batches = 0
+        self.requests = 0
+        self.texts = 0
+
+    async def encode(self, texts: list[str]) -> np.ndarray:
+        """Embeddings of ``texts``, one row each, encoded together with concurrent callers."""
+        if not texts:
+            raise ValueError("encode() needs at least one text")
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            # Requests queued on another (closed) loop can never be answered
+            self._pending.clear()
+            self._pending_texts = 0
+            self._arrived = asyncio.Event()
+            self._loop = loop
+            self._worker = loop.create_task(self._run())
+        future = loop.create_future()
+        self._pending.append((list(texts), future))
+        self._pending_texts += len(texts)
+        self._arrived.set()
+        return await future
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "batches": self.batches,
+            "requests": self.requests,
+            "texts": self.texts,
+            "mean_batch_size": round(self.texts / self.batches, 2) if self.batches else 0.0,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            while not self._pending:
+                self._arrived.clear()
+                await self._arrived.wait()
+            await self._fill()
+            batch = self._take_batch()
+            await self._encode(batch)
+
+    async def _fill(self) -> None:
+        """Wait up to ``max_wait_ms`` for more requests, unless a full batch is waiting."""
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while self._pending_texts < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._arrived.clear()
+            try:
+                await asyncio.wait_for(self._arrived.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
+
+    def _take_batch(self) -> list[tuple[list[str], asyncio.Future]]:
+        """The oldest requests, up to ``max_batch_size`` texts (at least one request)."""
+        batch = [self._pending.popleft()]
+        size = len(batch[0][0])
+        while self._pending and size + len(self._pending[0][0]) <= self.max_batch_size:
+            batch.append(self._pending.popleft())
+            size += len(batch[-1][0])
+        self._pending_texts -= size
+        return batch
+
+    async def _encode(self, batch: list[tuple[list[str], asyncio.Future]]) -> None:
+        texts = [text for request_texts, _ in batch for text in request_texts]
+        try:
+            embeddings = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._encode_batch, texts
+            )
+        except Exception as exc:
+            logger.warning("Batched encode of %d texts failed: %r", len(texts), exc)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        self.batches += 1
+        self.requests += len(batch)
+        self.texts += len(texts)
+        start = 0
+        for request_texts, future in batch:
+            end = start + len(request_texts)
+            # A caller cancelled while waiting no longer wants its rows
+            if not future.done():
+                future.set_result(embeddings[start:end])
+            start = end
@@ -0,0 +1,65 @@
+"""Bounded LRU caches for knowledge search.
+
+Agents on different tickets keep asking the same questions ("refund policy",
+"reset password"). ``KnowledgeSearch`` keeps two caches so a repeat skips work:
+query text to its embedding, which saves the SentenceTransformer forward pass,
+and query plus ``k`` plus index build to the nearest chunks, which also saves
+the index scan.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+def normalize_query(query: str) -> str:
+    """Cache key of a query: case-folded, with runs of whitespace collapsed."""
+    return " ".join(query.casefold().split())
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry past ``max_entries``."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Sync MCP tools run on worker threads
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+        return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
@@ -0,0 +1,174 @@
+"""On-disk format of the knowledge base embedding index.
+
+An index directory holds:
+
+* ``index.json`` -- header: format version, embedding model, dimension, chunk
+  count and a build id that changes on every rebuild;
+* ``vectors.npy`` -- ``(count, dimension)`` float32 vectors, L2-normalized so
+  cosine similarity is a plain dot product;
+* ``metadata.jsonl`` -- one JSON object per chunk (text, source file, heading);
+* ``metadata.offsets.npy`` -- ``count + 1`` int64 byte offsets into
+  ``metadata.jsonl``, so a chunk's metadata is read without parsing the rest;
+* the files of the nearest-neighbour backend named in the header, if any
+  (see ``sentinelcx.knowledge.ann``).
+
+Readers memory-map the vectors and metadata, so every MCP server process on a
+host shares one copy of the pages instead of loading the whole index. The
+header is written last: a directory without one has no complete index.
+"""
+
+import json
+import mmap
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from sentinelcx.knowledge.ann import ANN_BACKENDS, ExactIndex, get_backend
+
+INDEX_FORMAT_VERSION = 2
+
+HEADER_FILE = "index.json"
+VECTORS_FILE = "vectors.npy"
+METADATA_FILE = "metadata.jsonl"
+OFFSETS_FILE = "metadata.offsets.npy"
+
+
+class IndexFormatError(ValueError):
+    """The index on disk is missing, incomplete, or from an incompatible version."""
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Float32 copy of ``vectors`` scaled to unit L2 norm along the last axis."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def write_index(
+    directory: Path,
+    model_name: str,
+    embeddings: np.ndarray,
+    metadata: list[dict],
+    ann_backend: str = "exact",
+    ann_params: dict | None = None,
+) -> dict:
+    """Write a complete index to ``directory``, replacing any earlier one; returns the header.
+
+    ``ann_params`` are the build (and default search) parameters of ``ann_backend``;
+    the ones actually used, defaults included, are recorded in the header.
+    """
+    backend = get_backend(ann_backend)
+    directory.mkdir(parents=True, exist_ok=True)
+    vectors = normalize(embeddings)
+    count, dimension = vectors.shape
+
+    tmp_vectors = directory / f"{VECTORS_FILE}.tmp"
+    with open(tmp_vectors, "wb") as f:
+        np.save(f, vectors)
+
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    tmp_metadata = directory / f"{METADATA_FILE}.tmp"
+    with open(tmp_metadata, "wb") as f:
+        for i, meta in enumerate(metadata):
+            f.write(json.dumps(meta, ensure_ascii=False).encode() + b"\n")
+            offsets[i + 1] = f.tell()
+    tmp_offsets = directory / f"{OFFSETS_FILE}.tmp"
+    with open(tmp_offsets, "wb") as f:
+        np.save(f, offsets)
+
+    params = backend.build(directory, vectors, dict(ann_params or {}))
+
+    header = {
+        "format_version": INDEX_FORMAT_VERSION,
+        "model": model_name,
+        "dimension": int(dimension),
+        "count": int(count),
+        "ann": {"backend": backend.backend, "params": params},
+        "build_id": uuid.uuid4().hex,
+        "created_at": time.time(),
+    }
+    # Drop the header first so readers never pair it with half-replaced files
+    (directory / HEADER_FILE).unlink(missing_ok=True)
+    os.replace(tmp_vectors, directory / VECTORS_FILE)
+    os.replace(tmp_metadata, directory / METADATA_FILE)
+    os.replace(tmp_offsets, directory / OFFSETS_FILE)
+    for name in backend.files:
+        os.replace(directory / f"{name}.tmp", directory / name)
+    # Files of a backend the index no longer uses
+    for other in ANN_BACKENDS:
+        if other != backend.backend:
+            for name in get_backend(other).files:
+                (directory / name).unlink(missing_ok=True)
+    tmp_header = directory / f"{HEADER_FILE}.tmp"
+    tmp_header.write_text(json.dumps(header, indent=2))
+    os.replace(tmp_header, directory / HEADER_FILE)
+    return header
+
+
+def read_header(directory: Path) -> dict:
+    """The header of the index in ``directory``."""
+    path = directory / HEADER_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"Index not found at {directory}. Run the indexer first.")
+    header = json.loads(path.read_text())
+    if header.get("format_version") != INDEX_FORMAT_VERSION:
+        raise IndexFormatError(
+            f"Index at {directory} has format version {header.get('format_version')}, "
+            f"expected {INDEX_FORMAT_VERSION}. Re-run the indexer."
+        )
+    return header
+
+
+@dataclass
+class MappedIndex:
+    """A read-only, memory-mapped index."""
+
+    header: dict
+    vectors: np.ndarray
+    ann: ExactIndex
+    _offsets: np.ndarray
+    _metadata: mmap.mmap | bytes
+
+    @property
+    def build_id(self) -> str:
+        return self.header["build_id"]
+
+    def __len__(self) -> int:
+        return self.header["count"]
+
+    def metadata(self, idx: int) -> dict:
+        start, end = int(self._offsets[idx]), int(self._offsets[idx + 1])
+        return json.loads(self._metadata[start:end])
+
+
+def open_index(directory: Path, model_name: str | None = None) -> MappedIndex:
+    """Memory-map the index in ``directory``, checking it was built with ``model_name``."""
+    header = read_header(directory)
+    if model_name is not None and header["model"] != model_name:
+        raise IndexFormatError(
+            f"Index at {directory} was built with {header['model']!r}, not {model_name!r}. "
+            "Re-run the indexer."
+        )
+    vectors = np.load(directory / VECTORS_FILE, mmap_mode="r")
+    offsets = np.load(directory / OFFSETS_FILE, mmap_mode="r")
+    if vectors.shape != (header["count"], header["dimension"]) or len(offsets) != len(vectors) + 1:
+        raise IndexFormatError(f"Index at {directory} does not match its header.")
+
+    with open(directory / METADATA_FILE, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        # mmap cannot map an empty file
+        metadata = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    ann = header.get("ann", {})
+    backend = get_backend(ann.get("backend", "exact"))
+    return MappedIndex(
+        header=header,
+        vectors=vectors,
+        ann=backend.load(directory, vectors, ann.get("params", {})),
+        _offsets=offsets,
+        _metadata=metadata,
+    )
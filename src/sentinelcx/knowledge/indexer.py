@@ -1,13 +1,13 @@
 """Knowledge base indexer using sentence-transformers for local embeddings."""
 
-import json
 import re
 from pathlib import Path
 
-import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from sentinelcx.config import KnowledgeBaseSettings
+from sentinelcx.knowledge.ann import get_backend
+from sentinelcx.knowledge.index import write_index
 
 
 class KnowledgeIndexer:
@@ -15,6 +15,8 @@ class KnowledgeIndexer:
         self._kb_path = Path(settings.knowledge_base_path)
         self._cache_dir = Path(settings.embedding_cache_dir)
         self._model_name = settings.embedding_model_name
+        self._ann_backend = settings.ann_backend
+        self._ann_params = settings.ann_params
         self._model: SentenceTransformer | None = None
 
     def _get_model(self) -> SentenceTransformer:
@@ -61,8 +63,18 @@ class KnowledgeIndexer:
 
         return chunks
 
-    def index_directory(self) -> dict:
-        """Index all markdown files in the knowledge base directory."""
+    def index_directory(
+        self, ann_backend: str | None = None, ann_params: dict | None = None
+    ) -> dict:
+        """Index all markdown files in the knowledge base directory.
+
+        ``ann_backend`` and ``ann_params`` choose the nearest-neighbour search
+        structure built over the embeddings (see ``sentinelcx.knowledge.ann``);
+        they default to the settings.
+        """
+        ann_backend = ann_backend or self._ann_backend
+        ann_params = self._ann_params if ann_params is None else ann_params
+        get_backend(ann_backend)  # fail before the slow encode
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         model = self._get_model()
 
@@ -80,20 +92,28 @@ class KnowledgeIndexer:
         texts = [c["text"] for c in all_chunks]
         embeddings = model.encode(texts, show_progress_bar=True, convert_to_numpy=True)
 
-        # Save embeddings and metadata
-        np.save(self._cache_dir / "embeddings.npy", embeddings)
+        # Save normalized vectors, metadata and header
         metadata = [
             {"source_file": c["source_file"], "heading": c["heading"], "text": c["text"]}
             for c in all_chunks
         ]
-        with open(self._cache_dir / "metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
+        header = write_index(
+            self._cache_dir, self._model_name, embeddings, metadata, ann_backend, ann_params
+        )
 
-        return {"chunks": len(all_chunks), "files": len(set(c["source_file"] for c in all_chunks))}
+        return {
+            "chunks": len(all_chunks),
+            "files": len(set(c["source_file"] for c in all_chunks)),
+            "build_id": header["build_id"],
+            "ann": header["ann"],
+        }
 
 
 if __name__ == "__main__":
     settings = KnowledgeBaseSettings()
     indexer = KnowledgeIndexer(settings)
     result = indexer.index_directory()
-    print(f"Indexed {result['chunks']} chunks from {result['files']} files")
+    print(
+        f"Indexed {result['chunks']} chunks from {result['files']} files "
+        f"({result['ann']['backend']} search)"
+    )
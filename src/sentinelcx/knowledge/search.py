@@ -1,6 +1,8 @@
 """Semantic search over cached knowledge base embeddings."""
 
-import json
+import asyncio
+import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -8,6 +10,11 @@ import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from sentinelcx.config import KnowledgeBaseSettings
+from sentinelcx.knowledge.batcher import EmbeddingBatcher
+from sentinelcx.knowledge.cache import LRUCache, normalize_query
+from sentinelcx.knowledge.index import HEADER_FILE, MappedIndex, normalize, open_index
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -23,49 +30,226 @@ class KnowledgeSearch:
         self._cache_dir = Path(settings.embedding_cache_dir)
         self._model_name = settings.embedding_model_name
         self._model: SentenceTransformer | None = None
-        self._embeddings: np.ndarray | None = None
-        self._metadata: list[dict] | None = None
+        self._index: MappedIndex | None = None
+        self._index_mtime: int | None = None
+        # Searches load the index from worker threads
+        self._index_lock = threading.Lock()
+        # Normalized query -> unit-length embedding
+        self._embedding_cache = LRUCache(settings.query_embedding_cache_size)
+        # (normalized query, k, index build id, ANN params) -> k nearest (chunk, score) pairs
+        self._result_cache = LRUCache(settings.search_result_cache_size)
+        # Coalesces the query encodes of concurrent async searches
+        self._batcher = EmbeddingBatcher(
+            self._encode, settings.encode_max_batch_size, settings.encode_max_wait_ms
+        )
 
     def _get_model(self) -> SentenceTransformer:
         if self._model is None:
             self._model = SentenceTransformer(self._model_name)
         return self._model
 
-    def _load_index(self) -> None:
-        if self._embeddings is not None:
-            return
-        embeddings_path = self._cache_dir / "embeddings.npy"
-        metadata_path = self._cache_dir / "metadata.json"
-        if not embeddings_path.exists() or not metadata_path.exists():
-            raise FileNotFoundError(f"Index not found at {self._cache_dir}. Run the indexer first.")
-        self._embeddings = np.load(embeddings_path)
-        with open(metadata_path) as f:
-            self._metadata = json.load(f)
+    def _load_index(self) -> MappedIndex:
+        """The memory-mapped index, re-opened when the indexer has rebuilt it."""
+        with self._index_lock:
+            return self._reload_if_changed()
+
+    def _reload_if_changed(self) -> MappedIndex:
+        try:
+            mtime = (self._cache_dir / HEADER_FILE).stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if self._index is None or (mtime is not None and mtime != self._index_mtime):
+            previous = self._index.build_id if self._index is not None else None
+            self._index = open_index(self._cache_dir, self._model_name)
+            self._index_mtime = mtime
+            if self._index.build_id != previous:
+                self._embedding_cache.clear()
+                self._result_cache.clear()
+            logger.info(
+                "Opened knowledge index %s (%d chunks, %s search)",
+                self._index.build_id,
+                len(self._index),
+                self._index.ann.backend,
+            )
+        return self._index
 
     def search(self, query: str, top_k: int = 5) -> list[SearchResult]:
         """Search the knowledge base for documents similar to the query."""
-        self._load_index()
-        model = self._get_model()
-
-        query_embedding = model.encode(query, convert_to_numpy=True)
-
-        # Cosine similarity
-        norms = np.linalg.norm(self._embeddings, axis=1) * np.linalg.norm(query_embedding)
-        norms = np.where(norms == 0, 1, norms)  # avoid division by zero
-        similarities = np.dot(self._embeddings, query_embedding) / norms
-
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[-top_k:][::-1]
-
-        results = []
-        for idx in top_indices:
-            meta = self._metadata[idx]
-            results.append(
-                SearchResult(
-                    text=meta["text"],
-                    source_file=meta["source_file"],
-                    heading=meta["heading"],
-                    score=float(similarities[idx]),
-                )
+        return self.search_many([query], top_k=top_k, dedupe=False)[0]
+
+    def search_many(
+        self, queries: list[str], top_k: int = 5, dedupe: bool = True
+    ) -> list[list[SearchResult]]:
+        """Search for several queries at once; one result list per query, in order.
+
+        Queries answered before (for the same ``top_k``, batch size and index
+        build) come from the result cache. The others are encoded in a single
+        batched forward pass, skipping those whose embedding is cached, and
+        looked up in the index's nearest-neighbour backend together. With
+        ``dedupe``, a chunk that matches several queries is returned only for
+        the query it scores highest on, and the other lists are backfilled with
+        their next best chunks.
+        """
+        if not queries:
+            return []
+        index = self._load_index()
+        texts = [normalize_query(q) for q in queries]
+        k = self._pool_size(len(queries), top_k, dedupe)
+
+        results, missing = self._cached_results(index, texts, k)
+        if missing:
+            embeddings, uncached = self._cached_embeddings(missing)
+            if uncached:
+                self._add_embeddings(embeddings, uncached, self._encode(uncached))
+            found = index.ann.search(np.stack([embeddings[t] for t in missing]), k)
+            self._add_results(index, k, results, missing, found)
+        return self._select(index, [results[t] for t in texts], top_k, dedupe)
+
+    async def search_async(self, query: str, top_k: int = 5) -> list[SearchResult]:
+        """``search`` for async callers; see ``search_many_async``."""
+        return (await self.search_many_async([query], top_k=top_k, dedupe=False))[0]
+
+    async def search_many_async(
+        self, queries: list[str], top_k: int = 5, dedupe: bool = True
+    ) -> list[list[SearchResult]]:
+        """``search_many`` for async callers.
+
+        Uncached queries are encoded through the micro-batcher, together with
+        those of other searches running at the same time. The index is opened
+        (or re-opened after a rebuild, which can load an HNSW graph) and scanned
+        on worker threads so the event loop is never blocked.
+        """
+        if not queries:
+            return []
+        index = await asyncio.to_thread(self._load_index)
+        texts = [normalize_query(q) for q in queries]
+        k = self._pool_size(len(queries), top_k, dedupe)
+
+        results, missing = self._cached_results(index, texts, k)
+        if missing:
+            embeddings, uncached = self._cached_embeddings(missing)
+            if uncached:
+                self._add_embeddings(embeddings, uncached, await self._batcher.encode(uncached))
+            found = await asyncio.to_thread(
+                index.ann.search, np.stack([embeddings[t] for t in missing]), k
             )
-        return results
+            self._add_results(index, k, results, missing, found)
+        return self._select(index, [results[t] for t in texts], top_k, dedupe)
+
+    def stats(self) -> dict:
+        """Hit rates of the query embedding and result caches, and the open index."""
+        index = None
+        if self._index is not None:
+            index = {
+                "build_id": self._index.build_id,
+                "chunks": len(self._index),
+                "backend": self._index.ann.backend,
+                "params": self._index.ann.params,
+            }
+        return {
+            "index": index,
+            "query_embeddings": self._embedding_cache.stats(),
+            "results": self._result_cache.stats(),
+            "encoder": self._batcher.stats(),
+        }
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        return self._get_model().encode(texts, convert_to_numpy=True)
+
+    @staticmethod
+    def _pool_size(num_queries: int, top_k: int, dedupe: bool) -> int:
+        """Candidates to fetch per query before the results are selected."""
+        if dedupe and num_queries > 1:
+            # Other queries can claim at most top_k * (num_queries - 1) of a query's candidates
+            return top_k * num_queries
+        return top_k
+
+    def _cached_results(
+        self, index: MappedIndex, texts: list[str], k: int
+    ) -> tuple[dict[str, tuple[tuple[int, float], ...]], list[str]]:
+        """Cached ``k`` nearest (chunk, score) pairs by query, and the queries without any."""
+        results, missing = {}, []
+        for text in dict.fromkeys(texts):
+            hits = self._result_cache.get(self._result_key(index, text, k))
+            if hits is None:
+                missing.append(text)
+            else:
+                results[text] = hits
+        return results, missing
+
+    def _add_results(
+        self,
+        index: MappedIndex,
+        k: int,
+        results: dict[str, tuple[tuple[int, float], ...]],
+        texts: list[str],
+        found: list[tuple[np.ndarray, np.ndarray]],
+    ) -> None:
+        # Index vectors are unit length, so scores are cosine similarities
+        for text, (ids, scores) in zip(texts, found):
+            hits = tuple(zip(ids.tolist(), scores.tolist()))
+            self._result_cache.put(self._result_key(index, text, k), hits)
+            results[text] = hits
+
+    @staticmethod
+    def _result_key(index: MappedIndex, text: str, k: int) -> tuple:
+        # Search params such as nprobe can be tuned on a loaded index and change the hits
+        return (text, k, index.build_id, tuple(sorted(index.ann.params.items())))
+
+    def _cached_embeddings(self, texts: list[str]) -> tuple[dict[str, np.ndarray], list[str]]:
+        """Cached unit-length embeddings by query, and the queries that need encoding."""
+        embeddings, uncached = {}, []
+        for text in texts:
+            embedding = self._embedding_cache.get(text)
+            if embedding is None:
+                uncached.append(text)
+            else:
+                embeddings[text] = embedding
+        return embeddings, uncached
+
+    def _add_embeddings(
+        self, embeddings: dict[str, np.ndarray], texts: list[str], encoded: np.ndarray
+    ) -> None:
+        for text, embedding in zip(texts, normalize(encoded)):
+            embedding.flags.writeable = False
+            self._embedding_cache.put(text, embedding)
+            embeddings[text] = embedding
+
+    def _select(
+        self,
+        index: MappedIndex,
+        candidates: list[tuple[tuple[int, float], ...]],
+        top_k: int,
+        dedupe: bool,
+    ) -> list[list[SearchResult]]:
+        selected = self._assign_unique(candidates, top_k) if dedupe else candidates
+        return [
+            [self._result(index, int(idx), float(score)) for idx, score in hits]
+            for hits in selected
+        ]
+
+    @staticmethod
+    def _assign_unique(
+        candidates: list[tuple[tuple[int, float], ...]], top_k: int
+    ) -> list[list[tuple[int, float]]]:
+        """Greedily give each chunk to its best query until every list has ``top_k``."""
+        ranked = [(score, q, idx) for q, hits in enumerate(candidates) for idx, score in hits]
+        ranked.sort(reverse=True)
+
+        selected: list[list[tuple[int, float]]] = [[] for _ in candidates]
+        used: set[int] = set()
+        for score, q, idx in ranked:
+            if idx not in used and len(selected[q]) < top_k:
+                selected[q].append((idx, score))
+                used.add(idx)
+        return selected
+
+    @staticmethod
+    def _result(index: MappedIndex, idx: int, score: float) -> SearchResult:
+        meta = index.metadata(idx)
+        return SearchResult(
+            text=meta["text"],
+            source_file=meta["source_file"],
+            heading=meta["heading"],
+            score=score,
+        )
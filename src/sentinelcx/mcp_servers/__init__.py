@@ -2,6 +2,22 @@
 
 import sys
 
+from sentinelcx.config import Settings
+from sentinelcx.mcp_servers.event_emitter import (
+    CONVERSATION_ENV,
+    CONVERSATION_HEADER,
+    RUN_ENV,
+    RUN_HEADER,
+)
+
+# Service name -> module that runs its FastMCP server
+SERVER_MODULES = {
+    "salesforce": "sentinelcx.mcp_servers.salesforce_server",
+    "chatwoot": "sentinelcx.mcp_servers.chatwoot_server",
+    "knowledge": "sentinelcx.mcp_servers.knowledge_base_server",
+    "slack": "sentinelcx.mcp_servers.slack_server",
+}
+
 
 def create_mcp_server_configs() -> dict:
     """Return MCP server configs for the Claude Agent SDK.
@@ -12,20 +28,57 @@ def create_mcp_server_configs() -> dict:
     python = sys.executable
 
     return {
-        "salesforce": {
-            "command": python,
-            "args": ["-m", "sentinelcx.mcp_servers.salesforce_server"],
-        },
-        "chatwoot": {
-            "command": python,
-            "args": ["-m", "sentinelcx.mcp_servers.chatwoot_server"],
-        },
-        "knowledge": {
-            "command": python,
-            "args": ["-m", "sentinelcx.mcp_servers.knowledge_base_server"],
-        },
-        "slack": {
-            "command": python,
-            "args": ["-m", "sentinelcx.mcp_servers.slack_server"],
-        },
+        service: {"command": python, "args": ["-m", module]}
+        for service, module in SERVER_MODULES.items()
+    }
+
+
+def build_mcp_env(settings: Settings) -> dict[str, str]:
+    """Environment variables the MCP servers need to reach their backends."""
+    return {
+        "ANTHROPIC_API_KEY": settings.anthropic_api_key,
+        "CHATWOOT_BASE_URL": settings.chatwoot.base_url,
+        "CHATWOOT_API_TOKEN": settings.chatwoot.api_token,
+        "CHATWOOT_ACCOUNT_ID": str(settings.chatwoot.account_id),
+        "SALESFORCE_USERNAME": settings.salesforce.username,
+        "SALESFORCE_PASSWORD": settings.salesforce.password,
+        "SALESFORCE_SECURITY_TOKEN": settings.salesforce.security_token,
+        "SALESFORCE_DOMAIN": settings.salesforce.domain,
+        "SALESFORCE_INSTANCE_URL": settings.salesforce.instance_url,
+        "SALESFORCE_SESSION_ID": settings.salesforce.session_id,
+        "SALESFORCE_CACHE_ENABLED": str(settings.salesforce.cache_enabled).lower(),
+        "SALESFORCE_CACHE_PATH": settings.salesforce.cache_path,
+        "SALESFORCE_CACHE_TTL": str(settings.salesforce.cache_ttl),
+        "SALESFORCE_CACHE_STALE_TTL": str(settings.salesforce.cache_stale_ttl),
+        "SALESFORCE_CACHE_MISS_TTL": str(settings.salesforce.cache_miss_ttl),
+        "SLACK_BOT_TOKEN": settings.slack.bot_token,
+        "SLACK_SIGNING_SECRET": settings.slack.signing_secret,
+        "SLACK_ESCALATION_CHANNEL": settings.slack.escalation_channel,
+        "SLACK_BASE_URL": settings.slack.base_url,
+        "MCP_TOOL_CACHE_TTL": str(settings.mcp.tool_cache_ttl),
+        "MCP_TOOL_CACHE_MAX_ENTRIES": str(settings.mcp.tool_cache_max_entries),
+        "MCP_TELEMETRY_SOCKET": settings.mcp.telemetry_socket,
     }
+
+
+def tag_conversation(configs: dict, conversation_id: str, run_id: str | None = None) -> dict:
+    """Copies of ``configs`` that tell each server which ticket (and run) it is serving.
+
+    Stdio servers get it in their environment and HTTP (pooled) servers in a
+    request header; the servers attach it to their tool-call telemetry and
+    scope their tool result caches to the run.
+    """
+    headers = {CONVERSATION_HEADER: conversation_id}
+    env = {CONVERSATION_ENV: conversation_id}
+    if run_id is not None:
+        headers[RUN_HEADER] = run_id
+        env[RUN_ENV] = run_id
+    tagged = {}
+    for service, config in configs.items():
+        if config.get("type") == "http":
+            tagged[service] = {**config, "headers": {**config.get("headers", {}), **headers}}
+        elif config.get("type", "stdio") == "stdio":
+            tagged[service] = {**config, "env": {**config.get("env", {}), **env}}
+        else:
+            tagged[service] = config
+    return tagged
@@ -5,7 +5,10 @@ import logging
 from fastmcp import FastMCP
 
 from sentinelcx.clients.chatwoot_client import ChatwootClient
-from sentinelcx.config import ChatwootSettings
+from sentinelcx.config import ChatwootSettings, MCPSettings
+from sentinelcx.mcp_servers.event_emitter import emit_tool_call_events
+from sentinelcx.mcp_servers.tool_cache import configure_tool_caches, get_tool_cache
+from sentinelcx.mcp_servers.transport import serve
 
 _log_file = "/tmp/sentinelcx_mcp.log"
 logger = logging.getLogger("mcp.chatwoot")
@@ -17,6 +20,7 @@ logger.addHandler(_fh)
 chatwoot_mcp = FastMCP("chatwoot", instructions="Chatwoot ticketing and support inbox")
 
 _client: ChatwootClient | None = None
+_cache = get_tool_cache("chatwoot")
 
 
 def init_client(settings: ChatwootSettings) -> None:
@@ -31,6 +35,8 @@ def _get_client() -> ChatwootClient:
 
 
 @chatwoot_mcp.tool()
+@emit_tool_call_events("chatwoot")
+@_cache.cached
 async def get_ticket(conversation_id: int) -> dict:
     """Fetch a support ticket/conversation by ID.
 
@@ -43,6 +49,8 @@ async def get_ticket(conversation_id: int) -> dict:
 
 
 @chatwoot_mcp.tool()
+@emit_tool_call_events("chatwoot")
+@_cache.cached
 async def get_conversation_history(conversation_id: int) -> list[dict]:
     """Fetch the full message history of a conversation.
 
@@ -61,6 +69,8 @@ async def get_conversation_history(conversation_id: int) -> list[dict]:
 
 
 @chatwoot_mcp.tool()
+@emit_tool_call_events("chatwoot")
+@_cache.cached
 async def get_sla_status(conversation_id: int) -> dict:
     """Get SLA compliance status for a conversation.
 
@@ -70,6 +80,7 @@ async def get_sla_status(conversation_id: int) -> dict:
 
 
 @chatwoot_mcp.tool()
+@emit_tool_call_events("chatwoot")
 async def send_reply(conversation_id: int, content: str) -> dict:
     """Send a reply message to a customer conversation.
 
@@ -81,11 +92,16 @@ async def send_reply(conversation_id: int, content: str) -> dict:
         len(content),
     )
     result = await _get_client().send_message(conversation_id, content)
+    _cache.invalidate(
+        ["get_ticket", "get_conversation_history", "get_sla_status"],
+        conversation_id=conversation_id,
+    )
     logger.info("send_reply RESULT — %s", result)
     return result
 
 
 @chatwoot_mcp.tool()
+@emit_tool_call_events("chatwoot")
 async def update_ticket_status(conversation_id: int, status: str) -> dict:
     """Update the status of a conversation/ticket.
 
@@ -97,10 +113,21 @@ async def update_ticket_status(conversation_id: int, status: str) -> dict:
         status,
     )
     result = await _get_client().toggle_status(conversation_id, status)
+    _cache.invalidate(["get_ticket", "get_sla_status"], conversation_id=conversation_id)
     logger.info("update_ticket_status RESULT — %s", result)
     return result
 
 
+@chatwoot_mcp.tool()
+def cache_stats() -> dict:
+    """Report how often repeated ticket lookups were answered from this server's cache.
+
+    Returns overall and per-tool hits, misses and hit rate.
+    """
+    return _cache.stats()
+
+
 if __name__ == "__main__":
+    configure_tool_caches(MCPSettings())
     init_client(ChatwootSettings())
-    chatwoot_mcp.run()
+    serve(chatwoot_mcp)
@@ -1,13 +1,119 @@
-"""Event emitter for MCP servers to publish dashboard events."""
+"""Structured tool-call telemetry from the MCP servers to the API process.
+
+Every tool wrapped with ``emit_tool_call_events`` sends one JSON record per
+call (service, tool, conversation ID, duration, error) as a datagram on a local
+Unix domain socket. The API's ``TelemetryListener`` turns the records into
+dashboard events, so calls made by sub-agents inside Task tool executions show
+up on the right ticket. Sending never blocks and never fails a tool call: with
+no listener the record is dropped.
+
+The conversation a call belongs to is, in order of preference, the tool's own
+``conversation_id`` argument, the ``X-SentinelCX-Conversation-ID`` header of a
+pooled (HTTP) server request, the ``SENTINELCX_CONVERSATION_ID`` environment
+variable of a per-ticket stdio server, or ``current_conversation_id`` for
+servers running inside the API process. The same channels carry the ID of the
+ticket run (``current_run``), which scopes the tool result caches.
+"""
 
 import asyncio
+import contextvars
+import json
 import logging
+import os
+import socket
+import threading
 import time
 from functools import wraps
 from typing import Any, Callable
 
+from fastmcp.server.dependencies import get_http_headers
+
+from sentinelcx.config import MCPSettings
+
 logger = logging.getLogger(__name__)
 
+CONVERSATION_HEADER = "X-SentinelCX-Conversation-ID"
+CONVERSATION_ENV = "SENTINELCX_CONVERSATION_ID"
+RUN_HEADER = "X-SentinelCX-Run-ID"
+RUN_ENV = "SENTINELCX_RUN_ID"
+
+# Ticket being processed by the current task, for in-process servers
+current_conversation_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "current_conversation_id", default=None
+)
+# Run of that ticket; a re-run of the same conversation gets a new one
+current_run_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "current_run_id", default=None
+)
+
+
+class TelemetrySender:
+    """Fire-and-forget sender of tool-call records to the telemetry socket."""
+
+    def __init__(self, socket_path: str) -> None:
+        self.socket_path = socket_path
+        self._sock: socket.socket | None = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def send(self, record: dict) -> None:
+        if not self.socket_path:
+            return
+        payload = json.dumps(record, default=str).encode()
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                    self._sock.setblocking(False)
+                self._sock.sendto(payload, self.socket_path)
+            except OSError as exc:
+                # No listener, or its buffer is full: telemetry is best effort
+                self.dropped += 1
+                logger.debug("Dropped tool-call record: %r", exc)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+
+
+_sender: TelemetrySender | None = None
+
+
+def get_telemetry_sender() -> TelemetrySender:
+    """Get this process's telemetry sender."""
+    global _sender
+    if _sender is None:
+        _sender = TelemetrySender(MCPSettings().telemetry_socket)
+    return _sender
+
+
+def current_run() -> str | None:
+    """ID of the ticket run the current tool call serves, or None if the caller set none."""
+    header = get_http_headers().get(RUN_HEADER.lower())
+    return header or os.environ.get(RUN_ENV) or current_run_id.get()
+
+
+def _resolve_conversation_id(kwargs: dict) -> str:
+    if kwargs.get("conversation_id") is not None:
+        return str(kwargs["conversation_id"])
+    header = get_http_headers().get(CONVERSATION_HEADER.lower())
+    return header or os.environ.get(CONVERSATION_ENV) or current_conversation_id.get() or "unknown"
+
+
+def _send(service: str, tool: str, kwargs: dict, start: float, error: str | None) -> None:
+    get_telemetry_sender().send(
+        {
+            "service": service,
+            "tool": tool,
+            "conversation_id": _resolve_conversation_id(kwargs),
+            "timestamp": time.time(),
+            "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+            "error": error,
+        }
+    )
+
 
 def emit_tool_call_events(service_name: str):
     """Decorator to emit dashboard events for MCP tool calls.
@@ -17,67 +123,29 @@ def emit_tool_call_events(service_name: str):
     """
 
     def decorator(func: Callable) -> Callable:
+        tool_name = func.__name__
+
         @wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
-            tool_name = func.__name__
-            start_time = time.time()
-
-            # Log the tool call
-            logger.info(
-                "MCP tool called: service=%s, tool=%s, args=%s", service_name, tool_name, kwargs
-            )
-
+            start = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                duration_ms = (time.time() - start_time) * 1000
-                logger.info(
-                    "MCP tool completed: service=%s, tool=%s, duration=%.2fms",
-                    service_name,
-                    tool_name,
-                    duration_ms,
-                )
-                return result
             except Exception as exc:
-                duration_ms = (time.time() - start_time) * 1000
-                logger.error(
-                    "MCP tool failed: service=%s, tool=%s, error=%s, duration=%.2fms",
-                    service_name,
-                    tool_name,
-                    str(exc),
-                    duration_ms,
-                )
+                _send(service_name, tool_name, kwargs, start, repr(exc))
                 raise
+            _send(service_name, tool_name, kwargs, start, None)
+            return result
 
         @wraps(func)
         async def async_wrapper(*args, **kwargs) -> Any:
-            tool_name = func.__name__
-            start_time = time.time()
-
-            # Log the tool call
-            logger.info(
-                "MCP tool called: service=%s, tool=%s, args=%s", service_name, tool_name, kwargs
-            )
-
+            start = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                duration_ms = (time.time() - start_time) * 1000
-                logger.info(
-                    "MCP tool completed: service=%s, tool=%s, duration=%.2fms",
-                    service_name,
-                    tool_name,
-                    duration_ms,
-                )
-                return result
             except Exception as exc:
-                duration_ms = (time.time() - start_time) * 1000
-                logger.error(
-                    "MCP tool failed: service=%s, tool=%s, error=%s, duration=%.2fms",
-                    service_name,
-                    tool_name,
-                    str(exc),
-                    duration_ms,
-                )
+                _send(service_name, tool_name, kwargs, start, repr(exc))
                 raise
+            _send(service_name, tool_name, kwargs, start, None)
+            return result
 
         # Return appropriate wrapper based on function type
         if asyncio.iscoroutinefunction(func):
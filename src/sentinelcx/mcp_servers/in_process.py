@@ -0,0 +1,100 @@
+"""In-process registration of the FastMCP servers with the Agent SDK.
+
+Instead of spawning each server as a stdio subprocess, the SDK talks to the
+servers' underlying MCP ``Server`` objects over an in-memory transport. Tool
+calls skip process startup and pipe serialization, and all tickets share the
+API process's Chatwoot/Salesforce/Slack clients and the loaded embedding model.
+"""
+
+import asyncio
+import logging
+import threading
+
+from sentinelcx.config import Settings
+from sentinelcx.mcp_servers import (
+    chatwoot_server,
+    knowledge_base_server,
+    salesforce_server,
+    slack_server,
+)
+from sentinelcx.mcp_servers.tool_cache import configure_tool_caches
+
+logger = logging.getLogger(__name__)
+
+_SERVERS = {
+    "salesforce": salesforce_server.salesforce_mcp,
+    "chatwoot": chatwoot_server.chatwoot_mcp,
+    "knowledge": knowledge_base_server.knowledge_mcp,
+    "slack": slack_server.slack_mcp,
+}
+
+# Services whose backend client is initialized, and those whose last attempt failed
+_initialized: set[str] = set()
+_failed: set[str] = set()
+# Serializes initialization across the worker threads it runs on
+_init_lock = threading.Lock()
+
+
+def _init_services(settings: Settings, services: list[str]) -> None:
+    """Initialize the given services' backend clients (blocking)."""
+    initializers = {
+        "salesforce": lambda: salesforce_server.init_client(settings.salesforce),
+        "chatwoot": lambda: chatwoot_server.init_client(settings.chatwoot),
+        "knowledge": lambda: knowledge_base_server.init_search(settings.knowledge_base),
+        "slack": lambda: slack_server.init_client(settings.slack),
+    }
+    with _init_lock:
+        pending = [service for service in services if service not in _initialized]
+        if not pending:
+            return
+        if not _initialized and not _failed:
+            configure_tool_caches(settings.mcp)
+        for service in pending:
+            try:
+                initializers[service]()
+            except Exception:
+                logger.exception("Failed to initialize in-process %s MCP server", service)
+                _failed.add(service)
+            else:
+                _initialized.add(service)
+                _failed.discard(service)
+        logger.info("In-process MCP servers initialized: %s", sorted(_initialized))
+
+
+async def init_in_process_servers(settings: Settings, services: list[str] | None = None) -> None:
+    """Initialize each server's backend client once for this process.
+
+    Loading the embedding model, opening the index and logging in to
+    Salesforce block, so the work runs on a worker thread. A backend that
+    fails to initialize (e.g. Salesforce login, or a knowledge index not built
+    yet) is logged and left uninitialized, so its tools report an error while
+    the others work; ``retry_failed_in_process_servers`` retries it.
+    """
+    await asyncio.to_thread(_init_services, settings, list(services or _SERVERS))
+
+
+async def retry_failed_in_process_servers(
+    settings: Settings, initial_delay: float = 5.0, max_delay: float = 300.0
+) -> None:
+    """Retry failed backends with exponential backoff until all are initialized."""
+    delay = initial_delay
+    while _failed:
+        await asyncio.sleep(delay)
+        logger.info("Retrying in-process MCP servers: %s", sorted(_failed))
+        await init_in_process_servers(settings, sorted(_failed))
+        delay = min(delay * 2, max_delay)
+
+
+async def create_in_process_mcp_server_configs(settings: Settings) -> dict:
+    """Return SDK (in-process) MCP server configs for the Claude Agent SDK.
+
+    Only services never attempted are initialized here; failed ones are left
+    to the backoff retry rather than retried on every ticket.
+    """
+    unattempted = [service for service in _SERVERS if service not in _initialized | _failed]
+    if unattempted:
+        await init_in_process_servers(settings, unattempted)
+    return {
+        service: {"type": "sdk", "name": service, "instance": mcp._mcp_server}
+        for service, mcp in _SERVERS.items()
+    }
@@ -6,7 +6,9 @@ from pathlib import Path
 from fastmcp import FastMCP
 
 from sentinelcx.config import KnowledgeBaseSettings
-from sentinelcx.knowledge.search import KnowledgeSearch
+from sentinelcx.knowledge.search import KnowledgeSearch, SearchResult
+from sentinelcx.mcp_servers.event_emitter import emit_tool_call_events
+from sentinelcx.mcp_servers.transport import serve
 
 _log_file = "/tmp/sentinelcx_mcp.log"
 logger = logging.getLogger("mcp.knowledge")
@@ -34,28 +36,53 @@ def _get_search() -> KnowledgeSearch:
 
 
 @knowledge_mcp.tool()
-def search_knowledge_base(query: str, top_k: int = 5) -> list[dict]:
+@emit_tool_call_events("knowledge")
+async def search_knowledge_base(query: str, top_k: int = 5) -> list[dict]:
     """Search the knowledge base for documents relevant to a query.
 
     Uses semantic similarity to find the most relevant documentation chunks.
     Returns a list of results with text, source file, heading, and relevance score.
     """
     logger.info("search_knowledge_base CALLED — query=%s, top_k=%d", query, top_k)
-    results = _get_search().search(query, top_k=top_k)
+    results = await _get_search().search_async(query, top_k=top_k)
+    output = [_format_result(r) for r in results]
+    logger.info("search_knowledge_base RESULT — %d results", len(output))
+    return output
+
+
+@knowledge_mcp.tool()
+@emit_tool_call_events("knowledge")
+async def search_knowledge_base_batch(queries: list[str], top_k: int = 5) -> list[dict]:
+    """Search the knowledge base for several related queries in one call.
+
+    Use this instead of calling search_knowledge_base repeatedly, e.g. for
+    ["refund policy", "annual plan cancellation", "prorated billing"]. Returns one
+    entry per query with its results. A document chunk that matches several queries
+    is listed only once, under the query it matches best.
+    """
+    logger.info("search_knowledge_base_batch CALLED — queries=%d, top_k=%d", len(queries), top_k)
+    results = await _get_search().search_many_async(queries, top_k=top_k)
     output = [
-        {
-            "text": r.text,
-            "source_file": r.source_file,
-            "heading": r.heading,
-            "score": round(r.score, 4),
-        }
-        for r in results
+        {"query": query, "results": [_format_result(r) for r in hits]}
+        for query, hits in zip(queries, results)
     ]
-    logger.info("search_knowledge_base RESULT — %d results", len(output))
+    logger.info(
+        "search_knowledge_base_batch RESULT — %d results", sum(len(o["results"]) for o in output)
+    )
     return output
 
 
+def _format_result(result: SearchResult) -> dict:
+    return {
+        "text": result.text,
+        "source_file": result.source_file,
+        "heading": result.heading,
+        "score": round(result.score, 4),
+    }
+
+
 @knowledge_mcp.tool()
+@emit_tool_call_events("knowledge")
 def get_document(file_path: str) -> str:
     """Retrieve the full content of a knowledge base document by its file path.
 
@@ -76,6 +103,7 @@ def get_document(file_path: str) -> str:
 
 
 @knowledge_mcp.tool()
+@emit_tool_call_events("knowledge")
 def list_topics() -> list[dict]:
     """List all available topics/categories in the knowledge base.
 
@@ -97,6 +125,17 @@ def list_topics() -> list[dict]:
     return topics
 
 
+@knowledge_mcp.tool()
+def knowledge_stats() -> dict:
+    """Report how often repeated searches were answered from this server's caches.
+
+    Returns hits, misses, evictions and hit rate of the query embedding cache and the
+    search result cache, the batch sizes of query encoding, and the build ID, size and
+    search backend of the open index.
+    """
+    return _get_search().stats()
+
+
 if __name__ == "__main__":
     init_search(KnowledgeBaseSettings())
-    knowledge_mcp.run()
+    serve(knowledge_mcp)
@@ -0,0 +1,233 @@
+"""Pool of long-lived MCP server processes shared across tickets.
+
+In ``stdio`` mode the Agent SDK forks every MCP server once per ticket, which
+means a fresh Salesforce login, a fresh httpx client and a full embedding model
+load each time. The pool instead keeps ``pool_sizes[service]`` HTTP servers per
+service running for the lifetime of the API process, hands each ticket the
+least-loaded healthy instance, and restarts instances that crash or stop
+answering health checks.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from sentinelcx.config import Settings
+from sentinelcx.mcp_servers import SERVER_MODULES, build_mcp_env
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledServer:
+    service: str
+    host: str
+    port: int
+    process: asyncio.subprocess.Process | None = None
+    healthy: bool = False
+    active_leases: int = 0
+    total_leases: int = 0
+    restarts: int = 0
+    _restart_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/mcp"
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+
+class MCPServerPool:
+    """Manages long-lived MCP server processes, one group per service."""
+
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        self._servers: dict[str, list[PooledServer]] = {}
+        self._health_task: asyncio.Task | None = None
+        self._running = False
+
+        port = settings.mcp.pool_base_port
+        for service in SERVER_MODULES:
+            size = max(1, settings.mcp.pool_sizes.get(service, 1))
+            group = []
+            for _ in range(size):
+                group.append(PooledServer(service=service, host=settings.mcp.pool_host, port=port))
+                port += 1
+            self._servers[service] = group
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        """Spawn every server and wait until each one accepts connections."""
+        if self._running:
+            return
+        self._running = True
+        await asyncio.gather(*(self._spawn(s) for s in self._all_servers()))
+        await asyncio.gather(*(self._wait_ready(s) for s in self._all_servers()))
+        self._health_task = asyncio.create_task(self._health_loop())
+        logger.info(
+            "MCP server pool started: %s",
+            {service: len(group) for service, group in self._servers.items()},
+        )
+
+    async def stop(self) -> None:
+        """Stop health checks and terminate all server processes."""
+        self._running = False
+        if self._health_task:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        await asyncio.gather(*(self._terminate(s) for s in self._all_servers()))
+        logger.info("MCP server pool stopped")
+
+    @asynccontextmanager
+    async def lease(self):
+        """Reserve one server per service for the duration of a ticket.
+
+        Yields a ``mcp_servers`` dict for ``ClaudeAgentOptions`` pointing at the
+        least-loaded healthy instance of each service.
+        """
+        leased = [self._pick(service) for service in self._servers]
+        for server in leased:
+            server.active_leases += 1
+            server.total_leases += 1
+        try:
+            yield {server.service: {"type": "http", "url": server.url} for server in leased}
+        finally:
+            for server in leased:
+                server.active_leases -= 1
+
+    def stats(self) -> dict:
+        """Per-instance health and usage counters."""
+        return {
+            service: [
+                {
+                    "port": s.port,
+                    "pid": s.process.pid if s.process else None,
+                    "healthy": s.healthy,
+                    "active_leases": s.active_leases,
+                    "total_leases": s.total_leases,
+                    "restarts": s.restarts,
+                }
+                for s in group
+            ]
+            for service, group in self._servers.items()
+        }
+
+    def _all_servers(self) -> list[PooledServer]:
+        return [s for group in self._servers.values() for s in group]
+
+    def _pick(self, service: str) -> PooledServer:
+        group = self._servers[service]
+        candidates = [s for s in group if s.healthy] or group
+        return min(candidates, key=lambda s: s.active_leases)
+
+    async def _spawn(self, server: PooledServer) -> None:
+        env = {**os.environ, **build_mcp_env(self._settings)}
+        server.process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            SERVER_MODULES[server.service],
+            "--http",
+            "--host",
+            server.host,
+            "--port",
+            str(server.port),
+            env=env,
+            stdout=asyncio.subprocess.DEVNULL,
+        )
+        server.healthy = False
+        logger.info(
+            "Spawned %s MCP server pid=%s on port %d",
+            server.service,
+            server.process.pid,
+            server.port,
+        )
+
+    async def _wait_ready(self, server: PooledServer) -> None:
+        deadline = asyncio.get_running_loop().time() + self._settings.mcp.startup_timeout
+        while asyncio.get_running_loop().time() < deadline:
+            if not server.running:
+                break
+            if await self._probe(server):
+                server.healthy = True
+                return
+            await asyncio.sleep(0.25)
+        logger.error("%s MCP server on port %d failed to become ready", server.service, server.port)
+
+    async def _probe(self, server: PooledServer) -> bool:
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(server.host, server.port), timeout=2.0
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
+    async def _check(self, server: PooledServer) -> None:
+        if server.running and await self._probe(server):
+            server.healthy = True
+            return
+        server.healthy = False
+        await self._restart(server)
+
+    async def _restart(self, server: PooledServer) -> None:
+        async with server._restart_lock:
+            if server.healthy:
+                return
+            logger.warning(
+                "Restarting %s MCP server on port %d (exit code=%s)",
+                server.service,
+                server.port,
+                server.process.returncode if server.process else None,
+            )
+            await self._terminate(server)
+            await self._spawn(server)
+            server.restarts += 1
+            await self._wait_ready(server)
+
+    async def _terminate(self, server: PooledServer) -> None:
+        process = server.process
+        server.healthy = False
+        if process is None or process.returncode is not None:
+            return
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    async def _health_loop(self) -> None:
+        while self._running:
+            await asyncio.sleep(self._settings.mcp.health_check_interval)
+            try:
+                await asyncio.gather(*(self._check(s) for s in self._all_servers()))
+            except Exception as exc:
+                logger.error("Error in MCP pool health check: %s", exc)
+
+
+_pool: MCPServerPool | None = None
+
+
+def get_mcp_pool(settings: Settings | None = None) -> MCPServerPool:
+    """Get the global MCP server pool instance."""
+    global _pool
+    if _pool is None:
+        _pool = MCPServerPool(settings or Settings())
+    return _pool
@@ -1,11 +1,19 @@
 """Salesforce MCP server exposing customer data tools."""
 
+import asyncio
 import logging
 
 from fastmcp import FastMCP
 
-from sentinelcx.clients.salesforce_client import SalesforceClient
-from sentinelcx.config import SalesforceSettings
+from sentinelcx.clients.salesforce_client import (
+    SalesforceClient,
+    score_account_health,
+    summarize_history,
+)
+from sentinelcx.config import MCPSettings, SalesforceSettings
+from sentinelcx.mcp_servers.event_emitter import emit_tool_call_events
+from sentinelcx.mcp_servers.tool_cache import configure_tool_caches, get_tool_cache
+from sentinelcx.mcp_servers.transport import serve
 
 _log_file = "/tmp/sentinelcx_mcp.log"
 logger = logging.getLogger("mcp.salesforce")
@@ -17,6 +25,7 @@ logger.addHandler(_fh)
 salesforce_mcp = FastMCP("salesforce", instructions="Salesforce CRM data access")
 
 _client: SalesforceClient | None = None
+_cache = get_tool_cache("salesforce")
 
 
 def init_client(settings: SalesforceSettings) -> None:
@@ -31,6 +40,8 @@ def _get_client() -> SalesforceClient:
 
 
 @salesforce_mcp.tool()
+@emit_tool_call_events("salesforce")
+@_cache.cached
 def get_customer_record(customer_name: str) -> dict:
     """Look up a customer in Salesforce by their full name (e.g. "Sarah Johnson").
 
@@ -50,6 +61,8 @@ def get_customer_record(customer_name: str) -> dict:
 
 
 @salesforce_mcp.tool()
+@emit_tool_call_events("salesforce")
+@_cache.cached
 def get_case_history(account_id: str) -> list[dict]:
     """Fetch case/ticket history for a customer account.
 
@@ -61,6 +74,8 @@ def get_case_history(account_id: str) -> list[dict]:
 
 
 @salesforce_mcp.tool()
+@emit_tool_call_events("salesforce")
+@_cache.cached
 def get_purchase_history(account_id: str) -> list[dict]:
     """Fetch purchase history (closed-won opportunities) for a customer account.
 
@@ -72,6 +87,8 @@ def get_purchase_history(account_id: str) -> list[dict]:
 
 
 @salesforce_mcp.tool()
+@emit_tool_call_events("salesforce")
+@_cache.cached
 def get_account_health(account_id: str) -> dict:
     """Get account health score and churn risk assessment.
 
@@ -83,6 +100,81 @@ def get_account_health(account_id: str) -> dict:
     return _get_client().get_account_health(account_id)
 
 
+def _pick(record: dict, fields: tuple[str, ...]) -> dict:
+    return {f: record.get(f) for f in fields}
+
+
+@salesforce_mcp.tool()
+@emit_tool_call_events("salesforce")
+@_cache.cached
+async def get_customer_context(customer_name: str) -> dict:
+    """Get everything Salesforce knows about a customer in one call (e.g. "Sarah Johnson").
+
+    Looks up the customer by full name, then fetches case history and purchase
+    history concurrently and derives the account health score from them. Returns
+    the account (account_id, name, tier in description, contacts), account_health,
+    the most recent cases, and a purchase summary with the most recent purchases.
+    Prefer this over calling get_customer_record, get_case_history,
+    get_purchase_history and get_account_health one at a time.
+    """
+    logger.info("get_customer_context CALLED — customer_name=%s", customer_name)
+    client = _get_client()
+    customer = await asyncio.to_thread(client.get_customer_by_name, customer_name)
+    account_id = customer.get("Id")
+    if not account_id:
+        logger.info("get_customer_context RESULT — found=False")
+        return {"found": False, "customer_name": customer_name}
+
+    cases, purchases = await asyncio.gather(
+        asyncio.to_thread(client.get_case_history, account_id),
+        asyncio.to_thread(client.get_purchase_history, account_id),
+        return_exceptions=True,
+    )
+    errors = {}
+    if isinstance(cases, Exception):
+        errors["case_history"], cases = str(cases), None
+    if isinstance(purchases, Exception):
+        errors["purchase_history"], purchases = str(purchases), None
+
+    contacts = customer.get("contacts") or []
+    result = {
+        "found": True,
+        "account_id": account_id,
+        "account": {
+            **_pick(customer, ("Name", "Industry", "Type", "Phone", "Website", "Description")),
+            "matched_contact": _pick(customer.get("matched_contact") or {}, ("Name", "Email")),
+            "contacts": [_pick(c, ("Name", "Email", "Title")) for c in contacts],
+        },
+        "account_health": (
+            score_account_health(cases, purchases)
+            if cases is not None and purchases is not None
+            else None
+        ),
+        **summarize_history(cases, purchases),
+        "errors": errors,
+    }
+    logger.info(
+        "get_customer_context RESULT — account_id=%s, cases=%d, purchases=%d, errors=%s",
+        account_id,
+        len(cases or []),
+        len(purchases or []),
+        list(errors) or "none",
+    )
+    return result
+
+
+@salesforce_mcp.tool()
+def cache_stats() -> dict:
+    """Report how often repeated customer lookups were answered from this server's cache.
+
+    Returns overall and per-tool hits, misses and hit rate, plus the counters of the
+    on-disk lookup cache shared with other Salesforce server processes.
+    """
+    shared = _client.cache_stats() if _client is not None else None
+    return {**_cache.stats(), "shared_cache": shared}
+
+
 if __name__ == "__main__":
+    configure_tool_caches(MCPSettings())
     init_client(SalesforceSettings())
-    salesforce_mcp.run()
+    serve(salesforce_mcp)
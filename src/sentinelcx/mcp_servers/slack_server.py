@@ -6,6 +6,8 @@ from fastmcp import FastMCP
 
 from sentinelcx.clients.slack_client import SlackClient
 from sentinelcx.config import SlackSettings
+from sentinelcx.mcp_servers.event_emitter import emit_tool_call_events
+from sentinelcx.mcp_servers.transport import serve
 
 _log_file = "/tmp/sentinelcx_mcp.log"
 logger = logging.getLogger("mcp.slack")
@@ -33,6 +35,7 @@ def _get_client() -> SlackClient:
 
 
 @slack_mcp.tool()
+@emit_tool_call_events("slack")
 async def post_escalation(text: str) -> dict:
     """Post an escalation message to the support escalations channel.
 
@@ -50,6 +53,7 @@ async def post_escalation(text: str) -> dict:
 
 
 @slack_mcp.tool()
+@emit_tool_call_events("slack")
 async def post_message(channel: str, text: str) -> dict:
     """Post a message to a specific Slack channel.
 
@@ -59,6 +63,7 @@ async def post_message(channel: str, text: str) -> dict:
 
 
 @slack_mcp.tool()
+@emit_tool_call_events("slack")
 async def get_channel_members(channel: str) -> list[str]:
     """Get the list of member user IDs in a Slack channel.
 
@@ -68,6 +73,7 @@ async def get_channel_members(channel: str) -> list[str]:
 
 
 @slack_mcp.tool()
+@emit_tool_call_events("slack")
 async def check_team_availability(channel: str) -> list[dict]:
     """Check the availability/presence status of team members in a channel.
 
@@ -78,6 +84,7 @@ async def check_team_availability(channel: str) -> list[dict]:
 
 
 @slack_mcp.tool()
+@emit_tool_call_events("slack")
 async def get_user_info(user_id: str) -> dict:
     """Get detailed information about a Slack user.
 
@@ -88,4 +95,4 @@ async def get_user_info(user_id: str) -> dict:
 
 if __name__ == "__main__":
     init_client(SlackSettings())
-    slack_mcp.run()
+    serve(slack_mcp)
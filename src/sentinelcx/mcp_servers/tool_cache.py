@@ -0,0 +1,184 @@
+"""Short-lived memoization of read-only MCP tool results.
+
+Within one ticket the triage, response and escalation agents tend to call the
+same read tools (``get_ticket``, ``get_customer_record``, ``get_case_history``,
+``get_account_health``...) with the same arguments. Each server keeps a small
+cache keyed by tool name and arguments so that repeats within ``ttl`` seconds
+are answered from memory instead of another Chatwoot or Salesforce round trip.
+
+Entries are scoped to the ticket run that made the call (``current_run``: the
+run ID the orchestrator tags on stdio, pooled and in-process servers), so a
+re-run of the same conversation, for example after a new customer message,
+never sees the previous run's history even when it lands on the same
+long-lived server. Calls without a run tag, as from servers shared by a
+persistent CLI session, are not cached. Write tools invalidate the entries they
+make stale in every run.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable
+
+from sentinelcx.config import MCPSettings
+from sentinelcx.mcp_servers.event_emitter import current_run
+
+logger = logging.getLogger(__name__)
+
+
+class ToolResultCache:
+    """TTL cache of tool results for one MCP server, with per-tool hit counts."""
+
+    def __init__(self, service: str, ttl: float = 30.0, max_entries: int = 1024) -> None:
+        self.service = service
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # (run, tool, arguments JSON) -> (expires_at, result), oldest first
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, Any]] = OrderedDict()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self._invalidations = 0
+        # Calls outside any tagged run, which bypass the cache
+        self._unscoped = 0
+        # Sync tools run on worker threads
+        self._lock = threading.Lock()
+
+    def configure(self, ttl: float, max_entries: int) -> None:
+        with self._lock:
+            self.ttl = ttl
+            self.max_entries = max_entries
+            self._entries.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def cached(self, func: Callable) -> Callable:
+        """Decorator memoizing a read-only tool by its keyword arguments."""
+        tool = func.__name__
+
+        @wraps(func)
+        def sync_wrapper(**kwargs) -> Any:
+            run = current_run()
+            found, result = self._get(run, tool, kwargs)
+            if found:
+                return result
+            result = func(**kwargs)
+            self._put(run, tool, kwargs, result)
+            return result
+
+        @wraps(func)
+        async def async_wrapper(**kwargs) -> Any:
+            run = current_run()
+            found, result = self._get(run, tool, kwargs)
+            if found:
+                return result
+            result = await func(**kwargs)
+            self._put(run, tool, kwargs, result)
+            return result
+
+        if asyncio.iscoroutinefunction(func):
+            return async_wrapper
+        return sync_wrapper
+
+    def invalidate(self, tools: list[str], **arguments) -> int:
+        """Drop cached results of ``tools`` whose arguments include ``arguments``, in any run.
+
+        Returns the number of entries removed.
+        """
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[1] in tools and _matches(json.loads(key[2]), arguments)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+        if stale:
+            logger.debug("%s tool cache: invalidated %d entries", self.service, len(stale))
+        return len(stale)
+
+    def stats(self) -> dict:
+        """Hit rate per tool plus overall counters."""
+        with self._lock:
+            tools = sorted(set(self._hits) | set(self._misses))
+            per_tool = {}
+            for tool in tools:
+                hits, misses = self._hits.get(tool, 0), self._misses.get(tool, 0)
+                per_tool[tool] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                }
+            hits, misses = sum(self._hits.values()), sum(self._misses.values())
+            return {
+                "service": self.service,
+                "enabled": self.enabled,
+                "ttl": self.ttl,
+                "entries": len(self._entries),
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                "invalidations": self._invalidations,
+                "unscoped": self._unscoped,
+                "tools": per_tool,
+            }
+
+    def _get(self, run: str | None, tool: str, arguments: dict) -> tuple[bool, Any]:
+        if not self.enabled:
+            return False, None
+        if run is None:
+            with self._lock:
+                self._unscoped += 1
+            return False, None
+        key = (run, tool, _arguments_key(arguments))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._hits[tool] = self._hits.get(tool, 0) + 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._misses[tool] = self._misses.get(tool, 0) + 1
+        return False, None
+
+    def _put(self, run: str | None, tool: str, arguments: dict, result: Any) -> None:
+        if not self.enabled or run is None:
+            return
+        key = (run, tool, _arguments_key(arguments))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _arguments_key(arguments: dict) -> str:
+    return json.dumps(arguments, sort_keys=True, default=str)
+
+
+def _matches(cached_arguments: dict, arguments: dict) -> bool:
+    # Compare as strings so an int conversation_id matches its string form
+    return all(str(cached_arguments.get(k)) == str(v) for k, v in arguments.items())
+
+
+_caches: dict[str, ToolResultCache] = {}
+
+
+def get_tool_cache(service: str) -> ToolResultCache:
+    """Get the tool result cache of one MCP server."""
+    if service not in _caches:
+        _caches[service] = ToolResultCache(service)
+    return _caches[service]
+
+
+def configure_tool_caches(settings: MCPSettings) -> None:
+    """Apply the TTL and size settings to every server's cache."""
+    for cache in _caches.values():
+        cache.configure(settings.tool_cache_ttl, settings.tool_cache_max_entries)
@@ -0,0 +1,23 @@
+"""Command-line entry point shared by the FastMCP servers."""
+
+import argparse
+
+from fastmcp import FastMCP
+
+
+def serve(mcp: FastMCP, argv: list[str] | None = None) -> None:
+    """Run a FastMCP server over stdio (default) or streamable HTTP.
+
+    Stdio is what the Agent SDK spawns per ticket. ``--http`` is used by the
+    MCP server pool to keep a long-lived server listening on a local port.
+    """
+    parser = argparse.ArgumentParser(description=f"sentinelCX {mcp.name} MCP server")
+    parser.add_argument("--http", action="store_true", help="Serve over streamable HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8710)
+    args = parser.parse_args(argv)
+
+    if args.http:
+        mcp.run(transport="http", host=args.host, port=args.port, show_banner=False)
+    else:
+        mcp.run()
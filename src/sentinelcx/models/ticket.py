@@ -38,7 +38,8 @@ class TriageResult(BaseModel):
     decision: TriageDecision
     category: TicketCategory
     priority: TicketPriority
-    sentiment: SentimentScore
+    # The triage agent's compact routing output omits the sentiment breakdown
+    sentiment: SentimentScore | None = None
     confidence: float = Field(ge=0.0, le=1.0)
     reasoning: str = ""
 
@@ -1,22 +1,42 @@
 """Main orchestrator that wires sub-agents and MCP servers together."""
 
+import asyncio
 import json as _json
 import logging
+import time
+import uuid
+from contextlib import aclosing, asynccontextmanager
 
+import anyio
 from claude_agent_sdk import (
+    AgentDefinition,
     AssistantMessage,
     ClaudeAgentOptions,
+    ResultError,
     ResultMessage,
     TextBlock,
     ToolResultBlock,
     ToolUseBlock,
+    UserMessage,
     query,
 )
 
-from sentinelcx.agents.definitions import ALL_AGENTS
+from sentinelcx.agents.context import TicketContext, prefetch_ticket_context
+from sentinelcx.agents.definitions import ALL_AGENTS, with_ticket_context
+from sentinelcx.agents.model_policy import ModelPolicy, models_by_agent
+from sentinelcx.agents.prompts import (
+    build_delegation_context_section,
+    build_ticket_context_section,
+)
 from sentinelcx.config import Settings
 from sentinelcx.dashboard.event_bus import DashboardEvent, EventType, get_event_bus
-from sentinelcx.mcp_servers import create_mcp_server_configs
+from sentinelcx.dashboard.spans import SpanTracker
+from sentinelcx.mcp_servers import build_mcp_env, create_mcp_server_configs, tag_conversation
+from sentinelcx.mcp_servers.event_emitter import current_conversation_id, current_run_id
+from sentinelcx.mcp_servers.pool import get_mcp_pool
+from sentinelcx.models.ticket import TriageResult
+from sentinelcx.replay import get_stream_recordings
+from sentinelcx.sessions import get_session_pool
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +78,27 @@ will read all data they need using their own MCP tools.
 - Keep delegation messages SHORT. One line only.
 """
 
+# Routing used by the pipeline executor when triage output cannot be parsed
+_FALLBACK_TRIAGE = {
+    "decision": "escalate",
+    "category": "general",
+    "priority": "medium",
+    "confidence": 0.0,
+    "source": "fallback",
+}
+
+# Result subtypes the CLI reports when a run stops at one of the per-ticket limits
+_LIMIT_SUBTYPES = {"error_max_turns": "turn_budget", "error_max_budget_usd": "cost_budget"}
+
+_LIMIT_MESSAGES = {
+    "deadline": "Ticket exceeded its wall-clock deadline",
+    "cost_budget": "Ticket exceeded its cost budget",
+    "turn_budget": "Ticket exceeded its turn budget",
+}
+
+# Fields of a stopped run's partial result carried into the ticket result
+_PARTIAL_RESULT_KEYS = ("cost_usd", "duration_ms", "turns", "stages")
+
 # Keywords to detect which sub-agent is being delegated to
 _AGENT_KEYWORDS = {
     "triage": "triage",
@@ -67,16 +108,190 @@ _AGENT_KEYWORDS = {
 }
 
 
+def _log_stderr(line: str) -> None:
+    logger.info("CLI stderr: %s", line.rstrip())
+
+
+def parse_triage_result(text: str | None) -> dict | None:
+    """Parse and validate the triage agent's routing JSON.
+
+    Returns the routing fields as a dict, or None if the text holds no valid
+    ``TriageResult``.
+    """
+    if not text or "{" not in text:
+        return None
+    try:
+        parsed = _json.loads(text[text.index("{") : text.rindex("}") + 1])
+        triage = TriageResult.model_validate(parsed)
+    except ValueError as exc:
+        logger.warning("Invalid triage output: %s", exc)
+        return None
+    return triage.model_dump(
+        mode="json", include={"decision", "category", "priority", "confidence"}
+    )
+
+
+class TicketLimitError(Exception):
+    """A ticket run was stopped by its deadline, cost budget or turn budget.
+
+    ``reason`` is ``"deadline"``, ``"cost_budget"`` or ``"turn_budget"``;
+    ``result`` holds whatever the run had produced (cost, turns) when stopped.
+    """
+
+    def __init__(self, reason: str, result: dict | None = None) -> None:
+        super().__init__(_LIMIT_MESSAGES[reason])
+        self.reason = reason
+        self.result = result
+
+
 class SentinelCXOrchestrator:
     """Orchestrates ticket processing through the sub-agent pipeline."""
 
     def __init__(self, settings: Settings | None = None) -> None:
         self._settings = settings or Settings()
         self._mcp_configs = create_mcp_server_configs()
+        self._model_policy = ModelPolicy(self._settings.models)
+        self._recordings = get_stream_recordings(self._settings.replay)
+
+    @asynccontextmanager
+    async def _acquire_mcp_servers(self, conversation_id: str, run_id: str | None = None):
+        """Yield the MCP server configs to use for one ticket.
+
+        Leases long-lived servers from the pool when pooled transport is
+        enabled and running, serves them in-process when in-process transport
+        is enabled, otherwise falls back to per-ticket stdio servers. Replay
+        starts no CLI, so it gets no servers.
+
+        Stdio and pooled configs are tagged with the conversation and run IDs so
+        the servers' tool-call telemetry lands on this ticket and their tool
+        result caches are scoped to this run. Persistent sessions serve many
+        tickets with the same servers, so they are left untagged.
+        """
+        if self._recordings.replaying:
+            yield {}
+            return
+
+        def tagged(configs: dict) -> dict:
+            if self._settings.orchestrator.session_pool:
+                return configs
+            return tag_conversation(configs, conversation_id, run_id)
+
+        if self._settings.mcp.transport == "in_process":
+            from sentinelcx.mcp_servers.in_process import create_in_process_mcp_server_configs
+
+            yield await create_in_process_mcp_server_configs(self._settings)
+            return
+        if self._settings.mcp.transport == "pooled":
+            pool = get_mcp_pool(self._settings)
+            if pool.running:
+                async with pool.lease() as configs:
+                    yield tagged(configs)
+                return
+            logger.warning("MCP pool not running; falling back to stdio servers")
+        yield tagged(self._mcp_configs)
+
+    @asynccontextmanager
+    async def _open_stream(
+        self,
+        prompt: str,
+        options: ClaudeAgentOptions,
+        conversation_id: str,
+        run: str,
+    ):
+        """Yield the message stream for one run.
+
+        Uses a persistent CLI session from the session pool when it is enabled,
+        otherwise a one-shot ``query()`` that starts its own CLI process. In
+        replay mode the recorded run is yielded instead; in record mode the
+        stream is also written to the ticket's recording.
+        """
+        recordings = self._recordings
+        if recordings.replaying:
+            async with aclosing(recordings.replay(conversation_id, run)) as stream:
+                yield stream
+            return
+        if self._settings.orchestrator.session_pool:
+            async with get_session_pool(self._settings).session(options) as client:
+                await client.query(prompt)
+                async with (
+                    aclosing(client.receive_response()) as stream,
+                    recordings.wrap(conversation_id, run, stream) as stream,
+                ):
+                    yield stream
+            return
+        async with (
+            aclosing(query(prompt=prompt, options=options)) as stream,
+            recordings.wrap(conversation_id, run, stream) as stream,
+        ):
+            yield stream
+
+    def turn_budget(self, decision: str | None) -> int:
+        """Turns allowed for a ticket with this triage decision (``max_turns`` if unknown)."""
+        cfg = self._settings.orchestrator
+        budgets = {
+            "auto_handle": cfg.turn_budget_auto_handle,
+            "needs_research": cfg.turn_budget_needs_research,
+            "escalate": cfg.turn_budget_escalate,
+        }
+        return budgets.get(decision or "", cfg.max_turns)
+
+    def _build_options(
+        self, mcp_configs: dict, agents: dict | None = None, max_turns: int | None = None
+    ) -> ClaudeAgentOptions:
+        """Build the Agent SDK options for a top-level orchestrator run."""
+        return ClaudeAgentOptions(
+            system_prompt=ORCHESTRATOR_SYSTEM_PROMPT,
+            mcp_servers=mcp_configs,
+            agents=agents or ALL_AGENTS,
+            allowed_tools=[
+                "Task",
+                "mcp__chatwoot__*",
+                "mcp__salesforce__*",
+                "mcp__knowledge__*",
+                "mcp__slack__*",
+            ],
+            permission_mode="bypassPermissions",
+            max_turns=max_turns or self._settings.orchestrator.max_turns,
+            max_budget_usd=self._settings.orchestrator.max_cost_usd or None,
+            model=self._model_policy.orchestrator_model,
+            stderr=_log_stderr,
+            env=build_mcp_env(self._settings),
+            cwd=None,
+        )
+
+    def _build_stage_options(
+        self,
+        agent: AgentDefinition,
+        mcp_configs: dict,
+        max_turns: int | None = None,
+        max_budget_usd: float | None = None,
+    ) -> ClaudeAgentOptions:
+        """Build the Agent SDK options for running one sub-agent as a top-level query.
+
+        Only the MCP servers the agent has tools on are attached.
+        """
+        services = {t.split("__")[1] for t in agent.tools or [] if t.startswith("mcp__")}
+        return ClaudeAgentOptions(
+            system_prompt=agent.prompt,
+            mcp_servers={s: cfg for s, cfg in mcp_configs.items() if s in services},
+            allowed_tools=list(agent.tools or []),
+            permission_mode="bypassPermissions",
+            max_turns=max_turns or self._settings.orchestrator.pipeline_stage_max_turns,
+            max_budget_usd=max_budget_usd,
+            model=agent.model or "sonnet",
+            stderr=_log_stderr,
+            env=build_mcp_env(self._settings),
+            cwd=None,
+        )
 
     async def process_ticket(self, conversation_id: str) -> dict:
         """Process a support ticket through the full agent pipeline."""
         bus = get_event_bus()
+        started = time.monotonic()
+        # Attributes tool calls of in-process MCP servers to this ticket and run
+        current_conversation_id.set(conversation_id)
+        run_id = uuid.uuid4().hex
+        current_run_id.set(run_id)
 
         await bus.publish(
             DashboardEvent(
@@ -91,96 +306,112 @@ class SentinelCXOrchestrator:
             f"Return the complete result as structured JSON."
         )
 
-        def _log_stderr(line: str) -> None:
-            logger.info("CLI stderr: %s", line.rstrip())
-
-        options = ClaudeAgentOptions(
-            system_prompt=ORCHESTRATOR_SYSTEM_PROMPT,
-            mcp_servers=self._mcp_configs,
-            agents=ALL_AGENTS,
-            allowed_tools=[
-                "Task",
-                "mcp__chatwoot__*",
-                "mcp__salesforce__*",
-                "mcp__knowledge__*",
-                "mcp__slack__*",
-            ],
-            permission_mode="bypassPermissions",
-            max_turns=25,
-            model="sonnet",
-            stderr=_log_stderr,
-            env={
-                "ANTHROPIC_API_KEY": self._settings.anthropic_api_key,
-                "CHATWOOT_BASE_URL": self._settings.chatwoot.base_url,
-                "CHATWOOT_API_TOKEN": self._settings.chatwoot.api_token,
-                "CHATWOOT_ACCOUNT_ID": str(self._settings.chatwoot.account_id),
-                "SALESFORCE_USERNAME": self._settings.salesforce.username,
-                "SALESFORCE_PASSWORD": self._settings.salesforce.password,
-                "SALESFORCE_SECURITY_TOKEN": self._settings.salesforce.security_token,
-                "SALESFORCE_DOMAIN": self._settings.salesforce.domain,
-                "SLACK_BOT_TOKEN": self._settings.slack.bot_token,
-                "SLACK_SIGNING_SECRET": self._settings.slack.signing_secret,
-                "SLACK_ESCALATION_CHANNEL": self._settings.slack.escalation_channel,
-            },
-            cwd=None,
-        )
-
         result = None
         triage_data: dict = {}
-
-        try:
-            async for message in query(prompt=prompt, options=options):
-                msg_type = type(message).__name__
-                logger.info(
-                    "SDK message: %s (subtype=%s)",
-                    msg_type,
-                    getattr(message, "subtype", "N/A"),
+        spans = SpanTracker(conversation_id)
+        self._recordings.start_ticket(conversation_id)
+        agents = ALL_AGENTS
+        context_section = ""
+        pipeline = self._settings.orchestrator.mode == "pipeline"
+        context = await self._prefetch_context(conversation_id)
+        if context is not None:
+            context_data = context.to_prompt_data(self._settings.orchestrator.prefetch_max_messages)
+            if self._settings.orchestrator.session_pool:
+                # Keep system and agent prompts identical across tickets so sessions are
+                # reusable; the context travels in the per-query prompt instead
+                if pipeline:
+                    context_section = build_ticket_context_section(context_data)
+                else:
+                    context_section = build_delegation_context_section(context_data)
+            else:
+                agents = with_ticket_context(context_data)
+
+        fast_triage = None
+        if self._recordings.replaying:
+            fast_triage = self._recordings.fast_triage(conversation_id)
+        elif self._settings.fast_triage.enabled:
+            fast_triage = await self._fast_triage(conversation_id, context)
+            if fast_triage:
+                self._recordings.record_fast_triage(conversation_id, fast_triage)
+        if fast_triage:
+            triage_data.update(fast_triage)
+            await bus.publish(
+                DashboardEvent(
+                    type=EventType.AGENT_START,
+                    conversation_id=conversation_id,
+                    data={"agent": "triage", "source": "fast_path"},
                 )
+            )
+            prompt = (
+                f"Process support ticket conversation_id={conversation_id}. "
+                f"Triage is already complete: {_json.dumps(fast_triage)}. "
+                f"Do NOT delegate to the triage agent; route directly on this decision "
+                f"→ respond or escalate. Return the complete result as structured JSON."
+            )
 
-                if isinstance(message, AssistantMessage):
-                    await self._emit_assistant_events(message, conversation_id, bus, triage_data)
-
-                if isinstance(message, ResultMessage):
-                    result = {
-                        "success": message.subtype == "success",
-                        "result": message.result,
-                        "conversation_id": conversation_id,
-                        "cost_usd": message.total_cost_usd,
-                        "duration_ms": message.duration_ms,
-                        "turns": message.num_turns,
-                    }
-                    logger.info(
-                        "Ticket %s processed: success=%s, turns=%s, cost=$%.4f",
-                        conversation_id,
-                        result["success"],
-                        result.get("turns"),
-                        result.get("cost_usd", 0),
-                    )
+        # The pipeline re-applies the policy once triage has produced a confidence
+        agents, model_escalation = self._model_policy.apply(agents, triage_data, context)
+        models = {"orchestrator": self._model_policy.orchestrator_model, **models_by_agent(agents)}
+        if model_escalation:
+            logger.info("Escalating models for ticket %s (%s)", conversation_id, model_escalation)
 
-                    # Try to extract triage data from result if not already captured
-                    if not triage_data and isinstance(message.result, str):
-                        result_text = message.result
-                        if '"decision"' in result_text and '"category"' in result_text:
-                            try:
-                                start = result_text.index("{")
-                                end = result_text.rindex("}") + 1
-                                parsed = _json.loads(result_text[start:end])
-                                if "decision" in parsed:
-                                    logger.info(
-                                        "Extracted triage from result: decision=%s, category=%s",
-                                        parsed.get("decision"),
-                                        parsed.get("category"),
-                                    )
-                                    triage_data.update(parsed)
-                            except (ValueError, _json.JSONDecodeError):
-                                pass
+        executor: PipelineExecutor | None = None
+        limit_reason: str | None = None
+        deadline = self._settings.orchestrator.ticket_deadline
+        try:
+            # An anyio scope (not asyncio.timeout) so the SDK's shielded transport
+            # close still terminates the CLI subprocess and its MCP children
+            with anyio.move_on_after(
+                deadline - (time.monotonic() - started) if deadline else None
+            ) as deadline_scope:
+                async with self._acquire_mcp_servers(conversation_id, run_id) as mcp_configs:
+                    if pipeline:
+                        executor = PipelineExecutor(
+                            self, mcp_configs, agents, context, context_section
+                        )
+                        result = await executor.run(conversation_id, triage_data, spans)
+                    else:
+                        result = await self._run_llm_orchestrator(
+                            prompt + context_section,
+                            mcp_configs,
+                            agents,
+                            conversation_id,
+                            triage_data,
+                            spans,
+                        )
+            if deadline_scope.cancelled_caught:
+                raise TicketLimitError(
+                    "deadline", executor.summary(conversation_id) if executor else None
+                )
+        except TicketLimitError as exc:
+            limit_reason = exc.reason
+            logger.warning(
+                "Ticket %s stopped: %s (after %.1fs)",
+                conversation_id,
+                exc.reason,
+                time.monotonic() - started,
+            )
+            await bus.publish(
+                DashboardEvent(
+                    type=EventType.TICKET_ERROR,
+                    conversation_id=conversation_id,
+                    data={"error": str(exc), "reason": exc.reason},
+                )
+            )
+            result = {
+                "success": False,
+                "result": str(exc),
+                "conversation_id": conversation_id,
+                **{k: v for k, v in (exc.result or {}).items() if k in _PARTIAL_RESULT_KEYS},
+                "limit_reason": exc.reason,
+            }
         except Exception as exc:
             logger.exception("Error processing ticket %s", conversation_id)
             await bus.publish(
                 DashboardEvent(
                     type=EventType.TICKET_ERROR,
                     conversation_id=conversation_id,
-                    data={"error": str(exc)},
+                    data={"error": str(exc), "reason": "error"},
                 )
             )
             if result is None:
@@ -196,6 +427,14 @@ class SentinelCXOrchestrator:
                 "result": "No result returned from orchestrator",
                 "conversation_id": conversation_id,
             }
+        if executor is not None:
+            models = executor.models
+            model_escalation = executor.model_escalation or model_escalation
+
+        try:
+            bus.store.save_spans(spans.finish())
+        except Exception:
+            logger.exception("Failed to persist spans for ticket %s", conversation_id)
 
         await bus.publish(
             DashboardEvent(
@@ -209,20 +448,178 @@ class SentinelCXOrchestrator:
                     "decision": triage_data.get("decision", ""),
                     "category": triage_data.get("category", ""),
                     "confidence": triage_data.get("confidence"),
+                    "triage_source": triage_data.get("source", "llm"),
+                    "prefetched": context is not None,
+                    "prefetch_ms": round(context.duration_ms, 1) if context else None,
+                    "orchestrator_mode": self._settings.orchestrator.mode,
+                    "models": models,
+                    "model_escalation": model_escalation,
+                    "limit_reason": limit_reason,
                 },
             )
         )
 
         return result
 
+    async def _run_llm_orchestrator(
+        self,
+        prompt: str,
+        mcp_configs: dict,
+        agents: dict,
+        conversation_id: str,
+        triage_data: dict,
+        spans: SpanTracker | None = None,
+    ) -> dict | None:
+        """Let the top-level orchestrator model delegate to sub-agents via Task."""
+        bus = get_event_bus()
+        result = None
+        options = self._build_options(
+            mcp_configs, agents, self.turn_budget(triage_data.get("decision"))
+        )
+        limit = None
+        try:
+            async with self._open_stream(
+                prompt, options, conversation_id, "orchestrator"
+            ) as stream:
+                async for message in stream:
+                    msg_type = type(message).__name__
+                    logger.info(
+                        "SDK message: %s (subtype=%s)",
+                        msg_type,
+                        getattr(message, "subtype", "N/A"),
+                    )
+
+                    if isinstance(message, AssistantMessage):
+                        await self._emit_assistant_events(
+                            message, conversation_id, bus, triage_data, spans
+                        )
+                    elif isinstance(message, UserMessage):
+                        await self._emit_user_events(
+                            message, conversation_id, bus, triage_data, spans
+                        )
+
+                    if isinstance(message, ResultMessage):
+                        limit = _LIMIT_SUBTYPES.get(message.subtype)
+                        result = {
+                            "success": message.subtype == "success",
+                            "result": message.result,
+                            "conversation_id": conversation_id,
+                            "cost_usd": message.total_cost_usd,
+                            "duration_ms": message.duration_ms,
+                            "turns": message.num_turns,
+                        }
+                        logger.info(
+                            "Ticket %s processed: success=%s, turns=%s, cost=$%.4f",
+                            conversation_id,
+                            result["success"],
+                            result.get("turns"),
+                            result.get("cost_usd", 0),
+                        )
+
+                        # Try to extract triage data from result if not already captured
+                        if not triage_data and isinstance(message.result, str):
+                            result_text = message.result
+                            if '"decision"' in result_text and '"category"' in result_text:
+                                try:
+                                    start = result_text.index("{")
+                                    end = result_text.rindex("}") + 1
+                                    parsed = _json.loads(result_text[start:end])
+                                    if "decision" in parsed:
+                                        logger.info(
+                                            "Extracted triage from result: decision=%s, category=%s",
+                                            parsed.get("decision"),
+                                            parsed.get("category"),
+                                        )
+                                        triage_data.update(parsed)
+                                except (ValueError, _json.JSONDecodeError):
+                                    pass
+        except ResultError as exc:
+            # The CLI exits non-zero after reporting a limit; the ResultMessage came first
+            limit = _LIMIT_SUBTYPES.get(exc.subtype)
+            if limit is None:
+                raise
+        if limit:
+            raise TicketLimitError(limit, result)
+        return result
+
+    async def _prefetch_context(self, conversation_id: str) -> TicketContext | None:
+        """Fetch the ticket context bundle concurrently, if enabled.
+
+        Returns None when prefetch is disabled, times out, or could not read
+        the ticket from Chatwoot; the sub-agents then fetch it through their
+        own tool calls as before. Replay only prefetches when asked to; the
+        recorded runs already reflect whatever context they had.
+        """
+        cfg = self._settings.orchestrator
+        replay_skips = self._recordings.replaying and not self._settings.replay.prefetch
+        if not cfg.prefetch_context or replay_skips:
+            return None
+        try:
+            context = await asyncio.wait_for(
+                prefetch_ticket_context(self._settings, conversation_id),
+                timeout=cfg.prefetch_timeout,
+            )
+        except Exception as exc:
+            logger.warning("Context prefetch failed for ticket %s: %r", conversation_id, exc)
+            return None
+        return context if context.complete else None
+
+    async def _fast_triage(
+        self, conversation_id: str, context: TicketContext | None = None
+    ) -> dict | None:
+        """Classify the ticket with the local k-NN model.
+
+        Returns triage data shaped like the triage agent's output when the
+        calibrated confidence clears the threshold, otherwise None so the
+        LLM triage agent runs as usual. Reuses prefetched messages when given.
+        """
+        from sentinelcx.agents.fast_triage import get_fast_triage_classifier
+        from sentinelcx.clients.chatwoot_client import ChatwootClient
+
+        try:
+            if context is None:
+                client = ChatwootClient(self._settings.chatwoot)
+                try:
+                    context = TicketContext(
+                        conversation_id=conversation_id,
+                        messages=await client.get_messages(int(conversation_id)),
+                    )
+                finally:
+                    await client.close()
+            text = context.incoming_text()
+            if not text:
+                return None
+            prediction = await asyncio.to_thread(
+                lambda: get_fast_triage_classifier(self._settings).predict(text)
+            )
+        except Exception as exc:
+            logger.warning("Fast triage failed for ticket %s: %s", conversation_id, exc)
+            return None
+
+        threshold = self._settings.fast_triage.threshold
+        logger.info(
+            "Fast triage for ticket %s: decision=%s, category=%s, confidence=%.3f (threshold=%.2f)",
+            conversation_id,
+            prediction.decision,
+            prediction.category,
+            prediction.confidence,
+            threshold,
+        )
+        if prediction.confidence < threshold:
+            return None
+        return prediction.to_triage_dict()
+
     async def _emit_assistant_events(
         self,
         message: AssistantMessage,
         conversation_id: str,
         bus,
         triage_data: dict,
+        spans: SpanTracker | None = None,
     ) -> None:
-        """Extract dashboard events from an AssistantMessage."""
+        """Extract dashboard events (and spans) from an AssistantMessage."""
+        if spans is not None:
+            spans.record_model(message.parent_tool_use_id, message.model)
         for block in message.content:
             if isinstance(block, ToolUseBlock):
                 logger.info("ToolUseBlock detected: name=%s, id=%s", block.name, block.id)
@@ -250,6 +647,8 @@ class SentinelCXOrchestrator:
                         subagent_type or "none",
                         block.input.get("description", "")[:50],
                     )
+                    if spans is not None:
+                        spans.start_agent(agent_name, block.id)
                     await bus.publish(
                         DashboardEvent(
                             type=EventType.AGENT_START,
@@ -270,6 +669,8 @@ class SentinelCXOrchestrator:
                     tool = block.name
                     logger.info("Non-MCP tool call: %s", tool)
 
+                if spans is not None:
+                    spans.start_tool(block.id, service, tool, message.parent_tool_use_id)
                 await bus.publish(
                     DashboardEvent(
                         type=EventType.TOOL_CALL,
@@ -283,46 +684,7 @@ class SentinelCXOrchestrator:
                 )
 
             elif isinstance(block, ToolResultBlock):
-                # Log the result for debugging
-                result_preview = str(block.content)[:200] if block.content else ""
-                logger.info(
-                    "ToolResultBlock: tool_use_id=%s, is_error=%s, content_preview=%s",
-                    block.tool_use_id,
-                    block.is_error,
-                    result_preview,
-                )
-
-                # Try to extract triage data from Task tool results
-                if not triage_data and block.content:
-                    content_str = str(block.content)
-                    if '"decision"' in content_str and '"category"' in content_str:
-                        try:
-                            # Extract JSON from content (might be wrapped in text)
-                            start = content_str.find("{")
-                            end = content_str.rfind("}") + 1
-                            if start >= 0 and end > start:
-                                parsed = _json.loads(content_str[start:end])
-                                if "decision" in parsed:
-                                    logger.info(
-                                        "Extracted triage from Task result: decision=%s, category=%s, confidence=%s",
-                                        parsed.get("decision"),
-                                        parsed.get("category"),
-                                        parsed.get("confidence"),
-                                    )
-                                    triage_data.update(parsed)
-                        except (ValueError, _json.JSONDecodeError) as exc:
-                            logger.debug("Failed to parse JSON from Task result: %s", exc)
-
-                await bus.publish(
-                    DashboardEvent(
-                        type=EventType.TOOL_RESULT,
-                        conversation_id=conversation_id,
-                        data={
-                            "tool_use_id": block.tool_use_id,
-                            "is_error": block.is_error,
-                        },
-                    )
-                )
+                await self._handle_tool_result(block, conversation_id, bus, triage_data, spans)
 
             elif isinstance(block, TextBlock):
                 # Try to extract triage decision JSON from text
@@ -343,6 +705,289 @@ class SentinelCXOrchestrator:
                     except (ValueError, _json.JSONDecodeError) as exc:
                         logger.warning("Failed to parse triage JSON: %s", exc)
 
+    async def _emit_user_events(
+        self,
+        message: UserMessage,
+        conversation_id: str,
+        bus,
+        triage_data: dict,
+        spans: SpanTracker | None = None,
+    ) -> None:
+        """Extract tool results, which the SDK delivers on UserMessages."""
+        if isinstance(message.content, str):
+            return
+        for block in message.content:
+            if isinstance(block, ToolResultBlock):
+                await self._handle_tool_result(block, conversation_id, bus, triage_data, spans)
+
+    async def _handle_tool_result(
+        self,
+        block: ToolResultBlock,
+        conversation_id: str,
+        bus,
+        triage_data: dict,
+        spans: SpanTracker | None = None,
+    ) -> None:
+        """Close the matching span and publish a TOOL_RESULT event."""
+        if spans is not None:
+            spans.end_tool(block.tool_use_id, block.is_error)
+
+        # Log the result for debugging
+        result_preview = str(block.content)[:200] if block.content else ""
+        logger.info(
+            "ToolResultBlock: tool_use_id=%s, is_error=%s, content_preview=%s",
+            block.tool_use_id,
+            block.is_error,
+            result_preview,
+        )
+
+        # Try to extract triage data from Task tool results
+        if not triage_data and block.content:
+            content_str = str(block.content)
+            if '"decision"' in content_str and '"category"' in content_str:
+                try:
+                    # Extract JSON from content (might be wrapped in text)
+                    start = content_str.find("{")
+                    end = content_str.rfind("}") + 1
+                    if start >= 0 and end > start:
+                        parsed = _json.loads(content_str[start:end])
+                        if "decision" in parsed:
+                            logger.info(
+                                "Extracted triage from Task result: decision=%s, category=%s, confidence=%s",
+                                parsed.get("decision"),
+                                parsed.get("category"),
+                                parsed.get("confidence"),
+                            )
+                            triage_data.update(parsed)
+                except (ValueError, _json.JSONDecodeError) as exc:
+                    logger.debug("Failed to parse JSON from Task result: %s", exc)
+
+        await bus.publish(
+            DashboardEvent(
+                type=EventType.TOOL_RESULT,
+                conversation_id=conversation_id,
+                data={
+                    "tool_use_id": block.tool_use_id,
+                    "is_error": block.is_error,
+                },
+            )
+        )
+
+
+class PipelineExecutor:
+    """Run the fixed triage → route → respond/escalate workflow in code.
+
+    Each stage is a top-level query with the sub-agent's own prompt, tools and
+    model, so there is no orchestrator model spending turns on delegation. The
+    triage output is validated as a ``TriageResult`` and the next stages are
+    chosen in Python. Dashboard events match the LLM orchestrator's.
+
+    Every stage gets what is left of the ticket's cost budget, and once the
+    triage decision is known, of that decision's turn budget. With the session
+    pool enabled, stages get the full static budgets instead, so their options
+    (and therefore their sessions) match across tickets; what is left is still
+    checked before each stage. Prefetched context then travels in the stage
+    prompt (``context_section``) rather than in the agents' system prompts.
+    """
+
+    def __init__(
+        self,
+        orchestrator: SentinelCXOrchestrator,
+        mcp_configs: dict,
+        agents: dict,
+        context: TicketContext | None = None,
+        context_section: str = "",
+    ) -> None:
+        self._orchestrator = orchestrator
+        self._mcp_configs = mcp_configs
+        self._agents = agents
+        self._context = context
+        self._context_section = context_section
+        self._spans: SpanTracker | None = None
+        self._turn_budget: int | None = None
+        self._turn_limit: int | None = None
+        self.stages: list[dict] = []
+        # Model that served each stage that ran, and why models were escalated
+        self.models: dict[str, str | None] = {}
+        self.model_escalation: str | None = None
+
+    @property
+    def cost_usd(self) -> float:
+        return sum(stage["cost_usd"] or 0 for stage in self.stages)
+
+    @property
+    def turns(self) -> int:
+        return sum(stage["turns"] or 0 for stage in self.stages)
+
+    def summary(self, conversation_id: str) -> dict:
+        """Combined result of the stages run so far."""
+        return {
+            "success": bool(self.stages) and all(stage["success"] for stage in self.stages),
+            "result": self.stages[-1]["result"] if self.stages else None,
+            "conversation_id": conversation_id,
+            "cost_usd": self.cost_usd,
+            "duration_ms": sum(stage["duration_ms"] or 0 for stage in self.stages),
+            "turns": self.turns,
+            "stages": self.stages,
+            "model_escalation": self.model_escalation,
+        }
+
+    async def run(
+        self, conversation_id: str, triage_data: dict, spans: SpanTracker | None = None
+    ) -> dict:
+        """Run every stage for one ticket, filling ``triage_data`` in place."""
+        self._spans = spans
+
+        if not triage_data:
+            triage = await self._run_stage(
+                "triage",
+                f"Triage support ticket conversation_id={conversation_id}. "
+                f"Return ONLY the routing decision JSON.",
+                conversation_id,
+            )
+            parsed = parse_triage_result(triage["result"])
+            if parsed is None:
+                logger.warning(
+                    "Could not parse triage output for ticket %s; escalating", conversation_id
+                )
+                parsed = dict(_FALLBACK_TRIAGE)
+            triage_data.update(parsed)
+
+        self._agents, self.model_escalation = self._orchestrator._model_policy.apply(
+            self._agents, triage_data, self._context
+        )
+        if self.model_escalation:
+            logger.info(
+                "Escalating models for ticket %s (%s)", conversation_id, self.model_escalation
+            )
+
+        decision = triage_data.get("decision")
+        self._turn_budget = self._orchestrator.turn_budget(decision)
+        self._turn_limit = self.turns + self._turn_budget
+        if decision == "needs_research":
+            research = await self._run_stage(
+                "research",
+                f"Research support ticket conversation_id={conversation_id}. "
+                f"Return the research brief JSON.",
+                conversation_id,
+            )
+            await self._run_stage(
+                "response",
+                f"Process conversation_id={conversation_id}\n\n"
+                f"Research brief from the research agent:\n{research['result'] or ''}",
+                conversation_id,
+            )
+        elif decision == "auto_handle":
+            await self._run_stage(
+                "response", f"Process conversation_id={conversation_id}", conversation_id
+            )
+        else:
+            await self._run_stage(
+                "escalation", f"Escalate conversation_id={conversation_id}", conversation_id
+            )
+
+        result = self.summary(conversation_id)
+        logger.info(
+            "Ticket %s processed by pipeline (%s): success=%s, turns=%s, cost=$%.4f",
+            conversation_id,
+            " → ".join(stage["agent"] for stage in self.stages),
+            result["success"],
+            result["turns"],
+            result["cost_usd"],
+        )
+        return result
+
+    def _stage_limits(self, conversation_id: str) -> tuple[int, float | None]:
+        """Turns and cost the next stage may use; raises once either budget is spent."""
+        cfg = self._orchestrator._settings.orchestrator
+        max_turns = cfg.pipeline_stage_max_turns
+        if self._turn_limit is not None:
+            remaining_turns = self._turn_limit - self.turns
+            if remaining_turns <= 0:
+                raise TicketLimitError("turn_budget", self.summary(conversation_id))
+            limit = self._turn_budget if cfg.session_pool else remaining_turns
+            max_turns = min(max_turns, limit)
+        max_budget_usd = None
+        if cfg.max_cost_usd:
+            max_budget_usd = cfg.max_cost_usd - self.cost_usd
+            if max_budget_usd <= 0:
+                raise TicketLimitError("cost_budget", self.summary(conversation_id))
+            if cfg.session_pool:
+                max_budget_usd = cfg.max_cost_usd
+        return max_turns, max_budget_usd
+
+    async def _run_stage(self, name: str, prompt: str, conversation_id: str) -> dict:
+        """Run one sub-agent to completion and summarize its ResultMessage."""
+        max_turns, max_budget_usd = self._stage_limits(conversation_id)
+        bus = get_event_bus()
+        agent = self._agents[name]
+        self.models[name] = agent.model
+        await bus.publish(
+            DashboardEvent(
+                type=EventType.AGENT_START,
+                conversation_id=conversation_id,
+                data={"agent": name, "source": "pipeline", "model": agent.model},
+            )
+        )
+        if self._spans is not None:
+            self._spans.start_agent(name, model=agent.model or "")
+
+        stage = {
+            "agent": name,
+            "model": agent.model,
+            "success": False,
+            "result": None,
+            "cost_usd": 0.0,
+            "duration_ms": 0,
+            "turns": 0,
+        }
+        self.stages.append(stage)
+        options = self._orchestrator._build_stage_options(
+            agent, self._mcp_configs, max_turns, max_budget_usd
+        )
+        # Triage JSON is parsed from the stage result, not from intermediate text
+        scratch: dict = {}
+        limit = None
+        try:
+            async with self._orchestrator._open_stream(
+                prompt + self._context_section, options, conversation_id, name
+            ) as stream:
+                async for message in stream:
+                    if isinstance(message, AssistantMessage):
+                        await self._orchestrator._emit_assistant_events(
+                            message, conversation_id, bus, scratch, self._spans
+                        )
+                    elif isinstance(message, UserMessage):
+                        await self._orchestrator._emit_user_events(
+                            message, conversation_id, bus, scratch, self._spans
+                        )
+                    elif isinstance(message, ResultMessage):
+                        limit = _LIMIT_SUBTYPES.get(message.subtype)
+                        stage.update(
+                            success=message.subtype == "success",
+                            result=message.result,
+                            cost_usd=message.total_cost_usd or 0.0,
+                            duration_ms=message.duration_ms,
+                            turns=message.num_turns,
+                        )
+        except ResultError as exc:
+            limit = _LIMIT_SUBTYPES.get(exc.subtype)
+            if limit is None:
+                raise
+        finally:
+            if self._spans is not None:
+                self._spans.end_agent(name, not stage["success"], stage["cost_usd"])
+        logger.info(
+            "Pipeline stage %s for ticket %s: success=%s, turns=%s",
+            name,
+            conversation_id,
+            stage["success"],
+            stage["turns"],
+        )
+        if limit:
+            raise TicketLimitError(limit, self.summary(conversation_id))
+        return stage
+
 
 async def process_ticket(conversation_id: str) -> dict:
     """Convenience function to process a ticket with default settings."""
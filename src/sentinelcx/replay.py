@@ -0,0 +1,202 @@
+"""Record and replay the Agent SDK message stream.
+
+In ``record`` mode every run the orchestrator starts (the ``llm`` orchestrator
+run, or each ``pipeline`` stage) is teed to ``<directory>/<conversation_id>.jsonl``
+as it is consumed, one message per line, together with its offset from the start
+of the run. In ``replay`` mode those runs are fed back through the same
+``process_ticket`` code path instead of starting the Claude CLI, so event
+emission, the EventBus and the dashboard store can be exercised offline.
+
+Replay needs no live services: context prefetch is skipped (unless ``prefetch``
+is set, e.g. against ``fake_services``) and a recorded fast-path triage decision
+is reused. With ``cycle`` enabled, tickets that have no
+recording of their own replay one of the recorded tickets (chosen by a stable hash
+of the conversation id), which lets a handful of recordings drive load tests
+with any number of distinct tickets.
+
+Messages and content blocks are stored as their dataclass fields with a ``type``
+tag and rebuilt by class name from ``claude_agent_sdk``. Nested values other than
+content blocks are replayed as plain dicts.
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import re
+import time
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import aclosing, asynccontextmanager
+from pathlib import Path
+
+import claude_agent_sdk
+
+from sentinelcx.config import ReplaySettings
+
+logger = logging.getLogger(__name__)
+
+_FAST_TRIAGE_RUN = "fast_triage"
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _encode_value(value):
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {"type": type(value).__name__, **dataclasses.asdict(value)}
+    raise TypeError(f"Cannot record {type(value).__name__}")
+
+
+def encode_message(message) -> dict:
+    """JSON-ready form of an SDK message, content blocks tagged with their type."""
+    data = {f.name: getattr(message, f.name) for f in dataclasses.fields(message)}
+    if isinstance(data.get("content"), list):
+        data["content"] = [_encode_value(block) for block in data["content"]]
+    return {"type": type(message).__name__, "data": data}
+
+
+def decode_message(encoded: dict):
+    """Rebuild an SDK message from ``encode_message`` output; None if the type is unknown."""
+    cls = getattr(claude_agent_sdk, encoded["type"], None)
+    if cls is None or not dataclasses.is_dataclass(cls):
+        return None
+    names = {f.name for f in dataclasses.fields(cls)}
+    data = {k: v for k, v in encoded["data"].items() if k in names}
+    if isinstance(data.get("content"), list):
+        data["content"] = [_decode_block(block) for block in data["content"]]
+    return cls(**data)
+
+
+def _decode_block(block: dict):
+    fields = dict(block)
+    cls = getattr(claude_agent_sdk, fields.pop("type"))
+    return cls(**fields)
+
+
+class StreamRecordings:
+    """Writes and reads per-ticket recordings of SDK message streams."""
+
+    def __init__(self, settings: ReplaySettings) -> None:
+        self._settings = settings
+        self._directory = Path(settings.directory)
+        # Parsed recordings by conversation id: run name -> [(offset, message), ...]
+        self._loaded: dict[str, dict[str, list[tuple[float, object]]]] = {}
+        self._recorded_ids: list[str] | None = None
+
+    @property
+    def recording(self) -> bool:
+        return self._settings.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self._settings.mode == "replay"
+
+    def path(self, conversation_id: str) -> Path:
+        return self._directory / f"{_UNSAFE_FILENAME.sub('_', conversation_id)}.jsonl"
+
+    def start_ticket(self, conversation_id: str) -> None:
+        """Start a fresh recording for this ticket, replacing any earlier one."""
+        if not self.recording:
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self.path(conversation_id).write_text("")
+
+    def record_fast_triage(self, conversation_id: str, triage: dict) -> None:
+        if self.recording:
+            self._append(conversation_id, {"run": _FAST_TRIAGE_RUN, "triage": triage})
+
+    def fast_triage(self, conversation_id: str) -> dict | None:
+        """The fast-path triage decision recorded for this ticket, if there was one."""
+        try:
+            runs = self._load(conversation_id)
+        except FileNotFoundError:
+            return None
+        recorded = runs.get(_FAST_TRIAGE_RUN)
+        return dict(recorded[0][1]) if recorded else None
+
+    @asynccontextmanager
+    async def wrap(self, conversation_id: str, run: str, stream: AsyncIterator):
+        """Yield ``stream``, teed to the ticket's recording when recording is enabled."""
+        if not self.recording:
+            yield stream
+            return
+        async with aclosing(self._record(conversation_id, run, stream)) as recorded:
+            yield recorded
+
+    async def replay(self, conversation_id: str, run: str) -> AsyncIterator:
+        """Yield the messages recorded for one run, paced by ``speed`` (0 = no delay)."""
+        messages = self._load(conversation_id).get(run)
+        if messages is None:
+            raise LookupError(f"No recorded {run!r} run for ticket {conversation_id}")
+        speed = self._settings.speed
+        previous = 0.0
+        for offset, message in messages:
+            if speed > 0:
+                await asyncio.sleep(max(0.0, offset - previous) / speed)
+                previous = offset
+            else:
+                # Yield to the loop like a real stream would between messages
+                await asyncio.sleep(0)
+            yield message
+
+    async def _record(self, conversation_id: str, run: str, stream: AsyncIterator):
+        start = time.monotonic()
+        async for message in stream:
+            try:
+                line = {
+                    "run": run,
+                    "offset": round(time.monotonic() - start, 4),
+                    "message": encode_message(message),
+                }
+                self._append(conversation_id, line)
+            except (TypeError, ValueError) as exc:
+                logger.warning("Could not record %s: %r", type(message).__name__, exc)
+            yield message
+
+    def _append(self, conversation_id: str, line: dict) -> None:
+        with self.path(conversation_id).open("a") as f:
+            f.write(json.dumps(line, default=_encode_value) + "\n")
+
+    def _resolve(self, conversation_id: str) -> str:
+        if self.path(conversation_id).exists() or not self._settings.cycle:
+            return conversation_id
+        if self._recorded_ids is None:
+            self._recorded_ids = sorted(p.stem for p in self._directory.glob("*.jsonl"))
+        if not self._recorded_ids:
+            raise FileNotFoundError(f"No recordings in {self._directory}")
+        index = zlib.crc32(conversation_id.encode()) % len(self._recorded_ids)
+        return self._recorded_ids[index]
+
+    def _load(self, conversation_id: str) -> dict[str, list[tuple[float, object]]]:
+        if conversation_id in self._loaded:
+            return self._loaded[conversation_id]
+        source = self._resolve(conversation_id)
+        if source in self._loaded:
+            return self._loaded[source]
+        path = self.path(source)
+        if not path.exists():
+            raise FileNotFoundError(f"No recording for ticket {conversation_id} at {path}")
+
+        runs: dict[str, list[tuple[float, object]]] = {}
+        for raw in path.read_text().splitlines():
+            if not raw.strip():
+                continue
+            line = json.loads(raw)
+            if line["run"] == _FAST_TRIAGE_RUN:
+                runs[_FAST_TRIAGE_RUN] = [(0.0, line["triage"])]
+                continue
+            message = decode_message(line["message"])
+            if message is not None:
+                runs.setdefault(line["run"], []).append((line["offset"], message))
+        self._loaded[source] = runs
+        return runs
+
+
+_recordings: StreamRecordings | None = None
+
+
+def get_stream_recordings(settings: ReplaySettings | None = None) -> StreamRecordings:
+    """Get the global stream recordings instance."""
+    global _recordings
+    if _recordings is None:
+        _recordings = StreamRecordings(settings or ReplaySettings())
+    return _recordings
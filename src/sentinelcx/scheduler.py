@@ -0,0 +1,314 @@
+"""Bounded ticket scheduler with per-priority lanes.
+
+Webhooks and the tickets API submit conversations here instead of running the
+pipeline directly. A fixed number of workers drain the lanes in priority order
+(urgent, high, medium, low), so a burst of webhooks can no longer launch an
+unbounded number of CLI and MCP process trees at once. When every lane together
+holds ``max_queue_size`` tickets, new submissions are rejected with
+``QueueFullError`` and the API answers 429.
+
+Submissions are coalesced per conversation. A new ticket waits
+``coalesce_window`` seconds before it becomes eligible to run, and any further
+submission for a conversation that already has a waiting ticket merges into it
+(taking the higher priority) instead of queueing another run. Urgent tickets
+skip the window, and a waiting ticket raised to urgent starts at once. A submission for
+a conversation that is in flight becomes a single pending re-run, held until
+the current run finishes, so one conversation never has two runs at once.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from sentinelcx.config import Settings
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_LANES = ("urgent", "high", "medium", "low")
+DEFAULT_PRIORITY = "medium"
+
+
+class QueueFullError(Exception):
+    """Raised when the scheduler queue is at capacity."""
+
+
+@dataclass
+class ScheduledTicket:
+    conversation_id: str
+    priority: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+    # Set once the coalescing window has elapsed
+    ready: bool = False
+    # Set once the ticket sits in a priority lane
+    queued: bool = False
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass
+class SchedulerMetrics:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    # Submissions merged into an already waiting ticket (runs avoided)
+    coalesced: int = 0
+    max_depth: int = 0
+    wait_times_ms: deque = field(default_factory=lambda: deque(maxlen=1000))
+
+
+def normalize_priority(priority: str | None) -> str:
+    """Map a Chatwoot/API priority value onto a scheduler lane."""
+    priority = (priority or "").lower()
+    return priority if priority in PRIORITY_LANES else DEFAULT_PRIORITY
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+class TicketScheduler:
+    """Asyncio work queue that runs tickets on a bounded worker pool."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        process: Callable[[str], Awaitable[dict]] | None = None,
+    ) -> None:
+        self._settings = settings
+        self._process = process or self._process_with_orchestrator
+        self._lanes: dict[str, deque[ScheduledTicket]] = {p: deque() for p in PRIORITY_LANES}
+        self._available: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: list[asyncio.Task] = []
+        self._in_flight: dict[str, ScheduledTicket] = {}
+        # Tickets not yet started, one per conversation (coalescing, queued or held)
+        self._waiting: dict[str, ScheduledTicket] = {}
+        self._start_listeners: list[Callable[[str, asyncio.Future], None]] = []
+        self.metrics = SchedulerMetrics()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def depth(self) -> int:
+        return len(self._waiting)
+
+    def add_start_listener(self, listener: Callable[[str, asyncio.Future], None]) -> None:
+        """Call ``listener(conversation_id, future)`` whenever a worker starts a ticket."""
+        self._start_listeners.append(listener)
+
+    def is_waiting(self, conversation_id: str) -> bool:
+        """True if a submission for this conversation would be coalesced."""
+        return conversation_id in self._waiting
+
+    async def start(self) -> None:
+        """Start the worker tasks."""
+        self._ensure_workers()
+
+    async def stop(self) -> None:
+        """Cancel workers and fail any tickets still waiting in the queue."""
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for lane in self._lanes.values():
+            lane.clear()
+        waiting, self._waiting = self._waiting, {}
+        self._in_flight.clear()
+        for ticket in waiting.values():
+            if ticket.timer is not None:
+                ticket.timer.cancel()
+            if not ticket.future.done():
+                ticket.future.cancel()
+        self._available = None
+        logger.info("Ticket scheduler stopped")
+
+    def submit(self, conversation_id: str, priority: str | None = None) -> asyncio.Future:
+        """Queue a conversation for processing.
+
+        Returns a future resolved with the orchestrator result. If the
+        conversation already has a waiting ticket, the submission is merged
+        into it and that ticket's future is returned. Raises
+        ``QueueFullError`` when the queue is at capacity.
+        """
+        self._ensure_workers()
+        lane = normalize_priority(priority)
+        existing = self._waiting.get(conversation_id)
+        if existing is not None:
+            self._merge(existing, lane)
+            return existing.future
+
+        if self.depth >= self._settings.scheduler.max_queue_size:
+            self.metrics.rejected += 1
+            raise QueueFullError(
+                f"Ticket queue is full ({self._settings.scheduler.max_queue_size} waiting)"
+            )
+
+        loop = asyncio.get_running_loop()
+        ticket = ScheduledTicket(
+            conversation_id=conversation_id,
+            priority=lane,
+            future=loop.create_future(),
+        )
+        self._waiting[conversation_id] = ticket
+        self.metrics.submitted += 1
+        self.metrics.max_depth = max(self.metrics.max_depth, self.depth)
+
+        window = self._settings.scheduler.coalesce_window
+        if window > 0 and lane != PRIORITY_LANES[0]:
+            ticket.timer = loop.call_later(window, self._mark_ready, ticket)
+        else:
+            self._mark_ready(ticket)
+        logger.info(
+            "Accepted conversation %s for %s lane (depth=%d)", conversation_id, lane, self.depth
+        )
+        return ticket.future
+
+    def stats(self) -> dict:
+        """Queue depth, throughput counters and wait-time percentiles."""
+        m = self.metrics
+        waits = list(m.wait_times_ms)
+        return {
+            "workers": len(self._workers),
+            "max_queue_size": self._settings.scheduler.max_queue_size,
+            "depth": self.depth,
+            "lanes": {name: len(lane) for name, lane in self._lanes.items()},
+            "held": sum(1 for t in self._waiting.values() if not t.queued),
+            "in_flight": len(self._in_flight),
+            "submitted": m.submitted,
+            "coalesced": m.coalesced,
+            "completed": m.completed,
+            "failed": m.failed,
+            "rejected": m.rejected,
+            "max_depth": m.max_depth,
+            "wait_ms": {
+                "avg": round(sum(waits) / len(waits), 1) if waits else 0.0,
+                "p50": round(_percentile(waits, 0.50), 1),
+                "p95": round(_percentile(waits, 0.95), 1),
+                "max": round(max(waits), 1) if waits else 0.0,
+            },
+        }
+
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._workers and self._loop is loop:
+            return
+        # Workers are bound to the loop that started them (e.g. a new test client loop)
+        self._loop = loop
+        self._available = asyncio.Semaphore(sum(len(lane) for lane in self._lanes.values()))
+        self._workers = [
+            asyncio.create_task(self._worker_loop(i))
+            for i in range(max(1, self._settings.scheduler.workers))
+        ]
+        logger.info("Ticket scheduler started with %d workers", len(self._workers))
+
+    def _merge(self, ticket: ScheduledTicket, lane: str) -> None:
+        """Fold a duplicate submission into a waiting ticket."""
+        self.metrics.coalesced += 1
+        if PRIORITY_LANES.index(lane) < PRIORITY_LANES.index(ticket.priority):
+            if ticket.queued:
+                self._lanes[ticket.priority].remove(ticket)
+                self._lanes[lane].append(ticket)
+            ticket.priority = lane
+            if lane == PRIORITY_LANES[0] and ticket.timer is not None:
+                # Urgent tickets do not wait out the coalescing window
+                ticket.timer.cancel()
+                self._mark_ready(ticket)
+        logger.info(
+            "Coalesced event for conversation %s into waiting run (priority=%s, coalesced=%d)",
+            ticket.conversation_id,
+            ticket.priority,
+            self.metrics.coalesced,
+        )
+
+    def _mark_ready(self, ticket: ScheduledTicket) -> None:
+        """End a ticket's coalescing window and queue it unless its conversation is running."""
+        ticket.timer = None
+        ticket.ready = True
+        if self._waiting.get(ticket.conversation_id) is not ticket:
+            return
+        if ticket.conversation_id in self._in_flight:
+            # Held as the pending re-run; queued when the current run finishes
+            return
+        self._enqueue(ticket)
+
+    def _enqueue(self, ticket: ScheduledTicket) -> None:
+        ticket.queued = True
+        self._lanes[ticket.priority].append(ticket)
+        self._available.release()
+
+    def _pop_next(self) -> ScheduledTicket:
+        for name in PRIORITY_LANES:
+            if self._lanes[name]:
+                return self._lanes[name].popleft()
+        raise RuntimeError("Scheduler semaphore released with no queued ticket")
+
+    async def _worker_loop(self, worker_id: int) -> None:
+        while True:
+            await self._available.acquire()
+            ticket = self._pop_next()
+            if self._waiting.get(ticket.conversation_id) is ticket:
+                del self._waiting[ticket.conversation_id]
+            if ticket.future.done():
+                continue
+
+            wait_ms = (time.monotonic() - ticket.enqueued_at) * 1000
+            self.metrics.wait_times_ms.append(wait_ms)
+            self._in_flight[ticket.conversation_id] = ticket
+            for listener in self._start_listeners:
+                try:
+                    listener(ticket.conversation_id, ticket.future)
+                except Exception:
+                    logger.exception("Scheduler start listener failed")
+            logger.info(
+                "Worker %d processing conversation %s (priority=%s, waited %.0fms)",
+                worker_id,
+                ticket.conversation_id,
+                ticket.priority,
+                wait_ms,
+            )
+            try:
+                result = await self._process(ticket.conversation_id)
+            except asyncio.CancelledError:
+                if not ticket.future.done():
+                    ticket.future.cancel()
+                raise
+            except Exception as exc:
+                logger.exception("Error processing conversation %s", ticket.conversation_id)
+                self.metrics.failed += 1
+                if not ticket.future.done():
+                    ticket.future.set_exception(exc)
+            else:
+                self.metrics.completed += 1
+                if not ticket.future.done():
+                    ticket.future.set_result(result)
+            finally:
+                self._in_flight.pop(ticket.conversation_id, None)
+                pending = self._waiting.get(ticket.conversation_id)
+                if pending is not None and pending.ready and not pending.queued:
+                    self._enqueue(pending)
+
+    async def _process_with_orchestrator(self, conversation_id: str) -> dict:
+        from sentinelcx.orchestrator import SentinelCXOrchestrator
+
+        orchestrator = SentinelCXOrchestrator(self._settings)
+        return await orchestrator.process_ticket(conversation_id)
+
+
+_scheduler: TicketScheduler | None = None
+
+
+def get_ticket_scheduler(settings: Settings | None = None) -> TicketScheduler:
+    """Get the global ticket scheduler instance."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = TicketScheduler(settings or Settings())
+    return _scheduler
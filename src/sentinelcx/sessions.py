@@ -0,0 +1,214 @@
+"""Pool of persistent Claude CLI sessions reused across tickets.
+
+The one-shot ``query()`` function starts a new Claude Code CLI process for
+every call, which then re-reads the system prompt and agent definitions and
+(in ``stdio`` MCP mode) spawns every MCP server again before the first turn.
+This pool keeps ``ClaudeSDKClient`` sessions connected instead. A session is
+bound to the options it was started with, so sessions are grouped by a
+fingerprint of those options and a ticket only reuses a session whose options
+match its own. After each ticket the conversation is cleared with ``/clear``;
+a session whose reset fails, whose run raised or was cancelled, or that has
+served ``session_max_tickets`` tickets is closed rather than reused.
+
+Each session is connected and disconnected by its own owner task, because the
+SDK client's internal task group must be entered and exited from the same task
+while tickets run on whichever scheduler worker picked them up.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+
+from claude_agent_sdk import (
+    ClaudeAgentOptions,
+    ClaudeSDKClient,
+    ConversationResetMessage,
+    ResultMessage,
+)
+
+from sentinelcx.config import Settings
+from sentinelcx.mcp_servers.event_emitter import current_conversation_id, current_run_id
+
+logger = logging.getLogger(__name__)
+
+ClientFactory = Callable[[ClaudeAgentOptions], ClaudeSDKClient]
+
+
+def options_fingerprint(options: ClaudeAgentOptions) -> str:
+    """Stable key for the options a CLI session is started with."""
+    relevant = {
+        "system_prompt": options.system_prompt,
+        "model": options.model,
+        "allowed_tools": options.allowed_tools,
+        "permission_mode": options.permission_mode,
+        "max_turns": options.max_turns,
+        "max_budget_usd": options.max_budget_usd,
+        "mcp_servers": options.mcp_servers,
+        "agents": {name: asdict(agent) for name, agent in (options.agents or {}).items()},
+        "env": options.env,
+    }
+    # In-process MCP server instances are long-lived; identify them by object id
+    encoded = json.dumps(
+        relevant, sort_keys=True, default=lambda obj: f"{type(obj).__name__}@{id(obj)}"
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+@dataclass
+class PooledSession:
+    key: str
+    client: ClaudeSDKClient | None = None
+    tickets_served: int = 0
+    created_at: float = field(default_factory=time.time)
+    _owner: asyncio.Task | None = field(default=None, repr=False)
+    _closing: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._owner is not None:
+            await asyncio.gather(self._owner, return_exceptions=True)
+
+
+class ClaudeSessionPool:
+    """Keeps connected SDK client sessions idle between tickets, keyed by options."""
+
+    def __init__(self, settings: Settings, client_factory: ClientFactory = ClaudeSDKClient) -> None:
+        cfg = settings.orchestrator
+        self._max_idle = max(1, cfg.session_pool_size)
+        self._max_tickets = cfg.session_max_tickets
+        self._reset_timeout = cfg.session_reset_timeout
+        self._client_factory = client_factory
+        # Idle sessions per options key, least recently used first across keys
+        self._idle: dict[str, list[PooledSession]] = {}
+        self._idle_order: list[PooledSession] = []
+        self._closing: set[asyncio.Task] = set()
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    @asynccontextmanager
+    async def session(self, options: ClaudeAgentOptions) -> AsyncIterator[ClaudeSDKClient]:
+        """Lease a connected client for one run with these options."""
+        key = options_fingerprint(options)
+        pooled = self._take_idle(key)
+        if pooled is None:
+            pooled = await self._connect(key, options)
+        else:
+            self.reused += 1
+
+        try:
+            yield pooled.client
+        except BaseException:
+            # Mid-response state is unknown; closing also stops the CLI's MCP children
+            self.discarded += 1
+            await asyncio.shield(self._close_in_background(pooled))
+            raise
+
+        pooled.tickets_served += 1
+        if pooled.tickets_served >= self._max_tickets or not await self._reset(pooled):
+            await pooled.close()
+            return
+        self._put_idle(pooled)
+
+    async def stop(self) -> None:
+        """Close every idle session."""
+        idle, self._idle_order = self._idle_order, []
+        self._idle.clear()
+        await asyncio.gather(*(s.close() for s in idle), *self._closing)
+        logger.info("Claude session pool stopped")
+
+    def stats(self) -> dict:
+        return {
+            "idle": len(self._idle_order),
+            "idle_by_options": {key: len(group) for key, group in self._idle.items() if group},
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+        }
+
+    async def _connect(self, key: str, options: ClaudeAgentOptions) -> PooledSession:
+        pooled = PooledSession(key=key)
+        connected: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        async def _own() -> None:
+            # The session outlives the ticket that started it, so its in-process
+            # MCP tool calls must not be attributed to (or cached for) that ticket
+            current_conversation_id.set(None)
+            current_run_id.set(None)
+            try:
+                async with self._client_factory(options) as client:
+                    pooled.client = client
+                    connected.set_result(None)
+                    await pooled._closing.wait()
+            except BaseException as exc:
+                if not connected.done():
+                    connected.set_exception(exc)
+                else:
+                    logger.warning("Claude session %s closed with error: %r", key, exc)
+
+        start = time.perf_counter()
+        pooled._owner = asyncio.create_task(_own())
+        await connected
+        self.created += 1
+        logger.info(
+            "Started Claude session (options %s) in %.0fms",
+            key,
+            (time.perf_counter() - start) * 1000,
+        )
+        return pooled
+
+    async def _reset(self, pooled: PooledSession) -> bool:
+        """Clear the conversation so the next ticket starts from an empty transcript."""
+
+        async def _clear() -> None:
+            await pooled.client.query("/clear")
+            async for message in pooled.client.receive_messages():
+                if isinstance(message, ResultMessage | ConversationResetMessage):
+                    return
+
+        try:
+            await asyncio.wait_for(_clear(), timeout=self._reset_timeout)
+        except Exception as exc:
+            logger.warning("Could not reset Claude session %s: %r", pooled.key, exc)
+            self.discarded += 1
+            return False
+        return True
+
+    def _take_idle(self, key: str) -> PooledSession | None:
+        group = self._idle.get(key)
+        if not group:
+            return None
+        pooled = group.pop()
+        self._idle_order.remove(pooled)
+        return pooled
+
+    def _put_idle(self, pooled: PooledSession) -> None:
+        self._idle.setdefault(pooled.key, []).append(pooled)
+        self._idle_order.append(pooled)
+        while len(self._idle_order) > self._max_idle:
+            evicted = self._idle_order.pop(0)
+            self._idle[evicted.key].remove(evicted)
+            self._close_in_background(evicted)
+
+    def _close_in_background(self, pooled: PooledSession) -> asyncio.Task:
+        # Keep a reference so the close finishes even if the caller is cancelled
+        task = asyncio.create_task(pooled.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+        return task
+
+
+_pool: ClaudeSessionPool | None = None
+
+
+def get_session_pool(settings: Settings | None = None) -> ClaudeSessionPool:
+    """Get the global Claude session pool instance."""
+    global _pool
+    if _pool is None:
+        _pool = ClaudeSessionPool(settings or Settings())
+    return _pool
@@ -0,0 +1,45 @@
+"""Smoke test of the end-to-end API load benchmark."""
+
+import argparse
+
+from benchmarks import api_load
+from sentinelcx import jobs, replay, scheduler
+from sentinelcx.dashboard import event_bus, telemetry
+
+
+async def test_api_load_step(tmp_path, monkeypatch):
+    # The benchmark installs its own singletons; restore ours afterwards
+    for module, name in [
+        (event_bus, "_bus"),
+        (jobs, "_manager"),
+        (scheduler, "_scheduler"),
+        (replay, "_recordings"),
+        (telemetry, "_listener"),
+    ]:
+        monkeypatch.setattr(module, name, None)
+
+    args = argparse.Namespace(
+        rates=[20.0],
+        duration=1.0,
+        process_clients=2,
+        sse_clients=2,
+        workers=4,
+        max_queue=100,
+        tickets=10,
+        ticket_seconds=0.1,
+        downstream_latency_ms=0.0,
+        downstream_error_rate=0.0,
+        timeout=30.0,
+    )
+    report = await api_load.run(args, tmp_path)
+
+    [step] = report["steps"]
+    assert step["webhooks"]["requests"] == 20
+    assert set(step["webhooks"]["statuses"]) == {"200"}
+    assert step["process"]["statuses"].get("200", 0) >= 2
+    assert step["scheduler"]["failed"] == 0
+    assert step["sse"]["delivery_lag"]["n"] > 0
+    assert step["sqlite_writes"]["latency"]["p99_ms"] >= 0
+    assert step["event_loop_lag"]["n"] > 0
+    assert step["rss_mb"]["end"] > 0
+    assert (tmp_path / "dashboard.db").exists()
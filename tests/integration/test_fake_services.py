@@ -0,0 +1,96 @@
+"""Integration tests running the real clients against the fake services."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from fake_services import FakeDataset, FakeServices, FaultConfig
+from fake_services.salesforce import SOQLError, run_soql
+from sentinelcx.clients.chatwoot_client import ChatwootClient
+from sentinelcx.clients.salesforce_client import SalesforceClient
+from sentinelcx.clients.slack_client import SlackClient
+
+
+@pytest.fixture(scope="module")
+def services():
+    with FakeServices(FakeDataset.generate(tickets=10)) as running:
+        yield running
+
+
+def test_dataset_is_deterministic():
+    first, second = FakeDataset.generate(tickets=5), FakeDataset.generate(tickets=5)
+    assert first.messages == second.messages
+    assert first.sobjects == second.sobjects
+
+
+async def test_chatwoot_client(services):
+    client = ChatwootClient(services.settings().chatwoot)
+    try:
+        conversation = await client.get_conversation(1)
+        name = conversation["meta"]["sender"]["name"]
+        messages = await client.get_messages(1)
+        assert messages[0]["content"].startswith("Subject:")
+
+        await client.send_message(1, "We are on it.")
+        assert (await client.get_messages(1))[-1]["content"] == "We are on it."
+        toggled = await client.toggle_status(1, "resolved")
+        assert toggled["payload"]["current_status"] == "resolved"
+        assert (await client.get_sla_status(1))["status"] == "resolved"
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_conversation(9999)
+    finally:
+        await client.close()
+
+    # Conversation senders match Salesforce contacts, as with the seeded services
+    salesforce = SalesforceClient(services.settings().salesforce)
+    customer = await asyncio.to_thread(salesforce.get_customer_by_name, name)
+    assert customer["matched_contact"]["Name"] == name
+
+
+async def test_salesforce_client(services):
+    client = SalesforceClient(services.settings().salesforce)
+    account = services.dataset.sobjects["Account"][0]
+    customer = await asyncio.to_thread(client.get_customer, account["Id"])
+    assert customer["Name"] == account["Name"]
+    assert customer["contacts"][0]["Email"]
+
+    cases = await asyncio.to_thread(client.get_case_history, account["Id"])
+    assert [c["CreatedDate"] for c in cases] == sorted(
+        (c["CreatedDate"] for c in cases), reverse=True
+    )
+    purchases = await asyncio.to_thread(client.get_purchase_history, account["Id"])
+    assert all(p["StageName"] == "Closed Won" for p in purchases)
+    health = await asyncio.to_thread(client.get_account_health, account["Id"])
+    assert health["total_cases"] == len(cases)
+    assert await asyncio.to_thread(client.get_customer_by_name, "Nobody Here") == {}
+
+
+def test_soql_subset():
+    dataset = FakeDataset.generate(tickets=1)
+    result = run_soql(dataset, "SELECT Id FROM Contact WHERE LastName = 'O\\'Brien' LIMIT 1")
+    assert result == {"totalSize": 0, "done": True, "records": []}
+    with pytest.raises(SOQLError):
+        run_soql(dataset, "SELECT Id FROM Account WHERE Name LIKE 'S%'")
+
+
+async def test_slack_client(services):
+    client = SlackClient(services.settings().slack)
+    posted = await client.post_escalation("Escalating ticket 1")
+    assert posted["ok"] is True
+    assert services.dataset.posted[-1]["text"] == "Escalating ticket 1"
+    team = await client.get_team_availability("#support-escalations")
+    assert len(team) == 6
+    assert all(member["name"] for member in team)
+
+
+def test_latency_and_error_injection():
+    faults = {"chatwoot": FaultConfig(latency_ms=50, error_rate=0.5, seed=1)}
+    with FakeServices(FakeDataset.generate(tickets=1), faults) as services:
+        url = f"{services.urls['chatwoot']}/api/v1/accounts/1/conversations/1"
+        start = time.perf_counter()
+        codes = [httpx.get(url).status_code for _ in range(20)]
+        elapsed = time.perf_counter() - start
+    assert elapsed >= 20 * 0.05
+    assert set(codes) == {200, 503}
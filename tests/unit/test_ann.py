@@ -0,0 +1,91 @@
+"""Tests for the approximate nearest-neighbour backends of the knowledge index."""
+
+import numpy as np
+import pytest
+
+from sentinelcx.knowledge.ann import ExactIndex, get_backend, recall_at_k
+from sentinelcx.knowledge.index import normalize, open_index, write_index
+
+
+def clustered_vectors(count: int, dim: int = 32, clusters: int = 20, seed: int = 0):
+    """Unit vectors drawn around random cluster centres, like topical text embeddings."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dim))
+    points = centres[rng.integers(clusters, size=count)] + 0.3 * rng.normal(size=(count, dim))
+    return normalize(points)
+
+
+def build(tmp_path, backend: str, params: dict | None = None, count: int = 2000):
+    vectors = clustered_vectors(count)
+    metadata = [{"text": f"chunk {i}", "source_file": "x.md", "heading": ""} for i in range(count)]
+    write_index(tmp_path, "test-model", vectors, metadata, backend, params)
+    return open_index(tmp_path, "test-model")
+
+
+@pytest.fixture
+def queries():
+    return clustered_vectors(50, seed=1)
+
+
+class TestExactIndex:
+    def test_matches_full_sort(self, tmp_path, queries):
+        index = build(tmp_path, "exact", count=300)
+        results = index.ann.search(queries, 10)
+        scores = np.asarray(index.vectors) @ queries.T
+        for q, (ids, best) in enumerate(results):
+            assert ids.tolist() == np.argsort(-scores[:, q], kind="stable")[:10].tolist()
+            assert best == pytest.approx(scores[ids, q])
+
+    def test_k_larger_than_index(self, tmp_path, queries):
+        index = build(tmp_path, "exact", count=5)
+        assert all(len(ids) == 5 for ids, _ in index.ann.search(queries, 10))
+
+
+class TestIVFIndex:
+    def test_probing_every_list_is_exact(self, tmp_path, queries):
+        index = build(tmp_path, "ivf", {"nlist": 16, "nprobe": 16})
+        exact = ExactIndex(index.vectors).search(queries, 10)
+        approx = index.ann.search(queries, 10)
+        assert recall_at_k([e[0] for e in exact], [a[0] for a in approx], 10) == 1.0
+        for (_, exact_scores), (_, approx_scores) in zip(exact, approx):
+            assert approx_scores == pytest.approx(exact_scores, abs=1e-5)
+
+    def test_recall_grows_with_nprobe(self, tmp_path, queries):
+        index = build(tmp_path, "ivf", {"nlist": 64, "nprobe": 1})
+        exact = [ids for ids, _ in ExactIndex(index.vectors).search(queries, 10)]
+        recalls = []
+        for nprobe in (1, 4, 16):
+            index.ann.nprobe = nprobe
+            recalls.append(recall_at_k(exact, [i for i, _ in index.ann.search(queries, 10)], 10))
+        assert recalls == sorted(recalls)
+        assert recalls[-1] > 0.9
+
+    def test_params_recorded_in_header(self, tmp_path):
+        index = build(tmp_path, "ivf", {"nlist": 10_000}, count=100)
+        ann = index.header["ann"]
+        assert ann["backend"] == "ivf"
+        # nlist is capped at the number of vectors, nprobe defaults
+        assert ann["params"]["nlist"] == 100
+        assert ann["params"]["nprobe"] == 8
+        assert (tmp_path / "ivf.ids.npy").exists()
+
+    def test_rebuild_removes_other_backend_files(self, tmp_path):
+        build(tmp_path, "ivf", count=100)
+        build(tmp_path, "exact", count=100)
+        assert not list(tmp_path.glob("ivf.*"))
+
+
+class TestHNSWIndex:
+    def test_high_recall(self, tmp_path, queries):
+        pytest.importorskip("hnswlib")
+        index = build(tmp_path, "hnsw", {"M": 16, "ef_search": 100})
+        exact = ExactIndex(index.vectors).search(queries, 10)
+        approx = index.ann.search(queries, 10)
+        assert recall_at_k([e[0] for e in exact], [a[0] for a in approx], 10) > 0.95
+        ids, scores = approx[0]
+        assert scores == pytest.approx(np.asarray(index.vectors)[ids] @ queries[0], abs=1e-5)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown ANN backend"):
+        get_backend("faiss")
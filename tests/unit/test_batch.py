@@ -0,0 +1,109 @@
+"""Tests for batch ticket processing."""
+
+import argparse
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from sentinelcx import batch as batch_module
+from sentinelcx.api.app import create_app
+from sentinelcx.api.routes import tickets as tickets_routes
+from sentinelcx.batch import completed_ids, process_batch, read_conversation_ids
+from sentinelcx.config import SchedulerSettings, Settings
+from sentinelcx.scheduler import TicketScheduler
+
+
+class TestProcessBatch:
+    async def test_respects_concurrency_and_streams_as_completed(self):
+        running = 0
+        peak = 0
+
+        async def process(conversation_id: str) -> dict:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05 if conversation_id == "slow" else 0.01)
+            running -= 1
+            if conversation_id == "bad":
+                raise RuntimeError("boom")
+            return {"success": True, "turns": 3}
+
+        ids = ["slow", "1", "2", "bad", "3", "1"]
+        records = [r async for r in process_batch(ids, process, concurrency=2)]
+
+        assert peak == 2
+        assert len(records) == 5
+        assert records[-1]["conversation_id"] == "slow"
+        failed = next(r for r in records if r["conversation_id"] == "bad")
+        assert failed["success"] is False and failed["error"] == "boom"
+        assert all(r["turns"] == 3 for r in records if r["success"])
+
+
+class TestBatchCli:
+    def test_read_ids_and_resume_state(self, tmp_path):
+        ids_file = tmp_path / "ids.txt"
+        ids_file.write_text("1\n\n2  # retry\n# comment\n2\n3\n")
+        assert read_conversation_ids(ids_file) == ["1", "2", "3"]
+
+        output = tmp_path / "out.ndjson"
+        output.write_text(
+            json.dumps({"conversation_id": "1", "success": True})
+            + "\n"
+            + json.dumps({"conversation_id": "2", "success": False})
+            + '\n{"conversation_id": "3", "succ'
+        )
+        assert completed_ids(output) == {"1", "2"}
+        assert completed_ids(output, retry_failed=True) == {"1"}
+
+    async def test_resume_skips_completed(self, tmp_path, monkeypatch):
+        processed: list[str] = []
+
+        class FakeOrchestrator:
+            def __init__(self, settings):
+                pass
+
+            async def process_ticket(self, conversation_id: str) -> dict:
+                processed.append(conversation_id)
+                return {"success": True}
+
+        monkeypatch.setattr("sentinelcx.orchestrator.SentinelCXOrchestrator", FakeOrchestrator)
+        ids_file = tmp_path / "ids.txt"
+        ids_file.write_text("1\n2\n3\n")
+        output = tmp_path / "ids.results.ndjson"
+        output.write_text(json.dumps({"conversation_id": "2", "success": True}) + "\n")
+
+        args = argparse.Namespace(
+            ids_file=str(ids_file), output=None, concurrency=2, resume=True, retry_failed=False
+        )
+        summary = await batch_module.run_cli(args)
+
+        assert sorted(processed) == ["1", "3"]
+        assert summary == {"processed": 2, "succeeded": 2, "failed": 0}
+        assert len(output.read_text().splitlines()) == 3
+
+
+def test_process_batch_endpoint_streams_ndjson(monkeypatch):
+    async def process(conversation_id: str) -> dict:
+        return {"success": conversation_id != "2", "conversation_id": conversation_id}
+
+    settings = Settings(
+        _env_file=None, scheduler=SchedulerSettings(_env_file=None, coalesce_window=0)
+    )
+    scheduler = TicketScheduler(settings, process=process)
+    monkeypatch.setattr(tickets_routes, "get_ticket_scheduler", lambda settings: scheduler)
+
+    client = TestClient(create_app())
+    response = client.post(
+        "/api/v1/tickets/process_batch",
+        json={"conversation_ids": ["1", "2", "3"], "concurrency": 2},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert {r["conversation_id"]: r["success"] for r in records} == {
+        "1": True,
+        "2": False,
+        "3": True,
+    }
+    assert scheduler.stats()["completed"] == 3
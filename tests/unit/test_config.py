@@ -3,6 +3,7 @@
 from sentinelcx.config import (
     ChatwootSettings,
     KnowledgeBaseSettings,
+    MCPSettings,
     SalesforceSettings,
     Settings,
     SlackSettings,
@@ -38,6 +39,11 @@ class TestSettings:
         assert kb.embedding_model_name == "all-MiniLM-L6-v2"
         assert kb.knowledge_base_path == "./knowledge_base"
 
+    def test_mcp_defaults(self):
+        mcp = MCPSettings(_env_file=None)
+        assert mcp.transport == "stdio"
+        assert set(mcp.pool_sizes) == {"chatwoot", "salesforce", "knowledge", "slack"}
+
     def test_settings_from_env(self, monkeypatch):
         monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-123")
         settings = Settings()
@@ -0,0 +1,192 @@
+"""Tests for concurrent ticket context prefetch."""
+
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from sentinelcx.agents import context as context_module
+from sentinelcx.agents.context import TicketContext, prefetch_ticket_context
+from sentinelcx.agents.definitions import ALL_AGENTS, with_ticket_context
+from sentinelcx.config import Settings
+from sentinelcx.dashboard.event_bus import DashboardEvent, EventBus, EventType
+from sentinelcx.dashboard.store import DashboardStore
+
+DELAY = 0.1
+
+TICKET = {
+    "id": 42,
+    "status": "open",
+    "priority": "high",
+    "meta": {"sender": {"id": 7, "name": "Ada Lovelace", "email": "ada@example.com"}},
+}
+MESSAGES = [
+    {"id": i, "message_type": 0, "content": f"message {i}", "sender": {"name": "Ada Lovelace"}}
+    for i in range(30)
+]
+
+
+class FakeChatwootClient:
+    def __init__(self, settings):
+        pass
+
+    async def get_conversation(self, conversation_id):
+        await asyncio.sleep(DELAY)
+        return TICKET
+
+    async def get_messages(self, conversation_id):
+        await asyncio.sleep(DELAY)
+        return MESSAGES
+
+    async def close(self):
+        pass
+
+
+class FakeSalesforceClient:
+    def get_customer_by_name(self, name):
+        time.sleep(DELAY)
+        assert name == "Ada Lovelace"
+        return {"Id": "001A", "Name": "Analytical Engines", "attributes": {"type": "Account"}}
+
+    def get_case_history(self, account_id):
+        time.sleep(DELAY)
+        return [
+            {"Id": "500A", "CaseNumber": "00001", "Subject": "Sync failing", "Status": "Closed"}
+        ]
+
+    def get_purchase_history(self, account_id):
+        time.sleep(DELAY)
+        return [{"Id": "006A", "Name": "Enterprise plan", "Amount": 60000}]
+
+
+@pytest.fixture
+def settings():
+    return Settings(_env_file=None)
+
+
+@pytest.fixture
+def fake_clients(monkeypatch):
+    monkeypatch.setattr(context_module, "ChatwootClient", FakeChatwootClient)
+    monkeypatch.setattr(
+        context_module, "_get_salesforce_client", lambda settings: FakeSalesforceClient()
+    )
+
+
+class TestPrefetchTicketContext:
+    async def test_fetches_full_bundle(self, settings, fake_clients):
+        ctx = await prefetch_ticket_context(settings, "42")
+        assert ctx.complete
+        assert ctx.ticket == TICKET
+        assert len(ctx.messages) == 30
+        assert ctx.customer["Id"] == "001A"
+        assert ctx.account_health["score"] == 100.0
+        assert ctx.account_health["total_cases"] == 1
+        assert ctx.errors == {}
+
+        data = ctx.to_prompt_data(max_messages=5)
+        assert data["recent_cases"][0]["Subject"] == "Sync failing"
+        assert data["purchases"]["count"] == 1
+        assert data["purchases"]["recent"][0]["Name"] == "Enterprise plan"
+
+    async def test_fetches_run_concurrently(self, settings, fake_clients):
+        start = time.perf_counter()
+        ctx = await prefetch_ticket_context(settings, "42")
+        elapsed = time.perf_counter() - start
+        # ticket -> customer -> cases and purchases is the critical path; messages overlap it
+        assert elapsed < 4 * DELAY
+        assert ctx.duration_ms > 0
+
+    async def test_salesforce_failure_keeps_chatwoot_data(self, settings, monkeypatch):
+        def _fail(settings):
+            raise RuntimeError("login failed")
+
+        monkeypatch.setattr(context_module, "ChatwootClient", FakeChatwootClient)
+        monkeypatch.setattr(context_module, "_get_salesforce_client", _fail)
+        ctx = await prefetch_ticket_context(settings, "42")
+        assert ctx.complete
+        assert ctx.customer == {}
+        assert "salesforce" in ctx.errors
+
+
+class TestTicketContext:
+    def test_prompt_data_is_trimmed(self):
+        ctx = TicketContext(
+            conversation_id="42",
+            ticket=TICKET,
+            messages=MESSAGES,
+            customer={"Id": "001A", "attributes": {"type": "Account"}},
+        )
+        data = ctx.to_prompt_data(max_messages=5)
+        assert data["ticket"]["contact"]["name"] == "Ada Lovelace"
+        assert [m["id"] for m in data["conversation_history"]] == [25, 26, 27, 28, 29]
+        assert data["customer_record"] == {"Id": "001A"}
+
+    def test_incomplete_without_ticket(self):
+        assert not TicketContext(conversation_id="42", messages=MESSAGES).complete
+
+    def test_agents_receive_context(self):
+        ctx = TicketContext(conversation_id="42", ticket=TICKET, messages=MESSAGES)
+        agents = with_ticket_context(ctx.to_prompt_data(max_messages=5))
+        assert set(agents) == set(ALL_AGENTS)
+        for name, agent in agents.items():
+            assert agent.prompt.startswith(ALL_AGENTS[name].prompt)
+            assert "Prefetched Ticket Context" in agent.prompt
+            assert "ada@example.com" in agent.prompt
+            assert '"recent_cases": []' in agent.prompt
+            assert agent.tools == ALL_AGENTS[name].tools
+        assert "Prefetched Ticket Context" not in ALL_AGENTS["triage"].prompt
+
+
+class TestStorePrefetchColumns:
+    def test_migrates_existing_database(self, tmp_path):
+        db = tmp_path / "dashboard.db"
+        conn = sqlite3.connect(db)
+        conn.execute(
+            "CREATE TABLE tickets (conversation_id TEXT PRIMARY KEY, decision TEXT, "
+            "category TEXT, priority TEXT, confidence REAL, cost_usd REAL DEFAULT 0, "
+            "duration_ms REAL DEFAULT 0, turns INTEGER DEFAULT 0, success INTEGER DEFAULT 0, "
+            "created_at REAL NOT NULL, completed_at REAL)"
+        )
+        conn.commit()
+        conn.close()
+
+        store = DashboardStore(db)
+        store.save_ticket("1", {"turns": 12, "duration_ms": 9000, "created_at": 0})
+        store.save_ticket(
+            "2", {"turns": 6, "duration_ms": 5000, "prefetched": True, "prefetch_ms": 120.0}
+        )
+        stats = store.get_metrics()["prefetch_stats"]
+        assert stats["baseline"] == {
+            "tickets": 1,
+            "turns": 12,
+            "duration_ms": 9000,
+            "prefetch_ms": 0,
+        }
+        # The prefetch runs before the agent, so it counts toward the group's time
+        assert stats["prefetched"] == {
+            "tickets": 1,
+            "turns": 6,
+            "duration_ms": 5120.0,
+            "prefetch_ms": 120.0,
+        }
+        tickets = {t["conversation_id"]: t for t in store.get_tickets()}
+        assert tickets["2"]["prefetch_ms"] == 120.0
+        assert tickets["1"]["prefetch_ms"] is None
+        store.close()
+
+
+class TestEventBusPrefetchStats:
+    async def test_duration_includes_prefetch(self, tmp_path):
+        bus = EventBus(store=DashboardStore(tmp_path / "dashboard.db"))
+        for cid, data in (
+            ("1", {"turns": 12, "duration_ms": 9000}),
+            ("2", {"turns": 6, "duration_ms": 5000, "prefetched": True, "prefetch_ms": 120.0}),
+        ):
+            await bus.publish(
+                DashboardEvent(type=EventType.TICKET_COMPLETE, conversation_id=cid, data=data)
+            )
+        stats = bus.metrics.prefetch_stats
+        assert stats["baseline"]["duration_ms"] == 9000
+        assert stats["prefetched"]["duration_ms"] == 5120.0
+        assert stats["prefetched"]["prefetch_ms"] == 120.0
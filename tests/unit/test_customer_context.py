@@ -0,0 +1,70 @@
+"""Tests for the composite get_customer_context Salesforce tool."""
+
+import time
+
+import pytest
+from fastmcp import Client
+
+from sentinelcx.mcp_servers import salesforce_server
+
+_QUERY_SECONDS = 0.2
+
+
+class FakeSalesforceClient:
+    def get_customer_by_name(self, customer_name: str) -> dict:
+        if customer_name != "Sarah Johnson":
+            return {}
+        return {
+            "Id": "001A",
+            "Name": "Acme Corp",
+            "Description": "Tier: Enterprise",
+            "attributes": {"type": "Account"},
+            "contacts": [{"Name": "Sarah Johnson", "Email": "sarah@acme.test", "Phone": "1"}],
+            "matched_contact": {"Name": "Sarah Johnson", "Email": "sarah@acme.test"},
+        }
+
+    def get_case_history(self, account_id: str) -> list[dict]:
+        time.sleep(_QUERY_SECONDS)
+        return [
+            {"CaseNumber": f"{i:05d}", "Status": "Closed", "Description": "long text"}
+            for i in range(12)
+        ]
+
+    def get_purchase_history(self, account_id: str) -> list[dict]:
+        time.sleep(_QUERY_SECONDS)
+        return [
+            {"Name": f"Renewal {i}", "Amount": 10000, "StageName": "Closed Won"} for i in range(3)
+        ]
+
+
+@pytest.fixture(autouse=True)
+def salesforce(monkeypatch):
+    monkeypatch.setattr(salesforce_server, "_client", FakeSalesforceClient())
+    salesforce_server._cache.configure(ttl=0, max_entries=0)
+
+
+async def test_customer_context_fetches_history_concurrently():
+    async with Client(salesforce_server.salesforce_mcp) as client:
+        start = time.perf_counter()
+        result = await client.call_tool("get_customer_context", {"customer_name": "Sarah Johnson"})
+        elapsed = time.perf_counter() - start
+    context = result.data
+
+    assert elapsed < 2 * _QUERY_SECONDS
+    assert context["found"] is True
+    assert context["account_id"] == "001A"
+    assert context["account"]["contacts"] == [
+        {"Name": "Sarah Johnson", "Email": "sarah@acme.test", "Title": None}
+    ]
+    assert context["account_health"]["resolution_rate"] == 1.0
+    assert context["account_health"]["lifetime_value"] == 30000
+    assert len(context["recent_cases"]) == 10
+    assert "Description" not in context["recent_cases"][0]
+    assert context["purchases"]["count"] == 3
+    assert context["errors"] == {}
+
+
+async def test_customer_context_unknown_customer():
+    async with Client(salesforce_server.salesforce_mcp) as client:
+        result = await client.call_tool("get_customer_context", {"customer_name": "Nobody Here"})
+    assert result.data == {"found": False, "customer_name": "Nobody Here"}
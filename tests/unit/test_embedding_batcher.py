@@ -0,0 +1,73 @@
+"""Tests for micro-batching of concurrent embedding requests."""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from sentinelcx.knowledge.batcher import EmbeddingBatcher
+
+
+class RecordingEncoder:
+    """Encodes a text as [len(text), batch number] and records every batch."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.batches: list[list[str]] = []
+        self.delay = delay
+        self.threads: set[str] = set()
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        self.threads.add(threading.current_thread().name)
+        self.batches.append(list(texts))
+        if self.delay:
+            threading.Event().wait(self.delay)
+        return np.array([[len(t), len(self.batches)] for t in texts], dtype=np.float32)
+
+
+async def test_concurrent_requests_share_one_encode():
+    encoder = RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_batch_size=32, max_wait_ms=20)
+    texts = [["a"], ["bb", "ccc"], ["dddd"]]
+    results = await asyncio.gather(*(batcher.encode(t) for t in texts))
+
+    assert encoder.batches == [["a", "bb", "ccc", "dddd"]]
+    assert [r[:, 0].tolist() for r in results] == [[1], [2, 3], [4]]
+    assert all(name.startswith("kb-encode") for name in encoder.threads)
+    assert batcher.stats()["mean_batch_size"] == 4.0
+    await batcher.close()
+
+
+async def test_batches_are_capped_and_requests_queue_during_encode():
+    encoder = RecordingEncoder(delay=0.02)
+    batcher = EmbeddingBatcher(encoder, max_batch_size=4, max_wait_ms=1)
+    results = await asyncio.gather(*(batcher.encode([str(i)]) for i in range(10)))
+
+    assert [len(b) for b in encoder.batches] == [4, 4, 2]
+    # Callers get their own rows, in order, whichever batch served them
+    assert [int(r[0, 1]) for r in results] == [1] * 4 + [2] * 4 + [3] * 2
+    await batcher.close()
+
+
+async def test_lone_request_waits_at_most_max_wait():
+    batcher = EmbeddingBatcher(RecordingEncoder(), max_batch_size=32, max_wait_ms=5)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await batcher.encode(["alone"])
+    assert loop.time() - start < 0.5
+    assert batcher.stats()["batches"] == 1
+    await batcher.close()
+
+
+async def test_encode_errors_reach_every_caller_in_the_batch():
+    def failing(texts):
+        raise RuntimeError("model crashed")
+
+    batcher = EmbeddingBatcher(failing, max_wait_ms=10)
+    results = await asyncio.gather(
+        batcher.encode(["a"]), batcher.encode(["b"]), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        await batcher.encode(["c"])
+    await batcher.close()
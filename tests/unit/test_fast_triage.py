@@ -0,0 +1,116 @@
+"""Tests for the local k-NN fast-path triage classifier."""
+
+import json
+import zlib
+
+import numpy as np
+import pytest
+
+from sentinelcx.agents.fast_triage import FastTriageClassifier, load_labeled_examples
+from sentinelcx.config import FastTriageSettings, Settings
+
+
+class BagOfWordsModel:
+    """Deterministic stand-in for SentenceTransformer.encode."""
+
+    dim = 64
+
+    def encode(self, texts, convert_to_numpy=True):
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[i, zlib.crc32(word.encode()) % self.dim] += 1.0
+        return vectors
+
+
+def _examples() -> list[dict]:
+    billing = {"category": "billing", "priority": "high", "decision": "escalate"}
+    login = {"category": "technical", "priority": "medium", "decision": "auto_handle"}
+    examples = []
+    for i in range(15):
+        examples.append({"id": f"B{i}", "text": f"charged twice refund invoice {i}", **billing})
+        examples.append({"id": f"L{i}", "text": f"cannot login password reset {i}", **login})
+    return examples
+
+
+@pytest.fixture
+def classifier():
+    settings = Settings(_env_file=None, fast_triage=FastTriageSettings(_env_file=None, k=5))
+    clf = FastTriageClassifier(settings, model=BagOfWordsModel())
+    clf.fit(_examples())
+    return clf
+
+
+class TestFastTriageClassifier:
+    def test_predicts_nearest_labels(self, classifier):
+        prediction = classifier.predict("I was charged twice, need a refund")
+        assert prediction.category == "billing"
+        assert prediction.decision == "escalate"
+        assert prediction.priority == "high"
+        assert 0.0 <= prediction.confidence <= 1.0
+
+    def test_triage_dict_shape(self, classifier):
+        data = classifier.predict("password reset does not work").to_triage_dict()
+        assert data["decision"] == "auto_handle"
+        assert data["source"] == "fast_path"
+        assert set(data) == {"decision", "category", "priority", "confidence", "source"}
+
+    def test_leave_one_out_is_calibrated(self, classifier):
+        predictions = classifier.leave_one_out()
+        assert len(predictions) == 30
+        # Clusters are perfectly separable, so calibrated confidence is high
+        assert min(p.confidence for p in predictions) == pytest.approx(1.0)
+
+    def test_cross_validation_calibrates_without_the_held_out_fold(self, classifier, monkeypatch):
+        calibrated_on: list[set[str]] = []
+        original = FastTriageClassifier._calibrate
+
+        def spy(self, bins=10):
+            calibrated_on.append({e["id"] for e in self._examples})
+            original(self, bins)
+
+        monkeypatch.setattr(FastTriageClassifier, "_calibrate", spy)
+        predictions = classifier.cross_validate(folds=3)
+
+        assert len(predictions) == 30
+        assert [p.category for p in predictions[:2]] == ["billing", "technical"]
+        assert len(calibrated_on) == 3
+        all_ids = {e["id"] for e in _examples()}
+        held_out = [all_ids - ids for ids in calibrated_on]
+        # Each example is held out of exactly one fold's fit and calibration
+        assert sorted(len(h) for h in held_out) == [10, 10, 10]
+        assert set().union(*held_out) == all_ids
+
+    def test_predict_requires_fit(self):
+        clf = FastTriageClassifier(Settings(_env_file=None), model=BagOfWordsModel())
+        with pytest.raises(RuntimeError):
+            clf.predict("anything")
+
+
+def test_load_labeled_examples(tmp_path):
+    tickets = tmp_path / "tickets.jsonl"
+    truth = tmp_path / "truth.jsonl"
+    tickets.write_text(
+        json.dumps(
+            {
+                "id": "T1",
+                "subject": "Refund",
+                "body": "Please refund me",
+                "expected_category": "billing",
+                "expected_priority": "low",
+            }
+        )
+        + "\n"
+    )
+    truth.write_text(json.dumps({"ticket_id": "T1", "expected_decision": "auto_handle"}) + "\n")
+
+    examples = load_labeled_examples(str(tickets), str(truth))
+    assert examples == [
+        {
+            "id": "T1",
+            "text": "Refund\n\nPlease refund me",
+            "category": "billing",
+            "priority": "low",
+            "decision": "auto_handle",
+        }
+    ]
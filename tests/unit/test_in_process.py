@@ -0,0 +1,112 @@
+"""Tests for MCP transport selection and in-process server initialization."""
+
+import pytest
+
+from sentinelcx.config import MCPSettings, Settings
+from sentinelcx.mcp_servers import (
+    chatwoot_server,
+    in_process,
+    knowledge_base_server,
+    salesforce_server,
+    slack_server,
+)
+from sentinelcx.mcp_servers.event_emitter import CONVERSATION_ENV
+from sentinelcx.orchestrator import SentinelCXOrchestrator
+
+
+@pytest.fixture
+def init_calls(monkeypatch):
+    """Replace every server's initializer with one that records its calls."""
+    calls: list[str] = []
+    monkeypatch.setattr(in_process, "_initialized", set())
+    monkeypatch.setattr(in_process, "_failed", set())
+    for module, name, service in [
+        (salesforce_server, "init_client", "salesforce"),
+        (chatwoot_server, "init_client", "chatwoot"),
+        (knowledge_base_server, "init_search", "knowledge"),
+        (slack_server, "init_client", "slack"),
+    ]:
+        monkeypatch.setattr(module, name, lambda settings, s=service: calls.append(s))
+    return calls
+
+
+def _orchestrator(transport: str) -> SentinelCXOrchestrator:
+    return SentinelCXOrchestrator(
+        Settings(_env_file=None, mcp=MCPSettings(_env_file=None, transport=transport))
+    )
+
+
+class TestTransportSelection:
+    async def test_stdio_configs_are_tagged(self):
+        async with _orchestrator("stdio")._acquire_mcp_servers("42") as configs:
+            assert set(configs) == {"salesforce", "chatwoot", "knowledge", "slack"}
+            assert all(c["args"][0] == "-m" for c in configs.values())
+            assert all(c["env"][CONVERSATION_ENV] == "42" for c in configs.values())
+
+    async def test_in_process_configs(self, init_calls):
+        async with _orchestrator("in_process")._acquire_mcp_servers("42") as configs:
+            assert {c["type"] for c in configs.values()} == {"sdk"}
+            assert (
+                configs["knowledge"]["instance"] is knowledge_base_server.knowledge_mcp._mcp_server
+            )
+        assert sorted(init_calls) == ["chatwoot", "knowledge", "salesforce", "slack"]
+
+    async def test_pooled_falls_back_to_stdio_when_pool_not_running(self):
+        async with _orchestrator("pooled")._acquire_mcp_servers("42") as configs:
+            assert all("command" in c for c in configs.values())
+            assert configs["chatwoot"]["env"][CONVERSATION_ENV] == "42"
+
+
+def _flaky_init(attempts: list, failures: int):
+    def init(settings):
+        attempts.append(1)
+        if len(attempts) <= failures:
+            raise FileNotFoundError("Index not found")
+
+    return init
+
+
+class TestInProcessInit:
+    async def test_initializes_each_service_once(self, init_calls):
+        settings = Settings(_env_file=None)
+        await in_process.init_in_process_servers(settings)
+        await in_process.init_in_process_servers(settings)
+        assert sorted(init_calls) == ["chatwoot", "knowledge", "salesforce", "slack"]
+
+    async def test_failed_service_is_retried(self, init_calls, monkeypatch):
+        attempts = []
+        monkeypatch.setattr(knowledge_base_server, "init_search", _flaky_init(attempts, 1))
+        settings = Settings(_env_file=None)
+
+        await in_process.init_in_process_servers(settings)
+        assert "knowledge" not in in_process._initialized
+        assert in_process._failed == {"knowledge"}
+        assert sorted(init_calls) == ["chatwoot", "salesforce", "slack"]
+
+        await in_process.init_in_process_servers(settings)
+        assert len(attempts) == 2
+        assert "knowledge" in in_process._initialized
+        assert not in_process._failed
+        # Services that succeeded the first time are not initialized again
+        assert sorted(init_calls) == ["chatwoot", "salesforce", "slack"]
+
+    async def test_failed_service_not_retried_per_ticket(self, init_calls, monkeypatch):
+        attempts = []
+        monkeypatch.setattr(knowledge_base_server, "init_search", _flaky_init(attempts, 99))
+        orchestrator = _orchestrator("in_process")
+
+        for _ in range(3):
+            async with orchestrator._acquire_mcp_servers("42"):
+                pass
+        assert len(attempts) == 1
+        assert sorted(init_calls) == ["chatwoot", "salesforce", "slack"]
+
+    async def test_backoff_retry_recovers(self, init_calls, monkeypatch):
+        attempts = []
+        monkeypatch.setattr(knowledge_base_server, "init_search", _flaky_init(attempts, 2))
+        settings = Settings(_env_file=None)
+
+        await in_process.init_in_process_servers(settings)
+        await in_process.retry_failed_in_process_servers(settings, initial_delay=0.001)
+        assert len(attempts) == 3
+        assert in_process._initialized == {"chatwoot", "knowledge", "salesforce", "slack"}
@@ -0,0 +1,185 @@
+"""Tests for the persistent async job API."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from sentinelcx.api.app import create_app
+from sentinelcx.api.routes import jobs as jobs_routes
+from sentinelcx.config import SchedulerSettings, Settings
+from sentinelcx.dashboard import event_bus as event_bus_module
+from sentinelcx.dashboard.event_bus import DashboardEvent, EventBus, EventType
+from sentinelcx.dashboard.store import DashboardStore
+from sentinelcx.jobs import JobManager, JobStore
+from sentinelcx.scheduler import TicketScheduler
+
+
+def _settings(max_queue_size: int = 10) -> Settings:
+    return Settings(
+        _env_file=None,
+        scheduler=SchedulerSettings(
+            _env_file=None, workers=1, max_queue_size=max_queue_size, coalesce_window=0.0
+        ),
+    )
+
+
+def _manager(tmp_path, process, max_queue_size: int = 10) -> JobManager:
+    settings = _settings(max_queue_size)
+    scheduler = TicketScheduler(settings, process=process)
+    return JobManager(settings, store=JobStore(tmp_path / "jobs.db"), scheduler=scheduler)
+
+
+def _parse_sse(text: str) -> list[tuple[str, dict]]:
+    events = []
+    for chunk in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in chunk.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestJobManager:
+    async def test_lifecycle(self, tmp_path):
+        gate = asyncio.Event()
+        statuses: list[str] = []
+
+        async def process(conversation_id: str) -> dict:
+            statuses.append(manager.get(job["id"])["status"])
+            await gate.wait()
+            return {"success": conversation_id == "1", "result": "done"}
+
+        manager = _manager(tmp_path, process)
+        job = manager.submit("1", "high")
+        failing = manager.submit("2")
+        assert job["status"] == "queued"
+
+        gate.set()
+        finished = await manager.wait(job["id"], timeout=1.0)
+        assert statuses[0] == "running"
+        assert finished["status"] == "succeeded"
+        assert finished["result"] == {"success": True, "result": "done"}
+        assert finished["started_at"] >= finished["created_at"]
+        assert (await manager.wait(failing["id"], timeout=1.0))["status"] == "failed"
+
+    async def test_wait_times_out_and_propagates_cancellation(self, tmp_path):
+        gate = asyncio.Event()
+
+        async def process(conversation_id: str) -> dict:
+            await gate.wait()
+            return {"success": True}
+
+        manager = _manager(tmp_path, process)
+        job = manager.submit("1")
+        assert (await manager.wait(job["id"], timeout=0.01))["status"] == "running"
+
+        waiter = asyncio.create_task(manager.wait(job["id"], timeout=5.0))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # Cancelling a waiter leaves the job itself running
+        gate.set()
+        assert (await manager.wait(job["id"], timeout=1.0))["status"] == "succeeded"
+
+    async def test_recovers_after_restart(self, tmp_path):
+        processed: list[str] = []
+
+        async def process(conversation_id: str) -> dict:
+            processed.append(conversation_id)
+            return {"success": True}
+
+        store = JobStore(tmp_path / "jobs.db")
+        store.create("queued-job", "1", "low")
+        store.create("running-job", "2", None)
+        store.mark_running(["running-job"])
+        store.close()
+
+        manager = _manager(tmp_path, process)
+        await manager.start()
+
+        assert (await manager.wait("queued-job", timeout=1.0))["status"] == "succeeded"
+        interrupted = manager.get("running-job")
+        assert interrupted["status"] == "failed"
+        assert "restart" in interrupted["error"]
+        assert processed == ["1"]
+
+    async def test_shutdown_leaves_jobs_recoverable(self, tmp_path):
+        async def process(conversation_id: str) -> dict:
+            await asyncio.Event().wait()
+            return {}
+
+        manager = _manager(tmp_path, process)
+        job = manager.submit("1")
+        manager.stop()
+        await manager._scheduler.stop()
+        await asyncio.sleep(0)
+        assert manager.get(job["id"])["status"] == "queued"
+
+
+class TestJobRoutes:
+    async def test_submit_poll_and_stream(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            event_bus_module, "DashboardStore", lambda: DashboardStore(tmp_path / "dashboard.db")
+        )
+        bus = EventBus()
+        # An earlier run of the same conversation must not leak into the job's stream
+        await bus.publish(DashboardEvent(type=EventType.TICKET_COMPLETE, conversation_id="7"))
+
+        async def process(conversation_id: str) -> dict:
+            await bus.publish(
+                DashboardEvent(
+                    type=EventType.AGENT_START,
+                    conversation_id=conversation_id,
+                    data={"agent": "triage"},
+                )
+            )
+            await bus.publish(DashboardEvent(type=EventType.TOOL_CALL, conversation_id="other"))
+            await bus.publish(
+                DashboardEvent(
+                    type=EventType.TICKET_COMPLETE,
+                    conversation_id=conversation_id,
+                    data={"success": True},
+                )
+            )
+            return {"success": True, "result": "replied"}
+
+        manager = _manager(tmp_path, process)
+        monkeypatch.setattr(jobs_routes, "get_job_manager", lambda settings: manager)
+        monkeypatch.setattr(jobs_routes, "get_event_bus", lambda: bus)
+
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/api/v1/jobs", json={"conversation_id": "7"})
+            assert response.status_code == 202
+            job_id = response.json()["id"]
+
+            response = await client.get(f"/api/v1/jobs/{job_id}/events")
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = _parse_sse(response.text)
+            assert [name for name, _ in events] == ["agent_start", "ticket_complete", "job"]
+            assert events[-1][1]["status"] == "succeeded"
+
+            job = (await client.get(f"/api/v1/jobs/{job_id}")).json()
+            assert job["result"]["result"] == "replied"
+            assert (await client.get("/api/v1/jobs/missing")).status_code == 404
+
+    async def test_queue_full_returns_429(self, tmp_path, monkeypatch):
+        async def process(conversation_id: str) -> dict:
+            await asyncio.Event().wait()
+            return {}
+
+        manager = _manager(tmp_path, process, max_queue_size=1)
+        monkeypatch.setattr(jobs_routes, "get_job_manager", lambda settings: manager)
+
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            codes = [
+                (await client.post("/api/v1/jobs", json={"conversation_id": cid})).status_code
+                for cid in ("1", "2", "3")
+            ]
+        assert codes[-1] == 429
+        # Rejected submissions do not leave job rows behind
+        assert len(manager.store.list_by_status("queued", "running")) == codes.count(202)
+        await manager._scheduler.stop()
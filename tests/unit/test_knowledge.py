@@ -1,10 +1,20 @@
 """Tests for knowledge base indexer and search."""
 
+import asyncio
+import re
+import threading
+import zlib
+from pathlib import Path
+
+import numpy as np
 import pytest
+from fastmcp import Client
 
 from sentinelcx.config import KnowledgeBaseSettings
+from sentinelcx.knowledge.index import IndexFormatError, open_index
 from sentinelcx.knowledge.indexer import KnowledgeIndexer
 from sentinelcx.knowledge.search import KnowledgeSearch
+from sentinelcx.mcp_servers import knowledge_base_server
 
 
 @pytest.fixture
@@ -56,19 +66,18 @@ class TestKnowledgeIndexer:
         assert result["chunks"] > 0
 
         # Verify files were created
-        from pathlib import Path
-
         cache_dir = Path(kb_settings.embedding_cache_dir)
-        assert (cache_dir / "embeddings.npy").exists()
-        assert (cache_dir / "metadata.json").exists()
+        assert (cache_dir / "index.json").exists()
+        assert (cache_dir / "vectors.npy").exists()
+        assert (cache_dir / "metadata.jsonl").exists()
+        assert (cache_dir / "metadata.offsets.npy").exists()
 
 
 class TestKnowledgeSearch:
     def test_search_requires_index(self, kb_settings):
         search = KnowledgeSearch(kb_settings)
         # Clear any cached index
-        search._embeddings = None
-        search._metadata = None
+        search._index = None
         with pytest.raises(FileNotFoundError):
             search.search("test query")
 
@@ -92,3 +101,215 @@ class TestKnowledgeSearch:
         # The login FAQ should be more relevant than the product overview
         login_results = [r for r in results if "login" in r.source_file.lower()]
         assert len(login_results) > 0
+
+
+class FakeEncoder:
+    """Bag-of-words hashing encoder standing in for the SentenceTransformer."""
+
+    dim = 64
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def _vector(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for word in re.findall(r"[a-z]+", text.lower()):
+            vector[zlib.crc32(word.encode()) % self.dim] += 1.0
+        return vector
+
+    def encode(self, sentences, convert_to_numpy=True, **kwargs):
+        if isinstance(sentences, str):
+            self.calls.append(1)
+            return self._vector(sentences)
+        self.calls.append(len(sentences))
+        return np.stack([self._vector(s) for s in sentences])
+
+
+@pytest.fixture
+def fake_index(kb_settings, monkeypatch):
+    """Index the sample knowledge base with the fake encoder."""
+    encoder = FakeEncoder()
+    monkeypatch.setattr(KnowledgeIndexer, "_get_model", lambda self: encoder)
+    monkeypatch.setattr(KnowledgeSearch, "_get_model", lambda self: encoder)
+    KnowledgeIndexer(kb_settings).index_directory()
+    encoder.calls.clear()
+    return encoder
+
+
+class TestSearchMany:
+    def test_matches_single_searches_without_dedupe(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        queries = ["password reset login", "ticket analytics integrations"]
+        batched = search.search_many(queries, top_k=2, dedupe=False)
+        assert fake_index.calls == [2]
+        for query, results in zip(queries, batched):
+            single = search.search(query, top_k=2)
+            assert [(r.source_file, r.heading) for r in results] == [
+                (r.source_file, r.heading) for r in single
+            ]
+            assert [r.score for r in results] == pytest.approx([r.score for r in single])
+
+    def test_dedupes_chunks_across_queries(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        results = search.search_many(["login password", "login account locked"], top_k=2)
+        chunks = [(r.source_file, r.heading) for hits in results for r in hits]
+        assert len(chunks) == len(set(chunks)) == 4
+        # Every list is still ordered best first
+        assert all(
+            [r.score for r in hits] == sorted((r.score for r in hits), reverse=True)
+            for hits in results
+        )
+
+
+class TestMappedIndex:
+    def test_vectors_are_normalized_and_mapped(self, kb_settings, fake_index):
+        index = open_index(Path(kb_settings.embedding_cache_dir), kb_settings.embedding_model_name)
+        assert isinstance(index.vectors, np.memmap)
+        assert index.vectors.dtype == np.float32
+        assert index.vectors.shape == (len(index), FakeEncoder.dim)
+        assert np.linalg.norm(index.vectors, axis=1) == pytest.approx(1.0, abs=1e-5)
+        assert {index.metadata(i)["source_file"] for i in range(len(index))} == {
+            "faqs/login.md",
+            "products/overview.md",
+        }
+
+    def test_rejects_index_from_another_model(self, kb_settings, fake_index):
+        with pytest.raises(IndexFormatError):
+            open_index(Path(kb_settings.embedding_cache_dir), "another-model")
+
+    def test_top_k_matches_full_sort(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        index = search._load_index()
+        query = fake_index.encode(["reset password for a locked account"])[0]
+        scores = index.vectors @ (query / np.linalg.norm(query))
+        expected = np.argsort(-scores, kind="stable")[:3]
+
+        results = search.search("reset password for a locked account", top_k=3)
+        assert [r.text for r in results] == [index.metadata(int(i))["text"] for i in expected]
+        assert [r.score for r in results] == pytest.approx(scores[expected].tolist())
+
+    def test_search_picks_up_rebuilt_index(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        first = search._load_index().build_id
+        result = KnowledgeIndexer(kb_settings).index_directory()
+        assert result["build_id"] != first
+        # Coarse filesystem timestamps can give the new header the same mtime
+        search._index_mtime = None
+        assert search._load_index().build_id == result["build_id"]
+
+    def test_ann_backend_chosen_at_index_time(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        queries = ["login password", "ticket analytics"]
+        exact = search.search_many(queries, top_k=2)
+
+        result = KnowledgeIndexer(kb_settings).index_directory("ivf", {"nlist": 2, "nprobe": 2})
+        assert result["ann"] == {
+            "backend": "ivf",
+            "params": {"nlist": 2, "nprobe": 2, "iterations": 10, "seed": 0},
+        }
+        search._index_mtime = None
+        assert search._load_index().ann.backend == "ivf"
+        approx = search.search_many(queries, top_k=2)
+        assert [[r.text for r in hits] for hits in approx] == [
+            [r.text for r in hits] for hits in exact
+        ]
+
+
+class TestSearchCaches:
+    def test_repeated_queries_skip_encode_and_scan(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        first = search.search("login password", top_k=3)
+        again = search.search("  Login   PASSWORD ", top_k=3)
+        assert [r.text for r in again] == [r.text for r in first]
+        assert fake_index.calls == [1]
+
+        # Same text, different top_k: embedding reused, index searched again
+        search.search("login password", top_k=2)
+        assert fake_index.calls == [1]
+        stats = search.stats()
+        assert stats["query_embeddings"]["hits"] == 1
+        assert stats["results"] == {
+            "entries": 2,
+            "max_entries": 1024,
+            "hits": 1,
+            "misses": 2,
+            "evictions": 0,
+            "hit_rate": 0.333,
+        }
+
+    def test_batch_encodes_only_uncached_queries(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        search.search("login password")
+        search.search_many(["login password", "ticket analytics", "ticket analytics"])
+        assert fake_index.calls == [1, 1]
+
+    def test_rebuild_invalidates(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        search.search("login password")
+        KnowledgeIndexer(kb_settings).index_directory()
+        fake_index.calls.clear()
+        search._index_mtime = None
+        search.search("login password")
+        assert fake_index.calls == [1]
+        assert search.stats()["results"]["entries"] == 1
+
+    def test_search_params_are_part_of_the_key(self, kb_settings, fake_index):
+        KnowledgeIndexer(kb_settings).index_directory("ivf", {"nlist": 2, "nprobe": 1})
+        search = KnowledgeSearch(kb_settings)
+        search.search("login password")
+        search._load_index().ann.nprobe = 2
+        search.search("login password")
+        assert search.stats()["results"]["misses"] == 2
+        search.search("login password")
+        assert search.stats()["results"]["hits"] == 1
+
+    def test_size_limits_evict_least_recently_used(self, kb_settings, fake_index):
+        settings = kb_settings.model_copy(
+            update={"query_embedding_cache_size": 2, "search_result_cache_size": 2}
+        )
+        search = KnowledgeSearch(settings)
+        for query in ["login", "password", "login", "analytics", "password"]:
+            search.search(query)
+        # Repeating "login" refreshed its results, so "analytics" evicted the results of
+        # "password"; its embedding outlived that of "login", which was not needed again
+        assert fake_index.calls == [1, 1, 1]
+        stats = search.stats()
+        assert stats["results"]["hits"] == 1
+        assert stats["results"]["evictions"] == 2
+        assert stats["query_embeddings"]["hits"] == 1
+        assert stats["query_embeddings"]["evictions"] == 1
+
+    async def test_knowledge_stats_tool(self, kb_settings, fake_index, monkeypatch):
+        monkeypatch.setattr(knowledge_base_server, "_search", KnowledgeSearch(kb_settings))
+        async with Client(knowledge_base_server.knowledge_mcp) as client:
+            for _ in range(2):
+                await client.call_tool("search_knowledge_base", {"query": "refund", "top_k": 2})
+            stats = (await client.call_tool("knowledge_stats", {})).data
+        assert stats["results"]["hit_rate"] == 0.5
+        assert stats["query_embeddings"]["misses"] == 1
+        assert stats["index"]["chunks"] == 4
+        assert stats["index"]["backend"] == "exact"
+
+    async def test_async_search_opens_index_off_the_event_loop(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        opened_on = []
+        original = search._reload_if_changed
+
+        def reload():
+            opened_on.append(threading.current_thread())
+            return original()
+
+        search._reload_if_changed = reload
+        await search.search_async("login password")
+        assert opened_on and threading.main_thread() not in opened_on
+
+    async def test_async_search_batches_concurrent_encodes(self, kb_settings, fake_index):
+        search = KnowledgeSearch(kb_settings)
+        queries = ["login password", "ticket analytics", "account locked", "integrations"]
+        results = await asyncio.gather(*(search.search_async(q, top_k=2) for q in queries))
+        assert fake_index.calls == [4]
+        assert search.stats()["encoder"]["batches"] == 1
+
+        expected = KnowledgeSearch(kb_settings)
+        for query, hits in zip(queries, results):
+            assert [r.text for r in hits] == [r.text for r in expected.search(query, top_k=2)]
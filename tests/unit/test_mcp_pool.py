@@ -0,0 +1,44 @@
+"""Tests for the pooled MCP server manager."""
+
+from sentinelcx.config import MCPSettings, Settings
+from sentinelcx.mcp_servers.pool import MCPServerPool
+
+
+def _pool(**sizes) -> MCPServerPool:
+    settings = Settings(
+        _env_file=None,
+        mcp=MCPSettings(_env_file=None, transport="pooled", pool_base_port=9000, pool_sizes=sizes),
+    )
+    return MCPServerPool(settings)
+
+
+class TestMCPServerPool:
+    def test_ports_allocated_sequentially(self):
+        pool = _pool(chatwoot=2, knowledge=3)
+        ports = [s["port"] for group in pool.stats().values() for s in group]
+        assert ports == list(range(9000, 9000 + len(ports)))
+        assert len(pool.stats()["knowledge"]) == 3
+        assert len(pool.stats()["slack"]) == 1
+
+    async def test_lease_prefers_least_loaded_healthy(self):
+        pool = _pool(chatwoot=2)
+        first, second = pool._servers["chatwoot"]
+        for server in pool._all_servers():
+            server.healthy = True
+        first.active_leases = 3
+
+        async with pool.lease() as configs:
+            assert configs["chatwoot"] == {"type": "http", "url": second.url}
+            assert second.active_leases == 1
+        assert second.active_leases == 0
+        assert second.total_leases == 1
+
+    async def test_lease_skips_unhealthy(self):
+        pool = _pool(chatwoot=2)
+        first, second = pool._servers["chatwoot"]
+        first.healthy = False
+        second.healthy = True
+        second.active_leases = 5
+
+        async with pool.lease() as configs:
+            assert configs["chatwoot"]["url"] == second.url
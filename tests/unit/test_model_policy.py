@@ -0,0 +1,106 @@
+"""Tests for per-agent model tiering."""
+
+from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock
+
+from sentinelcx import orchestrator as orchestrator_module
+from sentinelcx.agents.context import TicketContext
+from sentinelcx.agents.definitions import ALL_AGENTS
+from sentinelcx.agents.model_policy import ModelPolicy, models_by_agent
+from sentinelcx.config import ModelPolicySettings, Settings
+from sentinelcx.dashboard.event_bus import EventType
+from sentinelcx.dashboard.spans import SpanTracker
+from sentinelcx.orchestrator import PipelineExecutor, SentinelCXOrchestrator
+
+LOW_CONFIDENCE_TRIAGE = (
+    '{"decision": "auto_handle", "category": "billing", "priority": "low", "confidence": 0.3}'
+)
+
+
+class FakeBus:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, event):
+        self.events.append(event)
+
+
+def _policy(**overrides) -> ModelPolicy:
+    return ModelPolicy(ModelPolicySettings(_env_file=None, **overrides))
+
+
+def _vip_context(tier: str) -> TicketContext:
+    return TicketContext(
+        conversation_id="7", customer={"Description": f"Tier: {tier} | Company: Acme"}
+    )
+
+
+class TestModelPolicy:
+    def test_defaults_keep_every_agent_on_the_baseline_model(self):
+        agents, reason = _policy().apply(
+            ALL_AGENTS, {"confidence": 0.1}, _vip_context("enterprise")
+        )
+        assert reason is None
+        assert set(models_by_agent(agents).values()) == {"sonnet"}
+
+    def test_base_models_per_agent(self):
+        agents, reason = _policy(triage="haiku", response="sonnet").apply(ALL_AGENTS)
+        assert reason is None
+        assert agents["triage"].model == "haiku"
+        assert agents["response"].model == "sonnet"
+        assert agents["triage"].prompt == ALL_AGENTS["triage"].prompt
+        assert ALL_AGENTS["triage"].model == "sonnet"
+
+    def test_escalates_low_confidence(self):
+        policy = _policy(triage="haiku", escalated="opus", escalate_below_confidence=0.6)
+        agents, reason = policy.apply(ALL_AGENTS, {"confidence": 0.4})
+        assert reason == "low_confidence"
+        assert agents["response"].model == "opus"
+        assert agents["triage"].model == "haiku"
+        assert policy.apply(ALL_AGENTS, {"confidence": 0.8})[1] is None
+
+    def test_escalates_vip_tier(self):
+        policy = _policy(vip_tiers="enterprise, premium", escalate_agents="escalation")
+        agents, reason = policy.apply(ALL_AGENTS, context=_vip_context("Premium"))
+        assert reason == "vip:premium"
+        assert agents["escalation"].model == "opus"
+        assert agents["response"].model == "sonnet"
+        assert policy.apply(ALL_AGENTS, context=_vip_context("standard"))[1] is None
+
+
+class TestPipelineModels:
+    async def test_escalates_after_low_confidence_triage(self, monkeypatch):
+        bus = FakeBus()
+        served: dict[str, str] = {}
+
+        async def fake_query(prompt, options):
+            name = "triage" if prompt.startswith("Triage") else "response"
+            served[name] = options.model
+            text = LOW_CONFIDENCE_TRIAGE if name == "triage" else "sent"
+            yield AssistantMessage(content=[TextBlock(text="ok")], model=f"claude-{options.model}")
+            yield ResultMessage(
+                subtype="success",
+                duration_ms=10,
+                duration_api_ms=10,
+                is_error=False,
+                num_turns=1,
+                session_id="s",
+                total_cost_usd=0.01,
+                result=text,
+            )
+
+        monkeypatch.setattr(orchestrator_module, "query", fake_query)
+        monkeypatch.setattr(orchestrator_module, "get_event_bus", lambda: bus)
+        models = ModelPolicySettings(_env_file=None, triage="haiku", escalate_below_confidence=0.6)
+        orchestrator = SentinelCXOrchestrator(Settings(_env_file=None, models=models))
+        agents, _ = orchestrator._model_policy.apply(ALL_AGENTS)
+        executor = PipelineExecutor(orchestrator, {}, agents)
+        spans = SpanTracker("7")
+        result = await executor.run("7", {}, spans)
+
+        assert served == {"triage": "haiku", "response": "opus"}
+        assert result["model_escalation"] == "low_confidence"
+        assert [s["model"] for s in result["stages"]] == ["haiku", "opus"]
+        assert executor.models == {"triage": "haiku", "response": "opus"}
+        started = [e.data["model"] for e in bus.events if e.type == EventType.AGENT_START]
+        assert started == ["haiku", "opus"]
+        assert [s.model for s in spans.finish()] == ["claude-haiku", "claude-opus"]
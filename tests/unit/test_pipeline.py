@@ -0,0 +1,127 @@
+"""Tests for the code-driven pipeline executor."""
+
+import pytest
+from claude_agent_sdk import AssistantMessage, ResultMessage, ToolUseBlock
+
+from sentinelcx import orchestrator as orchestrator_module
+from sentinelcx.agents.definitions import ALL_AGENTS
+from sentinelcx.config import Settings
+from sentinelcx.dashboard.event_bus import EventType
+from sentinelcx.orchestrator import PipelineExecutor, SentinelCXOrchestrator, parse_triage_result
+
+TRIAGE_JSON = (
+    '```json\n{"decision": "%s", "category": "billing", "priority": "high", "confidence": 0.7}\n```'
+)
+
+
+class FakeBus:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, event):
+        self.events.append(event)
+
+
+def _result(text: str, turns: int = 2, cost: float = 0.01) -> ResultMessage:
+    return ResultMessage(
+        subtype="success",
+        duration_ms=1000,
+        duration_api_ms=900,
+        is_error=False,
+        num_turns=turns,
+        session_id="s",
+        total_cost_usd=cost,
+        result=text,
+    )
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    fake = FakeBus()
+    monkeypatch.setattr(orchestrator_module, "get_event_bus", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def stage_outputs(monkeypatch):
+    """Map agent name -> final result text; records the prompt each stage received."""
+    outputs: dict[str, str] = {}
+    prompts: dict[str, str] = {}
+    by_prompt = {agent.prompt: name for name, agent in ALL_AGENTS.items()}
+
+    async def fake_query(prompt, options):
+        name = by_prompt[options.system_prompt]
+        prompts[name] = prompt
+        yield AssistantMessage(
+            content=[ToolUseBlock(id=f"{name}-1", name="mcp__chatwoot__get_ticket", input={})],
+            model="sonnet",
+        )
+        yield _result(outputs[name])
+
+    monkeypatch.setattr(orchestrator_module, "query", fake_query)
+    return outputs, prompts
+
+
+def _executor() -> PipelineExecutor:
+    orchestrator = SentinelCXOrchestrator(Settings(_env_file=None))
+    return PipelineExecutor(orchestrator, {"chatwoot": {}, "slack": {}}, ALL_AGENTS)
+
+
+class TestParseTriageResult:
+    def test_parses_wrapped_json(self):
+        parsed = parse_triage_result(TRIAGE_JSON % "escalate")
+        assert parsed == {
+            "decision": "escalate",
+            "category": "billing",
+            "priority": "high",
+            "confidence": 0.7,
+        }
+
+    def test_rejects_invalid_decision(self):
+        assert parse_triage_result(TRIAGE_JSON % "ignore") is None
+        assert parse_triage_result("no json here") is None
+
+
+class TestPipelineExecutor:
+    async def test_research_then_response(self, bus, stage_outputs):
+        outputs, prompts = stage_outputs
+        outputs.update(
+            triage=TRIAGE_JSON % "needs_research",
+            research='{"recommended_approach": "refund"}',
+            response='{"reply_sent": true}',
+        )
+        triage_data: dict = {}
+        result = await _executor().run("7", triage_data)
+
+        assert [s["agent"] for s in result["stages"]] == ["triage", "research", "response"]
+        assert triage_data["decision"] == "needs_research"
+        assert "refund" in prompts["response"]
+        assert result["success"]
+        assert result["turns"] == 6
+        assert result["cost_usd"] == pytest.approx(0.03)
+
+        started = [e.data["agent"] for e in bus.events if e.type == EventType.AGENT_START]
+        assert started == ["triage", "research", "response"]
+        assert sum(e.type == EventType.TOOL_CALL for e in bus.events) == 3
+
+    async def test_unparseable_triage_escalates(self, bus, stage_outputs):
+        outputs, _ = stage_outputs
+        outputs.update(triage="I could not decide", escalation='{"escalation_posted": true}')
+        triage_data: dict = {}
+        result = await _executor().run("7", triage_data)
+
+        assert [s["agent"] for s in result["stages"]] == ["triage", "escalation"]
+        assert triage_data["source"] == "fallback"
+
+    async def test_skips_triage_when_already_decided(self, bus, stage_outputs):
+        outputs, _ = stage_outputs
+        outputs.update(response='{"reply_sent": true}')
+        result = await _executor().run("7", {"decision": "auto_handle", "source": "fast_path"})
+        assert [s["agent"] for s in result["stages"]] == ["response"]
+
+    def test_stage_options_attach_only_used_servers(self):
+        orchestrator = SentinelCXOrchestrator(Settings(_env_file=None))
+        configs = {name: {} for name in ("chatwoot", "salesforce", "knowledge", "slack")}
+        options = orchestrator._build_stage_options(ALL_AGENTS["triage"], configs)
+        assert set(options.mcp_servers) == {"chatwoot", "salesforce"}
+        assert options.allowed_tools == ALL_AGENTS["triage"].tools
@@ -0,0 +1,132 @@
+"""Tests for recording and replaying the SDK message stream."""
+
+import pytest
+from claude_agent_sdk import (
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+from sentinelcx import orchestrator as orchestrator_module
+from sentinelcx.config import OrchestratorSettings, ReplaySettings, Settings
+from sentinelcx.dashboard.event_bus import EventType
+from sentinelcx.orchestrator import SentinelCXOrchestrator
+from sentinelcx.replay import StreamRecordings, decode_message, encode_message
+
+TRIAGE_JSON = (
+    '{"decision": "auto_handle", "category": "billing", "priority": "low", "confidence": 0.9}'
+)
+
+
+class FakeStore:
+    def save_spans(self, spans):
+        pass
+
+
+class FakeBus:
+    def __init__(self):
+        self.events = []
+        self.store = FakeStore()
+
+    async def publish(self, event):
+        self.events.append(event)
+
+
+def _result(text: str) -> ResultMessage:
+    return ResultMessage(
+        subtype="success",
+        duration_ms=100,
+        duration_api_ms=90,
+        is_error=False,
+        num_turns=2,
+        session_id="s",
+        total_cost_usd=0.02,
+        result=text,
+    )
+
+
+async def recorded_query(prompt, options):
+    """A two-stage pipeline run: triage returns JSON, response sends a reply."""
+    if prompt.startswith("Triage"):
+        yield _result(TRIAGE_JSON)
+        return
+    yield AssistantMessage(
+        content=[
+            TextBlock(text="Sending reply"),
+            ToolUseBlock(id="t1", name="mcp__chatwoot__send_reply", input={"message": "hi"}),
+        ],
+        model="claude-sonnet",
+    )
+    yield UserMessage(content=[ToolResultBlock(tool_use_id="t1", content="sent")])
+    yield _result("Replied to customer")
+
+
+def _orchestrator(tmp_path, mode: str, **replay) -> SentinelCXOrchestrator:
+    settings = Settings(
+        _env_file=None,
+        orchestrator=OrchestratorSettings(_env_file=None, mode="pipeline", prefetch_context=False),
+        replay=ReplaySettings(_env_file=None, mode=mode, directory=str(tmp_path), **replay),
+    )
+    return SentinelCXOrchestrator(settings)
+
+
+@pytest.fixture
+def recordings(monkeypatch):
+    """Give each orchestrator its own recordings instead of the global one."""
+    monkeypatch.setattr(orchestrator_module, "get_stream_recordings", StreamRecordings)
+
+
+def _summary(events):
+    return [(e.type, e.data.get("agent") or e.data.get("tool")) for e in events]
+
+
+class TestEncoding:
+    def test_round_trip(self):
+        message = AssistantMessage(
+            content=[
+                TextBlock(text="hi"),
+                ToolUseBlock(id="t1", name="mcp__salesforce__get_customer_record", input={}),
+            ],
+            model="claude-haiku",
+            parent_tool_use_id="task-1",
+        )
+        assert decode_message(encode_message(message)) == message
+        assert decode_message({"type": "NotAMessage", "data": {}}) is None
+
+
+class TestRecordReplay:
+    async def test_replay_matches_recorded_run(self, tmp_path, monkeypatch, recordings):
+        live_bus = FakeBus()
+        monkeypatch.setattr(orchestrator_module, "get_event_bus", lambda: live_bus)
+        monkeypatch.setattr(orchestrator_module, "query", recorded_query)
+        recorded = await _orchestrator(tmp_path, "record").process_ticket("42")
+        assert (tmp_path / "42.jsonl").exists()
+
+        async def no_query(prompt, options):
+            raise AssertionError("replay must not start the CLI")
+            yield
+
+        replay_bus = FakeBus()
+        monkeypatch.setattr(orchestrator_module, "get_event_bus", lambda: replay_bus)
+        monkeypatch.setattr(orchestrator_module, "query", no_query)
+        replayed = await _orchestrator(tmp_path, "replay").process_ticket("42")
+
+        assert replayed["success"] is True
+        assert replayed["cost_usd"] == recorded["cost_usd"] == pytest.approx(0.04)
+        assert [s["agent"] for s in replayed["stages"]] == ["triage", "response"]
+        assert _summary(replay_bus.events) == _summary(live_bus.events)
+        assert any(e.type == EventType.TOOL_CALL for e in replay_bus.events)
+
+    async def test_cycle_replays_other_tickets(self, tmp_path, monkeypatch, recordings):
+        monkeypatch.setattr(orchestrator_module, "get_event_bus", FakeBus)
+        monkeypatch.setattr(orchestrator_module, "query", recorded_query)
+        await _orchestrator(tmp_path, "record").process_ticket("42")
+
+        missing = await _orchestrator(tmp_path, "replay").process_ticket("load-1")
+        assert missing["success"] is False
+        cycled = await _orchestrator(tmp_path, "replay", cycle=True).process_ticket("load-1")
+        assert cycled["success"] is True
+        assert cycled["conversation_id"] == "load-1"
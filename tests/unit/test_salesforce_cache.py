@@ -0,0 +1,109 @@
+"""Tests for the shared on-disk Salesforce lookup cache."""
+
+import threading
+import time
+
+from sentinelcx.clients.salesforce_cache import SalesforceCache
+from sentinelcx.clients.salesforce_client import SalesforceClient
+from sentinelcx.config import SalesforceSettings
+
+
+class FakeSalesforce:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def query(self, soql: str) -> dict:
+        self.queries.append(soql)
+        if "FROM Case" in soql:
+            return {"records": [{"Id": "500A", "Status": "Closed"}]}
+        if "FROM Opportunity" in soql:
+            return {"records": [{"Id": "006A", "Amount": 20000}]}
+        return {"records": []}
+
+
+def _client(**cache_settings) -> tuple[SalesforceClient, FakeSalesforce]:
+    settings = SalesforceSettings(
+        instance_url="http://127.0.0.1:1", session_id="fake", **cache_settings
+    )
+    client = SalesforceClient(settings)
+    client._sf = FakeSalesforce()
+    return client, client._sf
+
+
+def test_processes_share_warm_entries(tmp_path):
+    first, first_sf = _client(cache_enabled=True, cache_path=str(tmp_path / "sf.db"))
+    # A second handle on the same file stands in for another MCP server process
+    second, second_sf = _client()
+    second._cache = SalesforceCache(tmp_path / "sf.db")
+
+    health = first.get_account_health("001A")
+    assert health["resolution_rate"] == 1.0
+    assert len(first_sf.queries) == 2
+
+    assert second.get_account_health("001A") == health
+    assert second.get_case_history("001A") == [{"Id": "500A", "Status": "Closed"}]
+    assert second_sf.queries == []
+    assert second.cache_stats()["hits"] == 2
+
+
+def test_stale_entries_are_served_while_refreshing(tmp_path):
+    cache = SalesforceCache(tmp_path / "sf.db", ttl=0.05, stale_ttl=60.0)
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch() -> dict:
+        calls.append(time.time())
+        if len(calls) > 1:
+            release.wait(5)
+        return {"version": len(calls)}
+
+    assert cache.get_or_fetch("health:001A", slow_fetch) == {"version": 1}
+    time.sleep(0.06)
+
+    # Both lookups return the stale value at once; only one refresh starts
+    start = time.perf_counter()
+    assert cache.get_or_fetch("health:001A", slow_fetch) == {"version": 1}
+    assert cache.get_or_fetch("health:001A", slow_fetch) == {"version": 1}
+    assert time.perf_counter() - start < 1.0
+    release.set()
+    cache.close()
+
+    assert len(calls) == 2
+    reopened = SalesforceCache(tmp_path / "sf.db", ttl=60.0)
+    assert reopened.get_or_fetch("health:001A", slow_fetch) == {"version": 2}
+
+
+def test_cache_disabled_by_default():
+    client, sf = _client()
+    client.get_case_history("001A")
+    client.get_case_history("001A")
+    assert len(sf.queries) == 2
+    assert client.cache_stats() is None
+
+
+def test_misses_expire_after_miss_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("sentinelcx.clients.salesforce_cache.time.time", lambda: now[0])
+    cache = SalesforceCache(tmp_path / "sf.db", ttl=300.0, stale_ttl=3600.0, miss_ttl=30.0)
+    record: dict = {}
+
+    assert cache.get_or_fetch("customer:new@example.com", lambda: dict(record)) == {}
+    record["Id"] = "001N"
+    now[0] += 10
+    assert cache.get_or_fetch("customer:new@example.com", lambda: dict(record)) == {}
+    # Past miss_ttl the empty result is re-fetched, not served stale
+    now[0] += 30
+    assert cache.get_or_fetch("customer:new@example.com", lambda: dict(record)) == {"Id": "001N"}
+
+
+def test_invalidate_matches_prefix_literally(tmp_path):
+    cache = SalesforceCache(tmp_path / "sf.db")
+    for key in ("cases:001_A", "cases:001xA", "cases:001%B", "health:001_A"):
+        cache.get_or_fetch(key, lambda key=key: {"key": key})
+
+    cache.invalidate("cases:001_")
+    cache.invalidate("cases:001%")
+    assert cache.stats()["entries"] == 2
+    assert cache.get_or_fetch("cases:001xA", dict) == {"key": "cases:001xA"}
+    cache.invalidate()
+    assert cache.stats()["entries"] == 0
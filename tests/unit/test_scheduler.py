@@ -0,0 +1,172 @@
+"""Tests for the bounded ticket scheduler."""
+
+import asyncio
+
+import pytest
+
+from sentinelcx.config import SchedulerSettings, Settings
+from sentinelcx.scheduler import QueueFullError, TicketScheduler, normalize_priority
+
+
+def _settings(workers: int = 1, max_queue_size: int = 10, coalesce_window: float = 0.0) -> Settings:
+    return Settings(
+        _env_file=None,
+        scheduler=SchedulerSettings(
+            _env_file=None,
+            workers=workers,
+            max_queue_size=max_queue_size,
+            coalesce_window=coalesce_window,
+        ),
+    )
+
+
+class TestTicketScheduler:
+    def test_normalize_priority(self):
+        assert normalize_priority("URGENT") == "urgent"
+        assert normalize_priority(None) == "medium"
+        assert normalize_priority("whenever") == "medium"
+
+    async def test_processes_by_priority(self):
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def process(conversation_id: str) -> dict:
+            if conversation_id == "blocker":
+                await gate.wait()
+            order.append(conversation_id)
+            return {"conversation_id": conversation_id}
+
+        scheduler = TicketScheduler(_settings(workers=1), process=process)
+        blocker = scheduler.submit("blocker", "low")
+        await asyncio.sleep(0)
+        futures = [
+            scheduler.submit("low-1", "low"),
+            scheduler.submit("medium-1", None),
+            scheduler.submit("urgent-1", "urgent"),
+            scheduler.submit("high-1", "high"),
+        ]
+        gate.set()
+        await asyncio.gather(blocker, *futures)
+        await scheduler.stop()
+
+        assert order == ["blocker", "urgent-1", "high-1", "medium-1", "low-1"]
+        assert scheduler.stats()["completed"] == 5
+
+    async def test_rejects_when_full(self):
+        gate = asyncio.Event()
+
+        async def process(conversation_id: str) -> dict:
+            await gate.wait()
+            return {}
+
+        scheduler = TicketScheduler(_settings(workers=1, max_queue_size=2), process=process)
+        scheduler.submit("1")
+        await asyncio.sleep(0)
+        scheduler.submit("2")
+        scheduler.submit("3")
+        with pytest.raises(QueueFullError):
+            scheduler.submit("4")
+
+        stats = scheduler.stats()
+        assert stats["rejected"] == 1
+        assert stats["depth"] == 2
+        assert stats["in_flight"] == 1
+        gate.set()
+        await scheduler.stop()
+
+    async def test_failure_propagates_to_future(self):
+        async def process(conversation_id: str) -> dict:
+            raise RuntimeError("boom")
+
+        scheduler = TicketScheduler(_settings(), process=process)
+        with pytest.raises(RuntimeError):
+            await scheduler.submit("1")
+        assert scheduler.stats()["failed"] == 1
+        await scheduler.stop()
+
+    async def test_coalesces_events_within_window(self):
+        calls: list[str] = []
+
+        async def process(conversation_id: str) -> dict:
+            calls.append(conversation_id)
+            return {"conversation_id": conversation_id}
+
+        scheduler = TicketScheduler(_settings(coalesce_window=0.05), process=process)
+        first = scheduler.submit("1", "low")
+        second = scheduler.submit("1", "high")
+        third = scheduler.submit("1")
+        assert first is second is third
+        assert scheduler.stats()["held"] == 1
+
+        await first
+        assert calls == ["1"]
+        stats = scheduler.stats()
+        assert stats["coalesced"] == 2
+        assert stats["completed"] == 1
+        await scheduler.stop()
+
+    async def test_urgent_tickets_skip_the_window(self):
+        async def process(conversation_id: str) -> dict:
+            return {}
+
+        scheduler = TicketScheduler(_settings(coalesce_window=60), process=process)
+        urgent = scheduler.submit("1", "urgent")
+        low = scheduler.submit("2", "low")
+        assert scheduler.stats()["held"] == 1
+        await asyncio.wait_for(urgent, 1.0)
+
+        # Raising a waiting ticket to urgent ends its window
+        assert scheduler.submit("2", "urgent") is low
+        await asyncio.wait_for(low, 1.0)
+        await scheduler.stop()
+
+    async def test_in_flight_events_merge_into_one_rerun(self):
+        calls: list[str] = []
+        running = 0
+        gate = asyncio.Event()
+
+        async def process(conversation_id: str) -> dict:
+            nonlocal running
+            running += 1
+            assert running == 1, "two runs of one conversation overlapped"
+            calls.append(conversation_id)
+            if len(calls) == 1:
+                await gate.wait()
+            running -= 1
+            return {}
+
+        scheduler = TicketScheduler(_settings(workers=2), process=process)
+        first = scheduler.submit("1")
+        await asyncio.sleep(0)
+        rerun = scheduler.submit("1")
+        assert scheduler.submit("1") is rerun
+        assert rerun is not first
+        await asyncio.sleep(0.01)
+        assert calls == ["1"]
+
+        gate.set()
+        await asyncio.gather(first, rerun)
+        assert calls == ["1", "1"]
+        assert scheduler.stats()["coalesced"] == 1
+        await scheduler.stop()
+
+    async def test_stop_clears_in_flight(self):
+        gate = asyncio.Event()
+
+        async def process(conversation_id: str) -> dict:
+            await gate.wait()
+            return {}
+
+        scheduler = TicketScheduler(_settings(), process=process)
+        running = scheduler.submit("1")
+        await asyncio.sleep(0)
+        assert scheduler.stats()["in_flight"] == 1
+        await scheduler.stop()
+        assert running.cancelled()
+        assert scheduler.stats()["in_flight"] == 0
+
+        # A restarted scheduler runs the conversation instead of holding it as a re-run
+        gate.set()
+        await scheduler.start()
+        await asyncio.wait_for(scheduler.submit("1"), 1.0)
+        await scheduler.stop()
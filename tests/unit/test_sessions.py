@@ -0,0 +1,200 @@
+"""Tests for the persistent Claude CLI session pool."""
+
+import asyncio
+
+import pytest
+from claude_agent_sdk import ClaudeAgentOptions, ConversationResetMessage, ResultMessage
+
+from sentinelcx import orchestrator as orchestrator_module
+from sentinelcx.agents.context import TicketContext
+from sentinelcx.agents.definitions import ALL_AGENTS
+from sentinelcx.config import OrchestratorSettings, Settings
+from sentinelcx.orchestrator import PipelineExecutor, SentinelCXOrchestrator
+from sentinelcx.sessions import ClaudeSessionPool
+
+TRIAGE_JSON = (
+    '{"decision": "auto_handle", "category": "billing", "priority": "low", "confidence": 0.9}'
+)
+
+
+def _result(text: str = "done") -> ResultMessage:
+    return ResultMessage(
+        subtype="success",
+        duration_ms=10,
+        duration_api_ms=10,
+        is_error=False,
+        num_turns=1,
+        session_id="s",
+        total_cost_usd=0.01,
+        result=text,
+    )
+
+
+class FakeBus:
+    async def publish(self, event):
+        pass
+
+
+class FakeClient:
+    """Stands in for ClaudeSDKClient; answers /clear with a reset message."""
+
+    instances: list["FakeClient"] = []
+
+    def __init__(self, options: ClaudeAgentOptions, fail_reset: bool = False):
+        self.options = options
+        self.fail_reset = fail_reset
+        self.prompts: list[str] = []
+        self.connected = False
+        self._pending: list = []
+        FakeClient.instances.append(self)
+
+    async def __aenter__(self):
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc):
+        self.connected = False
+
+    async def query(self, prompt: str) -> None:
+        self.prompts.append(prompt)
+        if prompt == "/clear":
+            if self.fail_reset:
+                raise RuntimeError("CLI exited")
+            self._pending.append(ConversationResetMessage("c", "u", "s"))
+        else:
+            self._pending.append(_result(TRIAGE_JSON if prompt.startswith("Triage") else "sent"))
+
+    async def receive_messages(self):
+        while self._pending:
+            yield self._pending.pop(0)
+
+    async def receive_response(self):
+        async for message in self.receive_messages():
+            yield message
+            if isinstance(message, ResultMessage):
+                return
+
+
+def _settings(**overrides) -> Settings:
+    cfg = OrchestratorSettings(_env_file=None, **{"prefetch_context": False, **overrides})
+    return Settings(_env_file=None, orchestrator=cfg)
+
+
+@pytest.fixture(autouse=True)
+def reset_instances():
+    FakeClient.instances = []
+
+
+class TestSessionPool:
+    async def test_reuses_session_with_matching_options(self):
+        pool = ClaudeSessionPool(_settings(), client_factory=FakeClient)
+        options = ClaudeAgentOptions(system_prompt="triage", model="haiku")
+
+        for _ in range(3):
+            async with pool.session(options) as client:
+                await client.query("hello")
+        async with pool.session(ClaudeAgentOptions(system_prompt="other")):
+            pass
+
+        assert len(FakeClient.instances) == 2
+        assert FakeClient.instances[0].prompts == ["hello", "/clear"] * 3
+        assert pool.stats()["created"] == 2
+        assert pool.stats()["reused"] == 2
+        await pool.stop()
+        assert not any(c.connected for c in FakeClient.instances)
+
+    async def test_discards_session_when_run_fails(self):
+        pool = ClaudeSessionPool(_settings(), client_factory=FakeClient)
+        options = ClaudeAgentOptions(system_prompt="triage")
+
+        with pytest.raises(ValueError):
+            async with pool.session(options):
+                raise ValueError("boom")
+        await asyncio.sleep(0.01)
+
+        assert not FakeClient.instances[0].connected
+        assert pool.stats()["discarded"] == 1
+        async with pool.session(options):
+            pass
+        assert len(FakeClient.instances) == 2
+
+    async def test_recycles_after_max_tickets_and_failed_reset(self):
+        pool = ClaudeSessionPool(_settings(session_max_tickets=2), client_factory=FakeClient)
+        options = ClaudeAgentOptions(system_prompt="triage")
+        for _ in range(3):
+            async with pool.session(options):
+                pass
+        assert len(FakeClient.instances) == 2
+        assert not FakeClient.instances[0].connected
+
+        broken = ClaudeSessionPool(
+            _settings(), client_factory=lambda o: FakeClient(o, fail_reset=True)
+        )
+        async with broken.session(options):
+            pass
+        assert broken.stats()["idle"] == 0
+        assert broken.stats()["discarded"] == 1
+
+    async def test_evicts_least_recently_used(self):
+        pool = ClaudeSessionPool(_settings(session_pool_size=1), client_factory=FakeClient)
+        for prompt in ("a", "b"):
+            async with pool.session(ClaudeAgentOptions(system_prompt=prompt)):
+                pass
+        await asyncio.sleep(0.01)
+        assert pool.stats()["idle"] == 1
+        assert [c.connected for c in FakeClient.instances] == [False, True]
+        await pool.stop()
+
+
+class TestPipelineSessions:
+    async def test_stages_reuse_sessions_across_tickets(self, monkeypatch):
+        pool = ClaudeSessionPool(_settings(), client_factory=FakeClient)
+        monkeypatch.setattr(orchestrator_module, "get_session_pool", lambda settings: pool)
+        monkeypatch.setattr(orchestrator_module, "get_event_bus", FakeBus)
+
+        async def fail_query(prompt, options):
+            raise AssertionError("query() must not be used with the session pool")
+            yield
+
+        monkeypatch.setattr(orchestrator_module, "query", fail_query)
+        orchestrator = SentinelCXOrchestrator(_settings(session_pool=True))
+        for cid in ("1", "2"):
+            executor = PipelineExecutor(orchestrator, {}, ALL_AGENTS, context_section="\n\nctx")
+            result = await executor.run(cid, {})
+            assert result["success"] is True
+
+        # One session for triage, one for response, each serving both tickets
+        assert len(FakeClient.instances) == 2
+        assert pool.stats()["reused"] == 2
+        assert FakeClient.instances[0].prompts[2].endswith("\n\nctx")
+        assert FakeClient.instances[0].options.max_budget_usd == 2.0
+        await pool.stop()
+
+
+class TestOrchestratorSessions:
+    async def test_prefetched_context_rides_in_the_query_prompt(self, monkeypatch):
+        pool = ClaudeSessionPool(_settings(), client_factory=FakeClient)
+        monkeypatch.setattr(orchestrator_module, "get_session_pool", lambda settings: pool)
+        monkeypatch.setattr(orchestrator_module, "get_event_bus", FakeBus)
+        orchestrator = SentinelCXOrchestrator(_settings(session_pool=True, prefetch_context=True))
+
+        async def prefetch(conversation_id):
+            return TicketContext(
+                conversation_id=conversation_id,
+                ticket={"id": int(conversation_id), "status": "open"},
+                messages=[{"content": f"help with ticket {conversation_id}"}],
+            )
+
+        monkeypatch.setattr(orchestrator, "_prefetch_context", prefetch)
+        for cid in ("1", "2"):
+            assert (await orchestrator.process_ticket(cid))["success"] is True
+
+        # Agent prompts stay the same across tickets, so both run on one session
+        assert len(FakeClient.instances) == 1
+        assert pool.stats()["reused"] == 1
+        assert FakeClient.instances[0].options.agents == ALL_AGENTS
+        tickets = [p for p in FakeClient.instances[0].prompts if p != "/clear"]
+        assert ["help with ticket 1" in p for p in tickets] == [True, False]
+        assert "help with ticket 2" in tickets[1]
+        assert "## Prefetched Ticket Context" in tickets[1]
+        await pool.stop()
@@ -0,0 +1,151 @@
+"""Tests for stream-derived latency spans."""
+
+import pytest
+from claude_agent_sdk import (
+    AssistantMessage,
+    ResultMessage,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+from sentinelcx import orchestrator as orchestrator_module
+from sentinelcx.config import Settings
+from sentinelcx.dashboard.spans import Span, SpanTracker, percentile, summarize_durations
+from sentinelcx.dashboard.store import DashboardStore
+from sentinelcx.orchestrator import SentinelCXOrchestrator
+
+
+class FakeBus:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, event):
+        self.events.append(event)
+
+
+def _span(kind, name, duration_ms, service="", status="ok", started_at=100.0, model=""):
+    return Span(
+        conversation_id="1",
+        kind=kind,
+        name=name,
+        agent=name if kind == "agent" else "triage",
+        service=service,
+        started_at=started_at,
+        ended_at=started_at + duration_ms / 1000,
+        status=status,
+        model=model,
+    )
+
+
+class TestSpanTracker:
+    def test_pairs_tools_and_attributes_to_agent(self):
+        tracker = SpanTracker("1")
+        tracker.start_agent("triage", "task-1")
+        tracker.start_tool("tool-1", "chatwoot", "get_ticket", parent_tool_use_id="task-1")
+        tracker.start_tool("tool-2", "system", "TodoWrite")
+        tracker.end_tool("tool-1")
+        tracker.end_tool("task-1")
+        spans = {s.tool_use_id: s for s in tracker.finish()}
+
+        assert spans["tool-1"].agent == "triage"
+        assert spans["tool-1"].status == "ok"
+        assert spans["tool-1"].duration_ms >= 0
+        assert spans["task-1"].kind == "agent"
+        assert spans["tool-2"].agent == "orchestrator"
+        assert spans["tool-2"].status == "incomplete"
+
+    def test_pipeline_stage_attribution(self):
+        tracker = SpanTracker("1")
+        tracker.start_agent("response")
+        tracker.start_tool("tool-1", "knowledge", "search_knowledge_base")
+        tracker.end_tool("tool-1", is_error=True)
+        tracker.end_agent("response", cost_usd=0.02)
+        agent, tool = tracker.finish()
+        assert (agent.status, agent.cost_usd) == ("ok", 0.02)
+        assert (tool.agent, tool.status) == ("response", "error")
+
+    def test_percentiles(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile(values, 0.99) == 99.0
+        assert summarize_durations([]) == {
+            "count": 0,
+            "p50_ms": 0.0,
+            "p95_ms": 0.0,
+            "p99_ms": 0.0,
+            "max_ms": 0.0,
+        }
+
+
+class TestLatencyStats:
+    def test_groups_by_agent_and_tool(self, tmp_path):
+        store = DashboardStore(tmp_path / "dashboard.db")
+        store.save_spans(
+            [_span("agent", "triage", ms, model="haiku") for ms in (1000, 2000, 3000)]
+            + [_span("tool", "get_ticket", 50, service="chatwoot", status="error")]
+            + [_span("tool", "get_ticket", 150, service="chatwoot")]
+            + [_span("tool", "get_ticket", 9999, service="chatwoot", status="incomplete")]
+            + [_span("agent", "response", 500, started_at=1.0)]
+        )
+        stats = store.get_latency_stats(since=50.0)
+
+        assert set(stats["agents"]) == {"triage"}
+        assert stats["agents"]["triage"]["p50_ms"] == pytest.approx(2000, abs=0.5)
+        assert stats["models"]["triage:haiku"]["count"] == 3
+        tool = stats["tools"]["chatwoot.get_ticket"]
+        assert tool["count"] == 2
+        assert tool["errors"] == 1
+        assert tool["max_ms"] == pytest.approx(150, abs=0.5)
+        assert len(store.get_ticket_spans("1")) == 7
+        store.close()
+
+
+class TestOrchestratorSpans:
+    async def test_spans_from_message_stream(self, monkeypatch):
+        bus = FakeBus()
+
+        async def fake_query(prompt, options):
+            yield AssistantMessage(
+                content=[ToolUseBlock(id="task-1", name="Task", input={"subagent_type": "triage"})],
+                model="sonnet",
+            )
+            yield AssistantMessage(
+                content=[ToolUseBlock(id="tool-1", name="mcp__chatwoot__get_ticket", input={})],
+                model="sonnet",
+                parent_tool_use_id="task-1",
+            )
+            yield UserMessage(
+                content=[ToolResultBlock(tool_use_id="tool-1", content="{}")],
+                parent_tool_use_id="task-1",
+            )
+            yield UserMessage(
+                content=[
+                    ToolResultBlock(
+                        tool_use_id="task-1",
+                        content='{"decision": "escalate", "category": "billing"}',
+                    )
+                ]
+            )
+            yield ResultMessage(
+                subtype="success",
+                duration_ms=10,
+                duration_api_ms=10,
+                is_error=False,
+                num_turns=3,
+                session_id="s",
+            )
+
+        monkeypatch.setattr(orchestrator_module, "query", fake_query)
+        monkeypatch.setattr(orchestrator_module, "get_event_bus", lambda: bus)
+        orchestrator = SentinelCXOrchestrator(Settings(_env_file=None))
+        tracker = SpanTracker("1")
+        triage_data: dict = {}
+        await orchestrator._run_llm_orchestrator("go", {}, {}, "1", triage_data, tracker)
+
+        spans = {s.tool_use_id: s for s in tracker.finish()}
+        assert spans["task-1"].kind == "agent" and spans["task-1"].status == "ok"
+        assert spans["tool-1"].agent == "triage" and spans["tool-1"].status == "ok"
+        assert triage_data["decision"] == "escalate"
+        assert [e.type.value for e in bus.events].count("tool_result") == 2
@@ -0,0 +1,123 @@
+"""Tests for tool-call telemetry from the MCP servers to the API."""
+
+import asyncio
+import socket
+
+import pytest
+
+from sentinelcx.dashboard import telemetry
+from sentinelcx.dashboard.event_bus import EventType
+from sentinelcx.mcp_servers import event_emitter, tag_conversation
+from sentinelcx.mcp_servers.event_emitter import (
+    CONVERSATION_ENV,
+    CONVERSATION_HEADER,
+    RUN_ENV,
+    RUN_HEADER,
+    TelemetrySender,
+    emit_tool_call_events,
+)
+
+
+class FakeBus:
+    def __init__(self) -> None:
+        self.events = []
+
+    async def publish(self, event) -> None:
+        self.events.append(event)
+
+
+async def _wait_for(events: list, count: int) -> None:
+    for _ in range(100):
+        if len(events) >= count:
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_tool_calls_reach_the_event_bus(tmp_path, monkeypatch):
+    bus = FakeBus()
+    monkeypatch.setattr(telemetry, "get_event_bus", lambda: bus)
+    listener = telemetry.TelemetryListener(str(tmp_path / "mcp.sock"))
+    await listener.start()
+    monkeypatch.setattr(event_emitter, "_sender", TelemetrySender(str(tmp_path / "mcp.sock")))
+
+    @emit_tool_call_events("chatwoot")
+    async def get_ticket(conversation_id: int) -> dict:
+        return {"id": conversation_id}
+
+    @emit_tool_call_events("salesforce")
+    def get_account_health(account_id: str) -> dict:
+        raise RuntimeError("Salesforce is down")
+
+    try:
+        await get_ticket(conversation_id=42)
+        monkeypatch.setenv(CONVERSATION_ENV, "77")
+        with pytest.raises(RuntimeError):
+            get_account_health(account_id="001A")
+        await _wait_for(bus.events, 2)
+    finally:
+        await listener.stop()
+
+    first, second = bus.events
+    assert first.type == EventType.TOOL_CALL
+    assert (first.conversation_id, first.data["tool"], first.data["error"]) == (
+        "42",
+        "get_ticket",
+        None,
+    )
+    assert first.data["duration_ms"] >= 0
+    assert second.conversation_id == "77"
+    assert second.data["service"] == "salesforce"
+    assert "Salesforce is down" in second.data["error"]
+    assert not (tmp_path / "mcp.sock").exists()
+
+
+async def test_second_listener_leaves_live_socket_alone(tmp_path):
+    path = str(tmp_path / "mcp.sock")
+    first = telemetry.TelemetryListener(path)
+    second = telemetry.TelemetryListener(path)
+    await first.start()
+    try:
+        await second.start()
+        assert first.running and not second.running
+        await second.stop()
+        assert telemetry._is_listening(tmp_path / "mcp.sock")
+    finally:
+        await first.stop()
+
+
+async def test_stale_socket_is_replaced(tmp_path):
+    path = tmp_path / "mcp.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    stale.bind(str(path))
+    stale.close()
+    assert path.exists()
+
+    listener = telemetry.TelemetryListener(str(path))
+    await listener.start()
+    try:
+        assert listener.running
+    finally:
+        await listener.stop()
+
+
+def test_sending_without_listener_is_dropped(tmp_path):
+    sender = TelemetrySender(str(tmp_path / "missing.sock"))
+    sender.send({"service": "slack", "tool": "post_message"})
+    assert sender.dropped == 1
+
+
+def test_tag_conversation():
+    configs = {
+        "chatwoot": {"command": "python", "args": ["-m", "chatwoot"]},
+        "knowledge": {"type": "http", "url": "http://127.0.0.1:8712/mcp"},
+        "slack": {"type": "sdk", "name": "slack", "instance": object()},
+    }
+    tagged = tag_conversation(configs, "42")
+    assert tagged["chatwoot"]["env"] == {CONVERSATION_ENV: "42"}
+    assert tagged["knowledge"]["headers"] == {CONVERSATION_HEADER: "42"}
+    assert tagged["slack"] is configs["slack"]
+    assert "env" not in configs["chatwoot"]
+
+    tagged = tag_conversation(configs, "42", run_id="r1")
+    assert tagged["chatwoot"]["env"] == {CONVERSATION_ENV: "42", RUN_ENV: "r1"}
+    assert tagged["knowledge"]["headers"] == {CONVERSATION_HEADER: "42", RUN_HEADER: "r1"}
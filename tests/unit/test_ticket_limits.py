@@ -0,0 +1,157 @@
+"""Tests for per-ticket deadlines, cost budgets and turn budgets."""
+
+import asyncio
+
+import pytest
+from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock
+
+from sentinelcx import orchestrator as orchestrator_module
+from sentinelcx.agents.definitions import ALL_AGENTS
+from sentinelcx.config import OrchestratorSettings, Settings
+from sentinelcx.dashboard.event_bus import DashboardEvent, EventBus, EventType
+from sentinelcx.dashboard.store import DashboardStore
+from sentinelcx.orchestrator import PipelineExecutor, SentinelCXOrchestrator, TicketLimitError
+
+TRIAGE_JSON = (
+    '{"decision": "auto_handle", "category": "billing", "priority": "low", "confidence": 0.9}'
+)
+
+
+class FakeStore:
+    def save_spans(self, spans):
+        pass
+
+
+class FakeBus:
+    def __init__(self):
+        self.events = []
+        self.store = FakeStore()
+
+    async def publish(self, event):
+        self.events.append(event)
+
+
+def _result(text: str, subtype: str = "success", turns: int = 2, cost: float = 0.01):
+    return ResultMessage(
+        subtype=subtype,
+        duration_ms=100,
+        duration_api_ms=90,
+        is_error=subtype != "success",
+        num_turns=turns,
+        session_id="s",
+        total_cost_usd=cost,
+        result=text,
+    )
+
+
+def _orchestrator(**overrides) -> SentinelCXOrchestrator:
+    cfg = OrchestratorSettings(_env_file=None, prefetch_context=False, **overrides)
+    return SentinelCXOrchestrator(Settings(_env_file=None, orchestrator=cfg))
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    fake = FakeBus()
+    monkeypatch.setattr(orchestrator_module, "get_event_bus", lambda: fake)
+    return fake
+
+
+class TestDeadline:
+    async def test_cancels_run_and_closes_stream(self, bus, monkeypatch):
+        closed = asyncio.Event()
+
+        async def fake_query(prompt, options):
+            try:
+                yield AssistantMessage(content=[TextBlock(text="thinking")], model="sonnet")
+                await asyncio.sleep(60)
+            finally:
+                closed.set()
+
+        monkeypatch.setattr(orchestrator_module, "query", fake_query)
+        result = await _orchestrator(ticket_deadline=0.1).process_ticket("7")
+
+        assert closed.is_set()
+        assert result["success"] is False
+        assert result["limit_reason"] == "deadline"
+        errors = [e for e in bus.events if e.type == EventType.TICKET_ERROR]
+        assert [e.data["reason"] for e in errors] == ["deadline"]
+        complete = bus.events[-1]
+        assert complete.type == EventType.TICKET_COMPLETE
+        assert complete.data["limit_reason"] == "deadline"
+
+
+class TestBudgets:
+    async def test_llm_turn_limit_result(self, bus, monkeypatch):
+        async def fake_query(prompt, options):
+            assert options.max_turns == 25
+            assert options.max_budget_usd == 2.0
+            yield _result("stopped", subtype="error_max_turns", turns=25, cost=0.4)
+
+        monkeypatch.setattr(orchestrator_module, "query", fake_query)
+        result = await _orchestrator().process_ticket("7")
+
+        assert result["limit_reason"] == "turn_budget"
+        assert (result["turns"], result["cost_usd"]) == (25, 0.4)
+        errors = [e for e in bus.events if e.type == EventType.TICKET_ERROR]
+        assert errors[0].data["reason"] == "turn_budget"
+
+    async def test_pipeline_turn_budget_by_decision(self, bus, monkeypatch):
+        seen_max_turns: dict[str, int] = {}
+
+        async def fake_query(prompt, options):
+            name = "triage" if prompt.startswith("Triage") else "response"
+            seen_max_turns[name] = options.max_turns
+            if name == "triage":
+                yield _result(TRIAGE_JSON, turns=3)
+            else:
+                yield _result("partial", subtype="error_max_turns", turns=options.max_turns)
+
+        monkeypatch.setattr(orchestrator_module, "query", fake_query)
+        orchestrator = _orchestrator(pipeline_stage_max_turns=15, turn_budget_auto_handle=8)
+        executor = PipelineExecutor(orchestrator, {}, ALL_AGENTS)
+
+        with pytest.raises(TicketLimitError) as excinfo:
+            await executor.run("7", {})
+        assert seen_max_turns == {"triage": 15, "response": 8}
+        assert excinfo.value.reason == "turn_budget"
+        assert excinfo.value.result["turns"] == 11
+
+    async def test_pipeline_stops_when_cost_budget_spent(self, bus, monkeypatch):
+        stages: list[str] = []
+
+        async def fake_query(prompt, options):
+            stages.append(prompt)
+            assert options.max_budget_usd == pytest.approx(0.05)
+            yield _result(TRIAGE_JSON, cost=0.06)
+
+        monkeypatch.setattr(orchestrator_module, "query", fake_query)
+        executor = PipelineExecutor(_orchestrator(max_cost_usd=0.05), {}, ALL_AGENTS)
+
+        with pytest.raises(TicketLimitError) as excinfo:
+            await executor.run("7", {})
+        assert len(stages) == 1
+        assert excinfo.value.reason == "cost_budget"
+        assert excinfo.value.result["cost_usd"] == pytest.approx(0.06)
+
+
+class TestLimitMetrics:
+    async def test_counted_live_and_rehydrated(self, tmp_path, monkeypatch):
+        db = tmp_path / "dashboard.db"
+        monkeypatch.setattr(
+            "sentinelcx.dashboard.event_bus.DashboardStore", lambda: DashboardStore(db)
+        )
+        bus = EventBus()
+        for cid, reason in (("1", "deadline"), ("2", "cost_budget"), ("3", None)):
+            await bus.publish(
+                DashboardEvent(
+                    type=EventType.TICKET_COMPLETE,
+                    conversation_id=cid,
+                    data={"limit_reason": reason},
+                )
+            )
+        assert bus.metrics.timeout_count == 1
+        assert bus.metrics.limit_counts == {"deadline": 1, "cost_budget": 1}
+
+        stored = DashboardStore(db).get_metrics()
+        assert stored["timeout_count"] == 1
+        assert stored["limit_counts"] == {"deadline": 1, "cost_budget": 1}
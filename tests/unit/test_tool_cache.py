@@ -0,0 +1,118 @@
+"""Tests for per-ticket memoization of MCP tool results."""
+
+import pytest
+from fastmcp import Client
+
+from sentinelcx.mcp_servers import chatwoot_server
+from sentinelcx.mcp_servers.event_emitter import RUN_ENV, current_run_id
+from sentinelcx.mcp_servers.tool_cache import ToolResultCache
+
+
+class FakeChatwootClient:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.status = "open"
+        self.messages = [{"id": 1, "content": "My invoice is wrong"}]
+
+    async def get_conversation(self, conversation_id: int) -> dict:
+        self.calls.append("get_conversation")
+        return {"id": conversation_id, "status": self.status}
+
+    async def get_messages(self, conversation_id: int) -> list[dict]:
+        self.calls.append("get_messages")
+        return list(self.messages)
+
+    async def toggle_status(self, conversation_id: int, status: str) -> dict:
+        self.status = status
+        return {"payload": {"current_status": status}}
+
+
+@pytest.fixture
+def chatwoot(monkeypatch):
+    monkeypatch.setenv(RUN_ENV, "run-1")
+    fake = FakeChatwootClient()
+    monkeypatch.setattr(chatwoot_server, "_client", fake)
+    chatwoot_server._cache.configure(ttl=30.0, max_entries=100)
+    return fake
+
+
+async def test_repeat_calls_hit_cache_until_written(chatwoot):
+    async with Client(chatwoot_server.chatwoot_mcp) as client:
+        for _ in range(3):
+            result = await client.call_tool("get_ticket", {"conversation_id": 7})
+            assert result.data["status"] == "open"
+        await client.call_tool("get_ticket", {"conversation_id": 8})
+        assert len(chatwoot.calls) == 2
+
+        await client.call_tool("update_ticket_status", {"conversation_id": 7, "status": "resolved"})
+        result = await client.call_tool("get_ticket", {"conversation_id": 7})
+        assert result.data["status"] == "resolved"
+        assert len(chatwoot.calls) == 3
+
+        stats = (await client.call_tool("cache_stats", {})).data
+    assert stats["tools"]["get_ticket"] == {"hits": 2, "misses": 3, "hit_rate": 0.4}
+    assert stats["invalidations"] == 1
+
+
+async def test_rerun_of_a_conversation_sees_new_messages(chatwoot, monkeypatch):
+    monkeypatch.delenv(RUN_ENV)
+
+    async def history(run_id: str) -> list[dict]:
+        token = current_run_id.set(run_id)
+        try:
+            async with Client(chatwoot_server.chatwoot_mcp) as client:
+                await client.call_tool("get_conversation_history", {"conversation_id": 7})
+                result = await client.call_tool("get_conversation_history", {"conversation_id": 7})
+                return result.structured_content["result"]
+        finally:
+            current_run_id.reset(token)
+
+    assert len(await history("first-run")) == 1
+    chatwoot.messages.append({"id": 2, "content": "Any update?"})
+    # Coalesced re-run on the same long-lived server, well within the TTL
+    assert [m["id"] for m in await history("second-run")] == [1, 2]
+    assert chatwoot.calls == ["get_messages", "get_messages"]
+
+
+def test_calls_outside_a_run_are_not_cached(monkeypatch):
+    monkeypatch.delenv(RUN_ENV, raising=False)
+    cache = ToolResultCache("test", ttl=30.0, max_entries=10)
+    calls = []
+
+    @cache.cached
+    def lookup(account_id: str) -> dict:
+        calls.append(account_id)
+        return {"id": account_id}
+
+    lookup(account_id="a")
+    lookup(account_id="a")
+    assert calls == ["a", "a"]
+    assert cache.stats()["unscoped"] == 2
+
+
+def test_ttl_expiry_and_eviction(monkeypatch):
+    monkeypatch.setenv(RUN_ENV, "run-1")
+    now = [100.0]
+    monkeypatch.setattr("sentinelcx.mcp_servers.tool_cache.time.monotonic", lambda: now[0])
+    cache = ToolResultCache("test", ttl=5.0, max_entries=2)
+    calls = []
+
+    @cache.cached
+    def lookup(account_id: str) -> dict:
+        calls.append(account_id)
+        return {"id": account_id}
+
+    lookup(account_id="a")
+    lookup(account_id="a")
+    now[0] += 6
+    lookup(account_id="a")
+    assert calls == ["a", "a"]
+
+    lookup(account_id="b")
+    lookup(account_id="c")
+    lookup(account_id="a")
+    assert calls == ["a", "a", "b", "c", "a"]
+
+    cache.configure(ttl=0, max_entries=2)
+    lookup(account_id="a")
+    assert calls[-1] == "a" and len(calls) == 6